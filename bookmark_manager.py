@@ -23,15 +23,8 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException, NoSuchElementException
 from webdriver_manager.chrome import ChromeDriverManager
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
-    handlers=[
-        logging.FileHandler('arbitrage_bot.log'),
-        logging.StreamHandler()
-    ]
-)
+from logging_setup import setup_logging
+
 logger = logging.getLogger(__name__)
 
 class BookmarkManager:
@@ -71,27 +64,13 @@ class BookmarkManager:
             bool: Success status.
         """
         try:
-            # Extract auction ID from URL
-            url = auction_data.get('url', '')
-            auction_id = self._extract_auction_id(url)
-            
+            auction_id = self._add_auction(auction_data)
             if not auction_id:
-                logger.warning("Could not extract auction ID from URL: %s", url)
                 return False
             
-            # Add timestamp and ID
-            auction_data['bookmark_timestamp'] = datetime.now().isoformat()
-            auction_data['auction_id'] = auction_id
-            
-            # Save to bookmarks
-            self.bookmarks[auction_id] = auction_data
-            
             # Save to file
             self._save_bookmarks()
             
-            # Save individual auction file
-            self._save_individual_auction(auction_id, auction_data)
-            
             logger.info("Saved auction to bookmarks: %s", auction_id)
             return True
             
@@ -99,6 +78,58 @@ class BookmarkManager:
             logger.error("Error saving auction: %s", str(e), exc_info=True)
             return False
     
+    def save_auctions(self, auctions: List[Dict[str, Any]]) -> int:
+        """
+        Save several auctions to the bookmarks, rewriting the bookmarks file once.
+        
+        Args:
+            auctions (List[Dict[str, Any]]): Auction data to save.
+        
+        Returns:
+            int: Number of auctions saved.
+        """
+        try:
+            saved = sum(1 for auction_data in auctions if self._add_auction(auction_data))
+            if saved:
+                self._save_bookmarks()
+            
+            logger.info("Saved %d auctions to bookmarks", saved)
+            return saved
+            
+        except Exception as e:
+            logger.error("Error saving auctions: %s", str(e), exc_info=True)
+            return 0
+    
+    def _add_auction(self, auction_data: Dict[str, Any]) -> Optional[str]:
+        """
+        Add an auction to the in-memory bookmarks and write its individual file.
+        
+        Args:
+            auction_data (Dict[str, Any]): Auction data to save.
+        
+        Returns:
+            Optional[str]: Auction ID, or None if the URL has no auction ID.
+        """
+        # Extract auction ID from URL
+        url = auction_data.get('url', '')
+        auction_id = self._extract_auction_id(url)
+        
+        if not auction_id:
+            logger.warning("Could not extract auction ID from URL: %s", url)
+            return None
+        
+        # Add timestamp and ID
+        auction_data['bookmark_timestamp'] = datetime.now().isoformat()
+        auction_data['auction_id'] = auction_id
+        
+        # Save to bookmarks
+        self.bookmarks[auction_id] = auction_data
+        
+        # Save individual auction file
+        self._save_individual_auction(auction_id, auction_data)
+        
+        return auction_id
+    
     def get_watchlist(self) -> List[Dict[str, Any]]:
         """
         Get the current watchlist.
@@ -433,6 +464,8 @@ class BookmarkManager:
 
 # Example usage
 if __name__ == "__main__":
+    setup_logging()
+    
     # Initialize BookmarkManager
     bookmark_manager = BookmarkManager()
     
@@ -8,19 +8,21 @@ from selenium.common.exceptions import TimeoutException, WebDriverException, NoS
 from selenium.webdriver.remote.webelement import WebElement
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium_stealth import stealth
-import pandas as pd
 import time
 import json
 import os
+import hashlib
+import signal
+import threading
 from datetime import datetime
 import logging
 from urllib.parse import urljoin, quote
 from search_terms import SEARCH_TERMS
 import csv
-import traceback
-from typing import Dict, List, Optional, Any, Tuple
-from scraper_utils import RequestHandler, CardInfoExtractor, PriceAnalyzer, ConditionAnalyzer
+from typing import Dict, List, Optional, Any, Tuple, ClassVar
+from scraper_utils import RequestHandler, CardInfoExtractor, PriceAnalyzer, ConditionAnalyzer, RateLimiter
 from dotenv import load_dotenv
+from bs4 import BeautifulSoup, Tag
 import re
 import socket
 import requests.exceptions
@@ -35,11 +37,12 @@ from dataclasses import asdict
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 # Set up logging with more detailed format
+# Defaults to INFO; set LOGLEVEL=DEBUG in the environment for verbose output
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=os.getenv('LOGLEVEL', 'INFO').upper(),
     format='%(asctime)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
     handlers=[
-        logging.FileHandler('scraper.log'),
+        logging.FileHandler('scraper.log', delay=True),
         logging.StreamHandler()
     ]
 )
@@ -53,7 +56,382 @@ if not api_key:
     import sys
     sys.exit(1)
 
+# Maintenance banners, split by language so ASCII-only pages can skip the Japanese scan
+JP_MAINT_INDICATORS = (
+    'ただいまメンテナンス作業を実施しております',
+    'システムメンテナンス中',
+    '現在メンテナンス中です',
+    'メンテナンス作業のため',
+    'メンテナンスのため',
+    'メンテナンスにより',
+    'メンテナンスの影響で',
+    'メンテナンスの関係で',
+    'メンテナンスの都合上',
+    'メンテナンスの都合により',
+    'メンテナンスの都合で',
+)
+EN_MAINT_INDICATORS = (
+    'site is currently under maintenance',
+    'undergoing maintenance',
+    'system maintenance',
+    'maintenance in progress',
+    'temporarily unavailable due to maintenance',
+)
+
+# No-results messages used by analyze_page_content
+JP_NO_RESULTS_INDICATORS = (
+    '検索結果がありません',
+    '検索結果はありませんでした',
+    '該当する商品が見つかりませんでした',
+    '商品が見つかりませんでした',
+    '検索条件に一致する商品はありませんでした',
+)
+EN_NO_RESULTS_INDICATORS = (
+    'no results',
+    'no items found',
+)
+
+CAPTCHA_INDICATORS = ('captcha', 'recaptcha', 'robot', 'verify')
+
+PAGE_ERROR_INDICATORS = (
+    'error', '申し訳ございません', 'エラー', '問題が発生しました',
+    'system error', 'error occurred', '申し訳ありませんが',
+    'アクセスできません', 'アクセス制限', 'too many requests',
+    'rate limit', 'not available in your region', '地域制限',
+)
+
+# No-results selectors observed on Buyee search pages
+NO_RESULTS_SELECTORS = (
+    "div.bidNotfound_middle",  # From the Pokemon Card Starter example
+    "div.noResults",
+    "div.searchResult__noResults",
+    "div.searchResult__empty",
+    "div.searchResult__message",
+    "div.messageBox--noResults",
+    "div.searchResult__noItems",
+    "div.searchResult__emptyMessage",
+    "div.searchResult__noData",
+    "div.searchResult__noDataMessage",
+)
+
+# Common no results text in Japanese and English
+NO_RESULTS_TEXTS = (
+    # English messages
+    "No Results Found",
+    "Could not find any results for",
+    # Japanese messages
+    "該当する商品が見つかりませんでした",
+    "検索結果はありませんでした",
+    "商品が見つかりませんでした",
+    "検索条件に一致する商品はありませんでした",
+    "該当する商品はありませんでした",
+    "検索結果がありません",
+    "商品が見つかりません",
+    "該当する商品はありません",
+    "検索条件に一致する商品はありません",
+)
+
+# Yahoo auction ID at the end of a Buyee item URL, e.g. /item/jdirectitems/auction/x123456789
+YAHOO_ID_RE = re.compile(r'/([a-z]\d+)(?:\?|$)')
+YAHOO_URL_FMT = "https://page.auctions.yahoo.co.jp/jp/auction/{}"
+
+# Error indicators for item detail pages, keyed by error type
+DETAIL_ERROR_INDICATORS = {
+    'captcha': ['captcha', 'recaptcha', 'robot', 'verify'],
+    'maintenance': ['maintenance', 'メンテナンス', 'system maintenance'],
+    'not_found': ['not found', '404', 'page not found', 'ページが見つかりません'],
+    'access_denied': ['access denied', '403', 'forbidden', 'アクセスできません'],
+    'rate_limit': ['too many requests', 'rate limit', 'アクセス制限'],
+    'region_block': ['not available in your region', '地域制限'],
+    'error': ['error', 'エラー', '問題が発生しました', 'system error']
+}
+
+# All categories in one alternation, one named group per error type, so a page is scanned once.
+# The lookahead consumes nothing, so overlapping indicators are all seen, like the per-phrase
+# checks; at a shared start position the higher-priority category (listed first) wins.
+DETAIL_ERROR_RE = re.compile('(?=' + '|'.join(
+    f"(?P<{error_type}>" + '|'.join(re.escape(indicator.lower()) for indicator in indicators) + ")"
+    for error_type, indicators in DETAIL_ERROR_INDICATORS.items()
+) + ')')
+
+def _detect_detail_error(*texts: str) -> Optional[str]:
+    """Return the highest-priority error type found in the lowercased texts, or None."""
+    highest = next(iter(DETAIL_ERROR_INDICATORS))
+    found = set()
+    for text in texts:
+        for match in DETAIL_ERROR_RE.finditer(text):
+            found.add(match.lastgroup)
+            if match.lastgroup == highest:
+                return highest
+    # DETAIL_ERROR_INDICATORS is ordered by priority
+    return next((error_type for error_type in DETAIL_ERROR_INDICATORS if error_type in found), None)
+
+# Requests blocked through CDP while scraping. Image URLs stay readable from src/data-src;
+# stylesheets are left alone because visibility and clickability checks depend on layout.
+BLOCKED_URL_PATTERNS = (
+    '*.jpg', '*.jpeg', '*.png', '*.gif', '*.webp', '*.svg',
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+)
+
+# Poll interval for wait_for_element; elements usually appear well inside Selenium's default 0.5s
+ELEMENT_POLL_INTERVAL = 0.05
+
+# First number in a price string, with thousands separators and optional decimals
+PRICE_NUMBER_RE = re.compile(r'\d[\d,，]*(?:\.\d+)?')
+
+# json.dump emits many small chunks; a large buffer turns them into a few big writes
+RESULTS_WRITE_BUFFER = 1 << 20
+
+# Patterns used by parse_card_details_from_buyee
+RANK_RE = re.compile(r'【ランク】\s*([A-Z]+)')
+SET_CODE_RE = re.compile(r'([A-Z]{2,4})-([A-Z]{2})(\d{3})')
+CONDITION_TEXT_RE = re.compile(r'【商品の状態】\s*(.*?)(?=\n|$)')
+
+# Title keywords for parse_card_details_from_buyee, checked in order; all lowercase
+RARITY_KEYWORDS = {
+    'Secret Rare': ('secret rare', 'シークレットレア', 'sr'),
+    'Ultimate Rare': ('ultimate rare', 'アルティメットレア', 'ur'),
+    'Ghost Rare': ('ghost rare', 'ゴーストレア', 'gr'),
+    'Collector\'s Rare': ('collector\'s rare', 'コレクターズレア', 'cr'),
+    'Starlight Rare': ('starlight rare', 'スターライトレア', 'str'),
+    'Quarter Century Secret Rare': ('quarter century secret rare', 'クォーターセンチュリーシークレットレア', 'qcsr'),
+    'Prismatic Secret Rare': ('prismatic secret rare', 'プリズマティックシークレットレア', 'psr'),
+    'Platinum Secret Rare': ('platinum secret rare', 'プラチナシークレットレア', 'plsr'),
+    'Gold Secret Rare': ('gold secret rare', 'ゴールドシークレットレア', 'gsr'),
+    'Ultra Rare': ('ultra rare', 'ウルトラレア', 'ur'),
+    'Super Rare': ('super rare', 'スーパーレア', 'sr'),
+    'Rare': ('rare', 'レア', 'r'),
+    'Common': ('common', 'ノーマル', 'n')
+}
+
+EDITION_KEYWORDS = {
+    '1st Edition': ('1st', 'first edition', '初版', '初刷'),
+    'Unlimited': ('unlimited', '無制限', '再版', '再刷')
+}
+
+REGION_KEYWORDS = {
+    'Asia': ('asia', 'asian', 'アジア', 'アジア版'),
+    'English': ('english', '英', '英語版'),
+    'Japanese': ('japanese', '日', '日本語版'),
+    'Korean': ('korean', '韓', '韓国版')
+}
+
+# Detail field for each keyword table, in the order they are parsed
+TITLE_KEYWORD_TABLES = (
+    ('rarity', RARITY_KEYWORDS),
+    ('edition', EDITION_KEYWORDS),
+    ('language', REGION_KEYWORDS),
+)
+
+def _build_title_keyword_matcher():
+    """Build one overlapping-match regex over every title keyword.
+
+    Keywords are listed in table priority order, so when several start at the same
+    position the alternation picks the highest-priority one. Returns the pattern and
+    a map of keyword -> (field, priority, value), keeping the first (best) entry for
+    keywords shared between values such as 'sr'.
+    """
+    lookup = {}
+    for field, table in TITLE_KEYWORD_TABLES:
+        for priority, (value, keywords) in enumerate(table.items()):
+            for keyword in keywords:
+                lookup.setdefault(keyword, (field, priority, value))
+    pattern = re.compile('(?=(' + '|'.join(re.escape(keyword) for keyword in lookup) + '))')
+    return pattern, lookup
+
+_TITLE_KEYWORD_RE, _TITLE_KEYWORD_LOOKUP = _build_title_keyword_matcher()
+
+def _match_title_keywords(title_lower: str) -> Dict[str, str]:
+    """Return the highest-priority value per field found in a lowercased title, in one regex pass."""
+    best = {}
+    for match in _TITLE_KEYWORD_RE.finditer(title_lower):
+        field, priority, value = _TITLE_KEYWORD_LOOKUP[match.group(1)]
+        if field not in best or priority < best[field][0]:
+            best[field] = (priority, value)
+    return {field: value for field, (priority, value) in best.items()}
+
+# Cookie accept buttons on item detail pages (CSS)
+DETAIL_COOKIE_SELECTORS = (
+    "div.cookiePolicyPopup__buttonWrapper button.accept_cookie",
+    "button#js-accept-cookies",
+    "button.accept-cookies",
+    "button[data-testid='cookie-accept']",
+)
+DETAIL_COOKIE_SELECTOR = ", ".join(DETAIL_COOKIE_SELECTORS)
+
+# Item description containers on detail pages (CSS), most specific first
+DESCRIPTION_SELECTORS = (
+    "section#auction_item_description",
+    "div.itemDescription",
+    "div#itemDetail_sec",
+    "div.item-description",
+    "div[data-testid='item-description']",
+    "div.description",
+    "div.item-details",
+)
+
+# Seller-stated condition on detail pages (XPath)
+CONDITION_SELECTORS = (
+    "//em[normalize-space(.)='Item Condition']/following-sibling::span[1]",
+    "//em[contains(text(), 'Condition')]/following-sibling::span[1]",
+    "//div[contains(@class, 'condition')]//span",
+    "//div[contains(@class, 'itemCondition')]//span",
+)
+
+# Link to the original Yahoo Auction listing (XPath)
+YAHOO_LINK_SELECTORS = (
+    "//a[contains(normalize-space(.), 'View on the original site')]",
+    "//a[contains(@href, 'page.auctions.yahoo.co.jp')]",
+    "//a[contains(@class, 'original-site-link')]",
+)
+YAHOO_LINK_XPATH = " | ".join(YAHOO_LINK_SELECTORS)
+
+# Main item image on detail pages (CSS)
+IMAGE_SELECTORS = (
+    "div.photo_gallery_main img",
+    "div.itemPhoto img",
+    "div[data-testid='item-image'] img",
+    "div.item-image img",
+)
+
+# Run by scrape_item_detail_page; arguments are YAHOO_LINK_SELECTORS (XPath), YAHOO_LINK_XPATH and
+# IMAGE_SELECTORS (CSS). Selectors are tried in priority order; the union query rules out a missing
+# link in a single document traversal before that.
+_DETAIL_EXTRAS_JS = """
+const [linkXPaths, linkUnion, imageSelectors] = arguments;
+const first = (xpath) => document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+let yahooLinkFound = false;
+let yahooLink = null;
+for (const xpath of (first(linkUnion) ? linkXPaths : [])) {
+    const el = first(xpath);
+    if (el) {
+        yahooLinkFound = true;
+        yahooLink = el.href || el.getAttribute('href');
+        break;
+    }
+}
+let mainImageUrl = null;
+for (const selector of imageSelectors) {
+    const img = document.querySelector(selector);
+    // Try data-src first, then src
+    const url = img && (img.getAttribute('data-src') || img.src);
+    if (url) {
+        mainImageUrl = url;
+        break;
+    }
+}
+return {yahooLinkFound: yahooLinkFound, yahooLink: yahooLink, mainImageUrl: mainImageUrl};
+"""
+
+# Shared in-browser probe of the elements check_page_state looks at
+_PROBE_PAGE_FN = """
+function probePage(noResultsSelectors) {
+    let noResultsSelector = null;
+    let noResultsMessage = null;
+    for (const selector of noResultsSelectors) {
+        const el = document.querySelector(selector);
+        if (el) {
+            noResultsSelector = selector;
+            noResultsMessage = el.innerText || '';
+            break;
+        }
+    }
+    return {
+        noResultsSelector: noResultsSelector,
+        noResultsMessage: noResultsMessage,
+        hasCookiePopup: !!document.querySelector('div.cookiePolicyPopup.expanded'),
+        hasContainer: !!document.querySelector('ul.auctionSearchResult.list_layout'),
+        itemCardCount: document.querySelectorAll('li.itemCard').length,
+        hasHeader: !!document.querySelector('header'),
+        hasFooter: !!document.querySelector('footer'),
+        hasSearchBox: !!document.querySelector("input[type='search']"),
+        hasCategoryMenu: !!document.querySelector('nav.categoryMenu')
+    };
+}
+"""
+
+# Run by BuyeeScraper._probe_page; arguments[0] is NO_RESULTS_SELECTORS
+_PAGE_PROBE_JS = _PROBE_PAGE_FN + "return probePage(arguments[0]);"
+
+# Run by BuyeeScraper._wait_for_container; arguments are NO_RESULTS_SELECTORS and a timeout in ms.
+# Resolves with the probe as soon as the container or a no-results element appears, or null on timeout.
+_CONTAINER_WAIT_JS = _PROBE_PAGE_FN + """
+const done = arguments[arguments.length - 1];
+const noResultsSelectors = arguments[0];
+let finished = false;
+const finish = (result) => {
+    finished = true;
+    observer.disconnect();
+    done(result);
+};
+const check = () => {
+    if (finished) return true;
+    const probe = probePage(noResultsSelectors);
+    if (probe.hasContainer || probe.noResultsSelector) {
+        finish(probe);
+        return true;
+    }
+    return false;
+};
+const observer = new MutationObserver(check);
+if (!check()) {
+    observer.observe(document.documentElement, {childList: true, subtree: true});
+    setTimeout(() => { if (!finished) finish(null); }, arguments[1]);
+}
+"""
+
+# Visible-text markers of pages that will never show item cards (no-results text, maintenance,
+# captcha, error); wait_for_page_ready stops waiting and classifies the page when one appears
+_PAGE_SETTLED_MARKERS = tuple(marker.lower() for marker in (
+    NO_RESULTS_TEXTS + JP_MAINT_INDICATORS + EN_MAINT_INDICATORS + CAPTCHA_INDICATORS + PAGE_ERROR_INDICATORS
+))
+
+# Run in the browser by BuyeeScraper._page_ready_condition; arguments[0] is NO_RESULTS_SELECTORS,
+# arguments[1] is _PAGE_SETTLED_MARKERS. Returns 'ready', 'no_results', 'settled' or false (still loading)
+_PAGE_READY_JS = """
+if (document.readyState !== 'complete') return false;
+if (document.querySelector('ul.auctionSearchResult.list_layout li.itemCard')) return 'ready';
+if (arguments[0].some(selector => document.querySelector(selector) !== null)) return 'no_results';
+const text = document.body ? document.body.innerText.toLowerCase() : '';
+return arguments[1].some(marker => text.includes(marker)) ? 'settled' : false;
+"""
+
+# One alternation so the page source is scanned once rather than once per text
+_NO_RESULTS_TEXT_RE = re.compile('|'.join(map(re.escape, NO_RESULTS_TEXTS)))
+
+def _encode_indicators(indicators: Tuple[str, ...]) -> Tuple[bytes, ...]:
+    """Lowercase and UTF-8 encode indicators for byte-level searching."""
+    return tuple(indicator.lower().encode('utf-8') for indicator in indicators)
+
+_JP_MAINT_BYTES = _encode_indicators(JP_MAINT_INDICATORS)
+_EN_MAINT_BYTES = _encode_indicators(EN_MAINT_INDICATORS)
+_JP_NO_RESULTS_BYTES = _encode_indicators(JP_NO_RESULTS_INDICATORS)
+_EN_NO_RESULTS_BYTES = _encode_indicators(EN_NO_RESULTS_INDICATORS)
+_CAPTCHA_BYTES = _encode_indicators(CAPTCHA_INDICATORS)
+_PAGE_ERROR_BYTES = _encode_indicators(PAGE_ERROR_INDICATORS)
+
+# Set to cut every scraper's maintenance wait short; waiters clear it once woken
+MAINTENANCE_WAKE_EVENT = threading.Event()
+
+def install_maintenance_wake_handler() -> None:
+    """
+    Make SIGUSR1 (kill -USR1 <pid>, where supported) wake all scrapers waiting out maintenance.
+    
+    Installs a process-wide signal handler, so it is called once from an entry point's main
+    thread rather than by each scraper.
+    """
+    if hasattr(signal, 'SIGUSR1'):
+        signal.signal(signal.SIGUSR1, lambda *_: MAINTENANCE_WAKE_EVENT.set())
+
 class BuyeeScraper:
+    # Helpers are stateless across searches, so every scraper instance shares one of each
+    _request_handler: ClassVar[Optional[RequestHandler]] = None
+    _card_analyzer: ClassVar[Optional[CardAnalyzer]] = None
+    _rank_analyzer: ClassVar[Optional[RankAnalyzer]] = None
+    # Scrapers can be created from several worker threads at once; the helpers are created once
+    _helpers_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self, output_dir: str = "scraped_results", max_pages: int = 5, headless: bool = True):
         """
         Initialize the BuyeeScraper with configuration options.
@@ -68,9 +446,16 @@ class BuyeeScraper:
         self.max_pages = max_pages
         self.headless = headless
         self.driver = None
-        self.request_handler = RequestHandler()
-        self.card_analyzer = CardAnalyzer()
-        self.rank_analyzer = RankAnalyzer()
+        with BuyeeScraper._helpers_lock:
+            if BuyeeScraper._request_handler is None:
+                BuyeeScraper._request_handler = RequestHandler()
+            if BuyeeScraper._card_analyzer is None:
+                BuyeeScraper._card_analyzer = CardAnalyzer()
+            if BuyeeScraper._rank_analyzer is None:
+                BuyeeScraper._rank_analyzer = RankAnalyzer()
+        self.request_handler = BuyeeScraper._request_handler
+        self.card_analyzer = BuyeeScraper._card_analyzer
+        self.rank_analyzer = BuyeeScraper._rank_analyzer
         
         # Load selectors from JSON file
         self.selectors = self._load_selectors()
@@ -85,6 +470,29 @@ class BuyeeScraper:
         self.element_wait_time = 20  # seconds
         self.page_load_timeout = 30  # seconds
         
+        # (url, page_source, fetched_at) for the current page; reset on navigation
+        self._page_cache = None
+        self._page_cache_lower = None
+        
+        # Set when a driver operation fails so is_driver_valid knows to probe
+        self._driver_suspect = False
+        
+        # WebDriverWait instances used by wait_for_element, keyed by timeout; tied to the current driver
+        self._waits = {}
+        
+        # Set once the cookie banner has been accepted in the current driver session
+        self._cookies_accepted = False
+        
+        # Minimum spacing between item detail page loads
+        self._detail_rate = RateLimiter(min_interval=3.0)
+        
+        # When the current maintenance window was first detected; drives the 2-hour bail-out and
+        # is cleared once a page loads normally again
+        self._maintenance_start = None
+        
+        # Shared event that cuts maintenance waits short (see install_maintenance_wake_handler)
+        self._wake_event = MAINTENANCE_WAKE_EVENT
+        
         # Create output directory
         os.makedirs(self.output_dir, exist_ok=True)
         os.makedirs(os.path.join(self.output_dir, 'debug'), exist_ok=True)
@@ -92,6 +500,17 @@ class BuyeeScraper:
         # Initialize driver
         if not self.setup_driver():
             raise Exception("Failed to initialize WebDriver")
+        self._block_heavy_resources()
+
+    def _block_heavy_resources(self) -> None:
+        """Stop Chrome from downloading images, fonts and trackers; only the DOM is scraped."""
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(BLOCKED_URL_PATTERNS)})
+            logger.info("Blocking image, font and analytics requests")
+        except Exception as e:
+            # Not fatal: non-Chrome drivers have no CDP, pages just load slower
+            logger.warning(f"Could not block heavy resources: {str(e)}")
 
     def _load_selectors(self) -> Dict[str, Any]:
         """Load CSS selectors from the JSON configuration file."""
@@ -102,6 +521,29 @@ class BuyeeScraper:
             logger.error(f"Failed to load selectors.json: {str(e)}")
             raise
 
+    def _navigate(self, url: str) -> None:
+        """Load a URL in the driver and drop the cached page source."""
+        self._page_cache = None
+        self._page_cache_lower = None
+        try:
+            self.driver.get(url)
+        except Exception:
+            # A dead chromedriver fails with urllib3/socket errors, not only WebDriverException
+            self._driver_suspect = True
+            raise
+
+    def _cached_source(self) -> str:
+        """Return the current page source, fetching it from the driver at most once per page."""
+        if self._page_cache is None:
+            self._page_cache = (self.driver.current_url, self.driver.page_source, time.monotonic())
+        return self._page_cache[1]
+
+    def _cached_source_lower(self) -> str:
+        """Return the lowercased page source, computed at most once per page."""
+        if self._page_cache_lower is None:
+            self._page_cache_lower = self._cached_source().lower()
+        return self._page_cache_lower
+
     def save_debug_info(self, identifier: str, error_type: str, page_source: str) -> None:
         """Save debug information about a failed request."""
         try:
@@ -135,6 +577,10 @@ class BuyeeScraper:
     )
     def handle_cookie_consent(self) -> bool:
         """Handle cookie consent popup with improved reliability."""
+        # Once accepted, the banner does not come back for the rest of the driver session
+        if self._cookies_accepted:
+            return True
+        
         try:
             # Wait for cookie banner to be present
             cookie_banner = self.wait_for_element(
@@ -170,6 +616,7 @@ class BuyeeScraper:
                     EC.presence_of_element_located((By.CSS_SELECTOR, self.selectors['popups']['cookie_banner']))
                 )
                 logger.info("Cookie consent handled successfully")
+                self._cookies_accepted = True
                 return True
             except TimeoutException:
                 logger.warning("Cookie banner did not disappear after clicking accept")
@@ -203,8 +650,16 @@ class BuyeeScraper:
                 )
                 return []
             
+            # Parse the rendered page once and extract cards locally instead of querying the driver per card.
+            # Refresh the cached source: it may have been taken before the results rendered.
+            self._page_cache = None
+            self._page_cache_lower = None
+            soup = BeautifulSoup(self._cached_source(), 'lxml')
+            page_url = self._page_cache[0]
+            
             # Get all item cards
-            item_cards = container.find_elements(By.CSS_SELECTOR, self.selectors['search_results']['item_card'])
+            search_results = self.selectors['search_results']
+            item_cards = soup.select(f"{search_results['container']} {search_results['item_card']}")
             
             if not item_cards:
                 logger.warning(f"No items found on page {page_number}")
@@ -213,16 +668,10 @@ class BuyeeScraper:
             items = []
             for index, card in enumerate(item_cards):
                 try:
-                    if not self.is_element_attached(card):
-                        continue
-                    
-                    item_info = self.extract_card_info(card, index)
+                    item_info = self.extract_card_info(card, index, page_url)
                     if item_info:
                         items.append(item_info)
                         
-                except StaleElementReferenceException:
-                    logger.warning(f"Stale element reference for item {index}")
-                    continue
                 except Exception as e:
                     logger.error(f"Error extracting info for item {index}: {str(e)}")
                     continue
@@ -238,71 +687,29 @@ class BuyeeScraper:
             )
             return []
 
-    def extract_card_info(self, card: WebElement, index: int) -> Optional[Dict[str, Any]]:
-        """Extract information from a card element with improved error handling."""
+    def extract_card_info(self, card: Tag, index: int, page_url: str) -> Optional[Dict[str, Any]]:
+        """Extract information from a parsed card element with improved error handling."""
         try:
-            # Extract title
-            title_elem = self.wait_for_element(
-                By.CSS_SELECTOR,
-                self.selectors['search_results']['title'],
-                timeout=5,
-                parent=card
-            )
-            title = title_elem.text if title_elem else "Unknown Title"
-            
-            # Extract price
-            price_elem = self.wait_for_element(
-                By.CSS_SELECTOR,
-                self.selectors['search_results']['price'],
-                timeout=5,
-                parent=card
-            )
-            price = self.clean_price(price_elem.text) if price_elem else 0.0
-            
-            # Extract image URL
-            img_elem = self.wait_for_element(
-                By.CSS_SELECTOR,
-                self.selectors['search_results']['image'],
-                timeout=5,
-                parent=card
-            )
-            image_url = img_elem.get_attribute('src') if img_elem else None
-            
-            # Extract link
-            link_elem = self.wait_for_element(
-                By.CSS_SELECTOR,
-                self.selectors['search_results']['link'],
-                timeout=5,
-                parent=card
-            )
-            url = link_elem.get_attribute('href') if link_elem else None
-            
-            # Extract time left
-            time_elem = self.wait_for_element(
-                By.CSS_SELECTOR,
-                self.selectors['search_results']['time_left'],
-                timeout=5,
-                parent=card
-            )
-            time_left = time_elem.text if time_elem else "Unknown"
-            
-            # Extract seller
-            seller_elem = self.wait_for_element(
-                By.CSS_SELECTOR,
-                self.selectors['search_results']['seller'],
-                timeout=5,
-                parent=card
-            )
-            seller = seller_elem.text if seller_elem else "Unknown"
-            
-            # Extract condition
-            condition_elem = self.wait_for_element(
-                By.CSS_SELECTOR,
-                self.selectors['search_results']['condition'],
-                timeout=5,
-                parent=card
-            )
-            condition = condition_elem.text if condition_elem else "Unknown"
+            search_results = self.selectors['search_results']
+            
+            def text(key: str) -> Optional[str]:
+                elem = card.select_one(search_results[key])
+                return elem.get_text(" ", strip=True) if elem else None
+            
+            def link(key: str, *attrs: str) -> Optional[str]:
+                elem = card.select_one(search_results[key])
+                value = next((elem.get(attr) for attr in attrs if elem.get(attr)), None) if elem else None
+                return urljoin(page_url, value) if value else None
+            
+            title = text('title') or "Unknown Title"
+            price_text = text('price')
+            price = self.clean_price(price_text) if price_text is not None else 0.0
+            # Lazy-loaded thumbnails keep the real URL in data-src until scrolled into view
+            image_url = link('image', 'data-src', 'data-original', 'src')
+            url = link('link', 'href')
+            time_left = text('time_left') or "Unknown"
+            seller = text('seller') or "Unknown"
+            condition = text('condition') or "Unknown"
             
             return {
                 'title': title,
@@ -331,7 +738,7 @@ class BuyeeScraper:
             search_url = f"{self.base_url}/item/search/query/{quote(search_term)}"
             
             # Navigate to search page
-            self.driver.get(search_url)
+            self._navigate(search_url)
             
             # Handle cookie consent
             if not self.handle_cookie_consent():
@@ -374,6 +781,8 @@ class BuyeeScraper:
             
         except Exception as e:
             logger.error(f"Error during search: {str(e)}")
+            # Have the next is_driver_valid call actually probe the driver
+            self._driver_suspect = True
             self.save_debug_info(
                 f"search_{search_term}_error",
                 "search_error",
@@ -407,7 +816,9 @@ class BuyeeScraper:
             
         except Exception as e:
             logger.error(f"Error sanitizing filename: {str(e)}")
-            return f"invalid_filename_{hash(filename)}"
+            # hash() is salted per process; blake2b keeps the fallback name stable across runs
+            digest = hashlib.blake2b(str(filename).encode('utf-8', 'replace'), digest_size=8).hexdigest()
+            return f"invalid_filename_{digest}"
 
     def test_connection(self):
         """Test basic connectivity to Buyee and perform network diagnostics."""
@@ -415,7 +826,7 @@ class BuyeeScraper:
             # First, test basic HTTPS connectivity with a simple site
             logger.info("Testing basic HTTPS connectivity with example.com")
             try:
-                self.driver.get("https://example.com")
+                self._navigate("https://example.com")
                 logger.info("Successfully connected to example.com")
             except Exception as e:
                 logger.error(f"Failed to connect to example.com: {str(e)}")
@@ -424,7 +835,7 @@ class BuyeeScraper:
             # Then test Google (another reliable HTTPS site)
             logger.info("Testing HTTPS connectivity with google.com")
             try:
-                self.driver.get("https://www.google.com")
+                self._navigate("https://www.google.com")
                 logger.info("Successfully connected to google.com")
             except Exception as e:
                 logger.error(f"Failed to connect to google.com: {str(e)}")
@@ -433,25 +844,25 @@ class BuyeeScraper:
             # Finally, test Buyee
             logger.info(f"Testing connection to {self.base_url}")
             try:
-                self.driver.get(self.base_url)
+                self._navigate(self.base_url)
                 time.sleep(2)  # Short wait to let any initial scripts run
                 
                 # Check for common issues
                 if "SSL" in self.driver.title or "Error" in self.driver.title:
                     logger.error(f"SSL or error page detected: {self.driver.title}")
-                    self.save_debug_info("connection_test", "ssl_error", self.driver.page_source)
+                    self.save_debug_info("connection_test", "ssl_error", self._cached_source())
                     return False
                 
                 # Check for CAPTCHA
-                if "captcha" in self.driver.page_source.lower():
+                if "captcha" in self._cached_source_lower():
                     logger.error("CAPTCHA detected")
-                    self.save_debug_info("connection_test", "captcha", self.driver.page_source)
+                    self.save_debug_info("connection_test", "captcha", self._cached_source())
                     return False
                 
                 # Check for successful page load
                 if not self.driver.title:
                     logger.error("Page title is empty, possible connection issue")
-                    self.save_debug_info("connection_test", "empty_title", self.driver.page_source)
+                    self.save_debug_info("connection_test", "empty_title", self._cached_source())
                     return False
                 
                 logger.info(f"Successfully connected to {self.base_url}")
@@ -469,10 +880,10 @@ class BuyeeScraper:
     def clean_price(self, price_text: str) -> float:
         """Clean and convert price text to float."""
         try:
-            # Remove currency symbols, commas, and convert to float
-            cleaned = re.sub(r'[^\d.]', '', price_text)
-            return float(cleaned)
-        except (ValueError, TypeError):
+            # Take the first number (currency symbols and trailing text such as shipping are ignored)
+            match = PRICE_NUMBER_RE.search(price_text)
+            return float(match.group(0).replace(',', '').replace('，', ''))
+        except (ValueError, TypeError, AttributeError):
             logger.warning(f"Could not parse price: {price_text}")
             return 0.0
 
@@ -481,9 +892,9 @@ class BuyeeScraper:
         Analyze the current page content and return detailed information about its state.
         """
         try:
-            page_source = self.driver.page_source
+            page_source = self._cached_source()
             title = self.driver.title
-            current_url = self.driver.current_url
+            current_url = self._page_cache[0]
             
             # Save detailed page analysis
             debug_dir = os.path.join(self.output_dir, "debug")
@@ -595,7 +1006,7 @@ class BuyeeScraper:
                             analysis["key_elements_found"].append(f"Found {len(item_cards)} item cards")
                             # Save the HTML of the first item for debugging
                             analysis["item_analysis"]["first_item_html"] = item_cards[0].get_attribute('outerHTML')
-                            logger.debug(f"First item HTML: {analysis['item_analysis']['first_item_html']}")
+                            logger.debug("First item HTML: %s", analysis['item_analysis']['first_item_html'])
                             
                     except TimeoutException:
                         logger.warning("Item container found but no items appeared within timeout")
@@ -630,37 +1041,29 @@ class BuyeeScraper:
                 analysis["content_analysis"]["has_breadcrumbs"] = len(breadcrumbs) > 0
                 
             except Exception as e:
-                logger.debug(f"Error checking page elements: {str(e)}")
+                logger.debug("Error checking page elements: %s", e)
+            
+            # Japanese indicators can only match if the page has non-ASCII text;
+            # str.isascii() is O(1) on CPython, so English/error pages skip them entirely
+            is_jp = not page_source.isascii()
+            
+            # Lowercase and encode once; indicators are pre-encoded at import time.
+            # Context is sliced from the lowered text too: lowercasing can change the
+            # length of some characters (e.g. the Kelvin sign, 'İ'), so match positions
+            # in src_lower don't always index the original source.
+            src_lower = page_source.lower().encode('utf-8')
             
             # Check for actual maintenance messages (more specific indicators)
-            maintenance_indicators = [
-                # Japanese maintenance messages
-                'ただいまメンテナンス作業を実施しております',
-                'システムメンテナンス中',
-                '現在メンテナンス中です',
-                'メンテナンス作業のため',
-                'メンテナンスのため',
-                'メンテナンスにより',
-                'メンテナンスの影響で',
-                'メンテナンスの関係で',
-                'メンテナンスの都合上',
-                'メンテナンスの都合により',
-                'メンテナンスの都合で',
-                # English maintenance messages
-                'site is currently under maintenance',
-                'undergoing maintenance',
-                'system maintenance',
-                'maintenance in progress',
-                'temporarily unavailable due to maintenance'
-            ]
+            maintenance_indicators = _EN_MAINT_BYTES + _JP_MAINT_BYTES if is_jp else _EN_MAINT_BYTES
             
             # Check for maintenance with context
             for indicator in maintenance_indicators:
-                if indicator in page_source.lower():
+                pos = src_lower.find(indicator)
+                if pos != -1:
                     # Get more context around the maintenance message
-                    start = max(0, page_source.lower().find(indicator) - 200)
-                    end = min(len(page_source), page_source.lower().find(indicator) + len(indicator) + 200)
-                    context = page_source[start:end]
+                    start = max(0, pos - 200)
+                    end = min(len(src_lower), pos + len(indicator) + 200)
+                    context = src_lower[start:end].decode('utf-8', errors='replace')
                     
                     # Only consider it maintenance if it's a prominent message
                     if any(phrase in context.lower() for phrase in ['maintenance', 'メンテナンス']):
@@ -670,36 +1073,26 @@ class BuyeeScraper:
                         break
             
             # Check for CAPTCHA
-            captcha_indicators = ['captcha', 'recaptcha', 'robot', 'verify', 'reCAPTCHA']
-            if any(indicator in page_source.lower() for indicator in captcha_indicators):
+            if any(indicator in src_lower for indicator in _CAPTCHA_BYTES):
                 analysis["has_captcha"] = True
                 analysis["key_elements_found"].append("CAPTCHA detected")
                 analysis["page_state"] = "captcha"
             
             # Check for no results
-            no_results_indicators = [
-                'no results', 'no items found', '検索結果がありません',
-                '検索結果はありませんでした', '該当する商品が見つかりませんでした',
-                '商品が見つかりませんでした', '検索条件に一致する商品はありませんでした'
-            ]
-            if any(indicator in page_source.lower() for indicator in no_results_indicators):
+            no_results_indicators = _EN_NO_RESULTS_BYTES + _JP_NO_RESULTS_BYTES if is_jp else _EN_NO_RESULTS_BYTES
+            if any(indicator in src_lower for indicator in no_results_indicators):
                 analysis["has_no_results"] = True
                 analysis["key_elements_found"].append("No results message found")
                 analysis["page_state"] = "no_results"
             
             # Check for error messages
-            error_indicators = [
-                'error', '申し訳ございません', 'エラー', '問題が発生しました',
-                'system error', 'error occurred', '申し訳ありませんが',
-                'アクセスできません', 'アクセス制限', 'too many requests',
-                'rate limit', 'not available in your region', '地域制限'
-            ]
-            for indicator in error_indicators:
-                if indicator in page_source.lower():
+            for indicator in _PAGE_ERROR_BYTES:
+                pos = src_lower.find(indicator)
+                if pos != -1:
                     analysis["has_error"] = True
-                    start = max(0, page_source.lower().find(indicator) - 200)
-                    end = min(len(page_source), page_source.lower().find(indicator) + len(indicator) + 200)
-                    analysis["error_context"] = page_source[start:end]
+                    start = max(0, pos - 200)
+                    end = min(len(src_lower), pos + len(indicator) + 200)
+                    analysis["error_context"] = src_lower[start:end].decode('utf-8', errors='replace')
                     analysis["page_state"] = "error"
                     break
             
@@ -739,14 +1132,38 @@ class BuyeeScraper:
                 "page_state": "error"
             }
 
+    def _probe_page(self) -> Dict[str, Any]:
+        """Collect the page elements check_page_state needs in a single script call."""
+        return self.driver.execute_script(_PAGE_PROBE_JS, list(NO_RESULTS_SELECTORS))
+
+    def _record_no_results_element(self, analysis: Dict[str, Any], probe: Dict[str, Any], where: str = "") -> bool:
+        """Record a no-results element found by a page probe in the analysis; return True if there was one."""
+        selector = probe['noResultsSelector']
+        if not selector:
+            return False
+        message = (probe['noResultsMessage'] or '').strip()
+        suffix = f" {where}" if where else ""
+        analysis['content_analysis']['has_no_results_message'] = True
+        analysis['content_analysis']['no_results_message'] = message
+        analysis['content_analysis']['no_results_indicators'].append(f"Found no results element{suffix}: {selector}")
+        logger.info(f"Found no results message{suffix}: {message}")
+        return True
+
+    def _wait_for_container(self, timeout: int) -> Dict[str, Any]:
+        """Wait in-browser for the item container or a no-results element; raise TimeoutException otherwise."""
+        probe = self.driver.execute_async_script(_CONTAINER_WAIT_JS, list(NO_RESULTS_SELECTORS), timeout * 1000)
+        if probe is None:
+            raise TimeoutException(f"Item container not found within {timeout} seconds")
+        return probe
+
     def check_page_state(self):
         """Check the current page state and return (state, is_error) tuple."""
         try:
             # Save current page state for debugging
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            page_source = self.driver.page_source
+            page_source = self._cached_source()
             page_title = self.driver.title
-            current_url = self.driver.current_url
+            current_url = self._page_cache[0]
             
             # Save full page source and screenshot
             debug_dir = os.path.join(self.output_dir, 'debug')
@@ -790,77 +1207,47 @@ class BuyeeScraper:
                     lambda driver: driver.execute_script('return document.readyState') == 'complete'
                 )
                 
-                # Check for cookie popup
-                try:
-                    cookie_popup = self.driver.find_element(By.CSS_SELECTOR, "div.cookiePolicyPopup.expanded")
-                    analysis['content_analysis']['has_cookie_popup'] = True
-                except NoSuchElementException:
-                    analysis['content_analysis']['has_cookie_popup'] = False
+                # Probe all page elements in one WebDriver round-trip
+                probe = self._probe_page()
                 
-                # Check for no results message first - using exact selectors from observed HTML
-                no_results_selectors = [
-                    "div.bidNotfound_middle",  # From the Pokemon Card Starter example
-                    "div.noResults",
-                    "div.searchResult__noResults",
-                    "div.searchResult__empty",
-                    "div.searchResult__message",
-                    "div.messageBox--noResults",
-                    "div.searchResult__noItems",
-                    "div.searchResult__emptyMessage",
-                    "div.searchResult__noData",
-                    "div.searchResult__noDataMessage"
-                ]
+                # Check for cookie popup
+                analysis['content_analysis']['has_cookie_popup'] = probe['hasCookiePopup']
                 
-                # Also check for common no results text in Japanese and English
-                no_results_texts = [
-                    # English messages
-                    "No Results Found",
-                    "Could not find any results for",
-                    # Japanese messages
-                    "該当する商品が見つかりませんでした",
-                    "検索結果はありませんでした",
-                    "商品が見つかりませんでした",
-                    "検索条件に一致する商品はありませんでした",
-                    "該当する商品はありませんでした",
-                    "検索結果がありません",
-                    "商品が見つかりません",
-                    "該当する商品はありません",
-                    "検索条件に一致する商品はありません"
-                ]
+                # Result pages with item cards are the common case; skip the no-results scans for them
+                if probe['hasContainer'] and probe['itemCardCount'] > 0:
+                    analysis['has_item_container'] = True
+                    analysis['has_item_cards'] = True
+                    analysis['page_state'] = 'ready'
+                    return 'ready', False
                 
                 # Check for no results message using selectors
-                for selector in no_results_selectors:
-                    try:
-                        no_results_element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        message = no_results_element.text.strip()
-                        analysis['content_analysis']['has_no_results_message'] = True
-                        analysis['content_analysis']['no_results_message'] = message
-                        analysis['content_analysis']['no_results_indicators'].append(f"Found no results element: {selector}")
-                        logger.info(f"Found no results message: {message}")
-                        return 'no_results', False
-                    except NoSuchElementException:
-                        continue
+                if self._record_no_results_element(analysis, probe):
+                    return 'no_results', False
                 
-                # Check for no results text in page source
-                for text in no_results_texts:
-                    if text in page_source:
-                        analysis['content_analysis']['has_no_results_message'] = True
-                        analysis['content_analysis']['no_results_message'] = text
-                        analysis['content_analysis']['no_results_indicators'].append(f"Found no results text: {text}")
-                        logger.info(f"Found no results text in page source: {text}")
-                        return 'no_results', False
+                # Check for no results text in page source (single pass over all texts)
+                match = _NO_RESULTS_TEXT_RE.search(page_source)
+                if match:
+                    text = match.group(0)
+                    analysis['content_analysis']['has_no_results_message'] = True
+                    analysis['content_analysis']['no_results_message'] = text
+                    analysis['content_analysis']['no_results_indicators'].append(f"Found no results text: {text}")
+                    logger.info(f"Found no results text in page source: {text}")
+                    return 'no_results', False
                 
                 # Try to find the item container with the correct selector
                 try:
-                    logger.info("Waiting for item container: ul.auctionSearchResult.list_layout")
-                    item_container = WebDriverWait(self.driver, 20).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "ul.auctionSearchResult.list_layout"))
-                    )
+                    # Only wait for the container if the probe did not already see it
+                    if not probe['hasContainer']:
+                        logger.info("Waiting for item container: ul.auctionSearchResult.list_layout")
+                        probe = self._wait_for_container(20)
+                        if not probe['hasContainer']:
+                            # A no-results message appeared instead of the container
+                            self._record_no_results_element(analysis, probe, "while waiting for container")
+                            return 'no_results', False
                     analysis['has_item_container'] = True
                     
                     # Check for item cards
-                    item_cards = self.driver.find_elements(By.CSS_SELECTOR, "li.itemCard")
-                    analysis['has_item_cards'] = len(item_cards) > 0
+                    analysis['has_item_cards'] = probe['itemCardCount'] > 0
                     
                     if analysis['has_item_cards']:
                         analysis['page_state'] = 'ready'
@@ -868,17 +1255,8 @@ class BuyeeScraper:
                     else:
                         # If we have the container but no items, check for no results message again
                         # (some pages might show the container even with no results)
-                        for selector in no_results_selectors:
-                            try:
-                                no_results_element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                                message = no_results_element.text.strip()
-                                analysis['content_analysis']['has_no_results_message'] = True
-                                analysis['content_analysis']['no_results_message'] = message
-                                analysis['content_analysis']['no_results_indicators'].append(f"Found no results element in empty container: {selector}")
-                                logger.info(f"Found no results message in empty container: {message}")
-                                return 'no_results', False
-                            except NoSuchElementException:
-                                continue
+                        if self._record_no_results_element(analysis, probe, "in empty container"):
+                            return 'no_results', False
                         
                         # If we still don't have a no results message, this might be a loading issue
                         analysis['page_state'] = 'error'
@@ -891,10 +1269,12 @@ class BuyeeScraper:
                     
                     # Check if we have other essential elements to determine if page loaded properly
                     try:
-                        analysis['content_analysis']['has_header'] = len(self.driver.find_elements(By.CSS_SELECTOR, "header")) > 0
-                        analysis['content_analysis']['has_footer'] = len(self.driver.find_elements(By.CSS_SELECTOR, "footer")) > 0
-                        analysis['content_analysis']['has_search_box'] = len(self.driver.find_elements(By.CSS_SELECTOR, "input[type='search']")) > 0
-                        analysis['content_analysis']['has_category_menu'] = len(self.driver.find_elements(By.CSS_SELECTOR, "nav.categoryMenu")) > 0
+                        # Re-probe since the page may have changed during the wait
+                        probe = self._probe_page()
+                        analysis['content_analysis']['has_header'] = probe['hasHeader']
+                        analysis['content_analysis']['has_footer'] = probe['hasFooter']
+                        analysis['content_analysis']['has_search_box'] = probe['hasSearchBox']
+                        analysis['content_analysis']['has_category_menu'] = probe['hasCategoryMenu']
                         
                         # If we have essential elements but no container, this might be a no results page
                         if (analysis['content_analysis']['has_header'] and 
@@ -902,26 +1282,18 @@ class BuyeeScraper:
                             analysis['content_analysis']['has_search_box']):
                             
                             # Check for no results message one more time
-                            for selector in no_results_selectors:
-                                try:
-                                    no_results_element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                                    message = no_results_element.text.strip()
-                                    analysis['content_analysis']['has_no_results_message'] = True
-                                    analysis['content_analysis']['no_results_message'] = message
-                                    analysis['content_analysis']['no_results_indicators'].append(f"Found no results element after container timeout: {selector}")
-                                    logger.info(f"Found no results message after container timeout: {message}")
-                                    return 'no_results', False
-                                except NoSuchElementException:
-                                    continue
+                            if self._record_no_results_element(analysis, probe, "after container timeout"):
+                                return 'no_results', False
                             
                             # Check for no results text in page source one more time
-                            for text in no_results_texts:
-                                if text in page_source:
-                                    analysis['content_analysis']['has_no_results_message'] = True
-                                    analysis['content_analysis']['no_results_message'] = text
-                                    analysis['content_analysis']['no_results_indicators'].append(f"Found no results text in page source after container timeout: {text}")
-                                    logger.info(f"Found no results text in page source after container timeout: {text}")
-                                    return 'no_results', False
+                            match = _NO_RESULTS_TEXT_RE.search(page_source)
+                            if match:
+                                text = match.group(0)
+                                analysis['content_analysis']['has_no_results_message'] = True
+                                analysis['content_analysis']['no_results_message'] = text
+                                analysis['content_analysis']['no_results_indicators'].append(f"Found no results text in page source after container timeout: {text}")
+                                logger.info(f"Found no results text in page source after container timeout: {text}")
+                                return 'no_results', False
                             
                             # If we have essential elements but no container and no no-results message,
                             # this might be a loading issue
@@ -954,6 +1326,33 @@ class BuyeeScraper:
             logger.error(f"Error checking page state: {str(e)}")
             return 'error', True
 
+    def _persist_maintenance_artifacts(self, timestamp: str, page_source: str, screenshot_png: bytes,
+                                       status_lines: Optional[List[str]]) -> None:
+        """Write maintenance page source, screenshot and (first time only) status file."""
+        try:
+            debug_dir = os.path.join(self.output_dir, "debug")
+            os.makedirs(debug_dir, exist_ok=True)
+            
+            # Save maintenance page source
+            maintenance_source_path = os.path.join(debug_dir, f"maintenance_page_{timestamp}.html")
+            with open(maintenance_source_path, "w", encoding="utf-8") as f:
+                f.write(page_source)
+            logger.info(f"Saved maintenance page source to {maintenance_source_path}")
+            
+            # Save maintenance screenshot
+            maintenance_screenshot_path = os.path.join(debug_dir, f"maintenance_screenshot_{timestamp}.png")
+            with open(maintenance_screenshot_path, "wb") as f:
+                f.write(screenshot_png)
+            logger.info(f"Saved maintenance screenshot to {maintenance_screenshot_path}")
+            
+            # Create maintenance status file
+            if status_lines:
+                status_path = os.path.join(self.output_dir, "maintenance_status.txt")
+                with open(status_path, "w", encoding="utf-8") as f:
+                    f.write("\n".join(status_lines) + "\n")
+        except Exception as e:
+            logger.error(f"Error saving maintenance artifacts: {str(e)}")
+
     def handle_maintenance(self, search_term: str) -> bool:
         """
         Handle site maintenance by saving debug info and deciding whether to continue.
@@ -961,48 +1360,42 @@ class BuyeeScraper:
         """
         # Save detailed maintenance info
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        debug_dir = os.path.join(self.output_dir, "debug")
-        os.makedirs(debug_dir, exist_ok=True)
-        
-        # Save maintenance page source
-        maintenance_source_path = os.path.join(debug_dir, f"maintenance_page_{timestamp}.html")
-        with open(maintenance_source_path, "w", encoding="utf-8") as f:
-            f.write(self.driver.page_source)
-        logger.info(f"Saved maintenance page source to {maintenance_source_path}")
         
-        # Save maintenance screenshot
-        maintenance_screenshot_path = os.path.join(debug_dir, f"maintenance_screenshot_{timestamp}.png")
-        self.driver.save_screenshot(maintenance_screenshot_path)
-        logger.info(f"Saved maintenance screenshot to {maintenance_screenshot_path}")
+        # Grab everything that needs the driver here; it is not safe to use from another thread
+        page_source = self._cached_source()
+        screenshot_png = self.driver.get_screenshot_as_png()
+        status_lines = None
+        if self._maintenance_start is None:
+            # Record when maintenance was first seen; the status file is written once
+            self._maintenance_start = datetime.now()
+            status_lines = [
+                f"Maintenance detected at: {self._maintenance_start.isoformat()}",
+                f"Current URL: {self.driver.current_url}",
+                f"Page title: {self.driver.title}",
+                f"Search term: {search_term}",
+                f"Page source (first 1000 chars):\n{page_source[:1000]}",
+            ]
         
-        # Create maintenance status file
-        status_path = os.path.join(self.output_dir, "maintenance_status.txt")
-        with open(status_path, "w", encoding="utf-8") as f:
-            f.write(f"Maintenance detected at: {datetime.now().isoformat()}\n")
-            f.write(f"Current URL: {self.driver.current_url}\n")
-            f.write(f"Page title: {self.driver.title}\n")
-            f.write(f"Search term: {search_term}\n")
-            f.write(f"Page source (first 1000 chars):\n{self.driver.page_source[:1000]}\n")
+        # Write the artifacts in the background so the retry wait starts immediately
+        writer = threading.Thread(
+            target=self._persist_maintenance_artifacts,
+            args=(timestamp, page_source, screenshot_png, status_lines),
+            daemon=True
+        )
+        writer.start()
         
-        # Check if we should continue based on maintenance duration
-        if os.path.exists(status_path):
-            try:
-                with open(status_path, "r", encoding="utf-8") as f:
-                    first_line = f.readline().strip()
-                    if first_line:
-                        maintenance_start = datetime.fromisoformat(first_line.split(": ")[1])
-                        maintenance_duration = datetime.now() - maintenance_start
-                        
-                        # If maintenance has been ongoing for more than 2 hours, stop
-                        if maintenance_duration.total_seconds() > 7200:  # 2 hours
-                            logger.error("Maintenance has been ongoing for more than 2 hours. Stopping script.")
-                            return False
-            except Exception as e:
-                logger.error(f"Error reading maintenance status: {str(e)}")
+        # If maintenance has been ongoing for more than 2 hours, stop
+        maintenance_duration = datetime.now() - self._maintenance_start
+        if maintenance_duration.total_seconds() > 7200:  # 2 hours
+            logger.error("Maintenance has been ongoing for more than 2 hours. Stopping script.")
+            writer.join()  # Make sure the artifacts land before the script exits
+            return False
         
         # Wait 30 minutes before next retry
         logger.info("Waiting 30 minutes before next retry...")
-        time.sleep(1800)  # 30 minutes
+        if self._wake_event.wait(1800):  # 30 minutes unless woken early
+            logger.info("Maintenance wait interrupted, retrying now")
+            self._wake_event.clear()
         return True
 
     def wait_for_page_ready(self, timeout: int = 30) -> bool:
@@ -1010,23 +1403,31 @@ class BuyeeScraper:
         Wait for the page to be in a ready state, handling various conditions.
         Returns True if page is ready for processing, False otherwise.
         """
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            state, is_error = self.check_page_state()
-            
-            if state == 'ready':
+        try:
+            # Cheap in-browser probe every 300ms; returns as soon as items, a no-results message or
+            # a maintenance/captcha/error marker appear
+            outcome = WebDriverWait(self.driver, timeout, poll_frequency=0.3).until(self._page_ready_condition)
+            if outcome in ('ready', 'no_results'):
+                self._maintenance_start = None  # The site is back; a later outage starts a fresh 2-hour window
                 return True
-            elif state == 'no_results':
-                return True  # No results is a valid state
-            elif is_error:
-                return False
-            elif state == 'loading':
-                time.sleep(2)  # Wait a bit before checking again
-                continue
-                
+        except TimeoutException:
+            pass
+        except Exception as e:
+            logger.warning(f"Page readiness probe failed: {str(e)}")
+        
+        # Fall back to the full analysis to classify what did load
+        state, is_error = self.check_page_state()
+        if state in ('ready', 'no_results'):
+            self._maintenance_start = None
+            return True  # No results is a valid state
+        
         logger.warning(f"Page did not reach ready state within {timeout} seconds")
         return False
 
+    def _page_ready_condition(self, driver) -> Any:
+        """Expected condition: the search page shows item cards, a no-results message or a settled-page marker."""
+        return driver.execute_script(_PAGE_READY_JS, list(NO_RESULTS_SELECTORS), list(_PAGE_SETTLED_MARKERS))
+
     def has_next_page(self) -> bool:
         """Check if there is a next page of results."""
         try:
@@ -1039,10 +1440,21 @@ class BuyeeScraper:
         """Navigate to the next page of results."""
         try:
             next_button = self.driver.find_element(By.CSS_SELECTOR, "a.pagination__next:not(.pagination__next--disabled)")
+            # Remember a current card so we can tell when the results are actually replaced
+            cards = self.driver.find_elements(By.CSS_SELECTOR, "li.itemCard")
             next_button.click()
-            return self.wait_for_page_ready()
-        except (NoSuchElementException, WebDriverException) as e:
+            self._page_cache = None
+            self._page_cache_lower = None
+            if cards:
+                try:
+                    WebDriverWait(self.driver, 20).until(EC.staleness_of(cards[0]))
+                except TimeoutException:
+                    logger.warning("Previous page's items were not replaced within timeout")
+            return self.wait_for_page_ready(timeout=10 if cards else 30)
+        except Exception as e:
             logger.warning(f"Failed to navigate to next page: {str(e)}")
+            if not isinstance(e, NoSuchElementException):
+                self._driver_suspect = True
             return False
 
     def save_initial_promising_links(self, item_summaries: List[Dict[str, Any]], search_term: str) -> None:
@@ -1059,9 +1471,9 @@ class BuyeeScraper:
             leads_data = []
             for summary in item_summaries:
                 # Extract Yahoo Auction ID from Buyee URL
-                yahoo_id_match = re.search(r'/([a-z]\d+)(?:\?|$)', summary['url'])
+                yahoo_id_match = YAHOO_ID_RE.search(summary['url'])
                 yahoo_auction_id = yahoo_id_match.group(1) if yahoo_id_match else None
-                yahoo_auction_url = f"https://page.auctions.yahoo.co.jp/jp/auction/{yahoo_auction_id}" if yahoo_auction_id else None
+                yahoo_auction_url = YAHOO_URL_FMT.format(yahoo_auction_id) if yahoo_auction_id else None
                 
                 lead_info = {
                     'title': summary['title'],
@@ -1077,9 +1489,11 @@ class BuyeeScraper:
                 leads_data.append(lead_info)
             
             # Save as CSV
-            df = pd.DataFrame(leads_data)
             csv_path = os.path.join(self.output_dir, f"{base_filename}.csv")
-            df.to_csv(csv_path, index=False, encoding='utf-8')
+            with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=list(leads_data[0].keys()))
+                writer.writeheader()
+                writer.writerows(leads_data)
             logger.info(f"Saved {len(leads_data)} initial promising leads to {csv_path}")
             
             # Save as JSON
@@ -1089,8 +1503,7 @@ class BuyeeScraper:
             logger.info(f"Saved {len(leads_data)} initial promising leads to {json_path}")
             
         except Exception as e:
-            logger.error(f"Error saving initial promising links: {str(e)}")
-            logger.error(traceback.format_exc())
+            logger.error(f"Error saving initial promising links: {str(e)}", exc_info=True)
 
     def scrape_item_detail_page(self, url):
         """Scrape detailed information from an item's detail page."""
@@ -1102,15 +1515,15 @@ class BuyeeScraper:
                 logger.warning(f"Invalid URL format: {url}")
                 return None
             
-            # Add a delay before loading the detail page
-            time.sleep(3)  # Add a 3-second delay to avoid rate limiting
+            # Keep detail page loads at least 3 seconds apart to avoid rate limiting
+            self._detail_rate.wait()
             
             # Navigate to the item page with retry logic
             max_retries = 3
             for attempt in range(max_retries):
                 try:
                     logger.info(f"Attempting to load item page (attempt {attempt + 1}/{max_retries}): {url}")
-                    self.driver.get(url)
+                    self._navigate(url)
                     
                     # Wait for page to be in a stable state
                     try:
@@ -1123,34 +1536,27 @@ class BuyeeScraper:
                     
                     # Quick check for error pages before waiting
                     current_title = self.driver.title.lower()
-                    page_content = self.driver.page_source.lower()
+                    page_content = self._cached_source_lower()
                     
                     # Check for various error conditions
-                    error_indicators = {
-                        'captcha': ['captcha', 'recaptcha', 'robot', 'verify', 'reCAPTCHA'],
-                        'maintenance': ['maintenance', 'メンテナンス', 'system maintenance'],
-                        'not_found': ['not found', '404', 'page not found', 'ページが見つかりません'],
-                        'access_denied': ['access denied', '403', 'forbidden', 'アクセスできません'],
-                        'rate_limit': ['too many requests', 'rate limit', 'アクセス制限'],
-                        'region_block': ['not available in your region', '地域制限'],
-                        'error': ['error', 'エラー', '問題が発生しました', 'system error']
-                    }
-                    
-                    for error_type, indicators in error_indicators.items():
-                        if any(indicator in current_title or indicator in page_content for indicator in indicators):
-                            logger.warning(f"Detected {error_type} page for {url}")
-                            self.save_debug_info(url.split('/')[-1], f"detail_{error_type}", self.driver.page_source)
-                            return None
+                    error_type = _detect_detail_error(current_title, page_content)
+                    if error_type:
+                        logger.warning(f"Detected {error_type} page for {url}")
+                        self.save_debug_info(url.split('/')[-1], f"detail_{error_type}", self._cached_source())
+                        return None
                     
-                    # Quick check for valid item page structure
-                    if not any(selector in page_content for selector in ['itemDetail', 'item-detail', 'auction-item-detail']):
+                    # Quick check for valid item page structure, probed in the DOM rather than the page source
+                    if not self.driver.execute_script(
+                        "return !!document.querySelector(arguments[0]);", ", ".join(DESCRIPTION_SELECTORS)
+                    ):
                         logger.warning("Page does not appear to be a valid item page")
-                        self.save_debug_info(url.split('/')[-1], "invalid_page", self.driver.page_source)
+                        self.save_debug_info(url.split('/')[-1], "invalid_page", self._cached_source())
                         return None
                     
                     break
                     
                 except Exception as e:
+                    self._driver_suspect = True
                     if attempt == max_retries - 1:
                         logger.error(f"Failed to load page after {max_retries} attempts: {str(e)}")
                         return None
@@ -1159,116 +1565,63 @@ class BuyeeScraper:
             
             # Handle cookie popup if present (with shorter timeout)
             try:
-                cookie_selectors = [
-                    "div.cookiePolicyPopup__buttonWrapper button.accept_cookie",
-                    "button#js-accept-cookies",
-                    "button.accept-cookies",
-                    "button[data-testid='cookie-accept']"
-                ]
-                
-                for selector in cookie_selectors:
-                    try:
-                        cookie_button = WebDriverWait(self.driver, 3).until(
-                            EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                        )
-                        cookie_button.click()
-                        time.sleep(1)
-                        break
-                    except TimeoutException:
-                        continue
+                try:
+                    # One wait covers every known button instead of 3s per selector
+                    cookie_button = WebDriverWait(self.driver, 3).until(
+                        EC.element_to_be_clickable((By.CSS_SELECTOR, DETAIL_COOKIE_SELECTOR))
+                    )
+                    cookie_button.click()
+                    time.sleep(1)
+                except TimeoutException:
+                    pass
             except Exception as e:
-                logger.debug(f"Cookie handling error (non-critical): {str(e)}")
+                logger.debug("Cookie handling error (non-critical): %s", e)
             
             # Wait for and extract essential elements with robust selectors
             item_details = {}
             
             # 1. Main item description (with multiple selectors and fallbacks)
-            description_selectors = [
-                "section#auction_item_description",
-                "div.itemDescription",
-                "div#itemDetail_sec",
-                "div.item-description",
-                "div[data-testid='item-description']",
-                "div.description",
-                "div.item-details"
-            ]
-            
-            for selector in description_selectors:
-                try:
-                    description_element = WebDriverWait(self.driver, 25).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                    if description_element:
-                        item_details['description'] = description_element.text.strip()
-                        logger.info("Found item description")
-                        break
-                except (TimeoutException, NoSuchElementException):
-                    continue
+            # One wait for whichever selector appears first, instead of up to 25s per selector
+            try:
+                description_element = WebDriverWait(self.driver, 25).until(EC.any_of(
+                    *(EC.presence_of_element_located((By.CSS_SELECTOR, selector)) for selector in DESCRIPTION_SELECTORS)
+                ))
+                if description_element:
+                    item_details['description'] = description_element.text.strip()
+                    logger.info("Found item description")
+            except (TimeoutException, NoSuchElementException):
+                pass
             
             if 'description' not in item_details:
                 logger.warning("Could not find item description")
                 return None
             
             # 2. Seller-stated condition
-            condition_selectors = [
-                "//em[normalize-space(.)='Item Condition']/following-sibling::span[1]",
-                "//em[contains(text(), 'Condition')]/following-sibling::span[1]",
-                "//div[contains(@class, 'condition')]//span",
-                "//div[contains(@class, 'itemCondition')]//span"
-            ]
-            
-            for selector in condition_selectors:
-                try:
-                    condition_element = WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((By.XPATH, selector))
-                    )
-                    if condition_element:
-                        item_details['seller_condition'] = condition_element.text.strip()
-                        logger.info("Found seller condition")
-                        break
-                except (TimeoutException, NoSuchElementException):
-                    continue
-            
-            # 3. Direct Yahoo Auction link
-            yahoo_link_selectors = [
-                "//a[contains(normalize-space(.), 'View on the original site')]",
-                "//a[contains(@href, 'page.auctions.yahoo.co.jp')]",
-                "//a[contains(@class, 'original-site-link')]"
-            ]
-            
-            for selector in yahoo_link_selectors:
-                try:
-                    yahoo_link = WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((By.XPATH, selector))
-                    )
-                    if yahoo_link:
-                        item_details['yahoo_link'] = yahoo_link.get_attribute('href')
-                        logger.info("Found Yahoo Auction link")
-                        break
-                except (TimeoutException, NoSuchElementException):
-                    continue
-            
-            # 4. Main image URL
-            image_selectors = [
-                "div.photo_gallery_main img",
-                "div.itemPhoto img",
-                "div[data-testid='item-image'] img",
-                "div.item-image img"
-            ]
+            try:
+                condition_element = WebDriverWait(self.driver, 10).until(EC.any_of(
+                    *(EC.presence_of_element_located((By.XPATH, selector)) for selector in CONDITION_SELECTORS)
+                ))
+                if condition_element:
+                    item_details['seller_condition'] = condition_element.text.strip()
+                    logger.info("Found seller condition")
+            except (TimeoutException, NoSuchElementException):
+                pass
             
-            for selector in image_selectors:
-                try:
-                    img_element = WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                    if img_element:
-                        # Try data-src first, then src
-                        item_details['main_image_url'] = img_element.get_attribute('data-src') or img_element.get_attribute('src')
-                        if item_details['main_image_url']:
-                            logger.info("Found main image URL")
-                            break
-                except (TimeoutException, NoSuchElementException):
-                    continue
+            # 3 & 4. Direct Yahoo Auction link and main image URL
+            # The page is loaded and its description found, so look both up in one script call
+            # instead of waiting up to 10s per selector
+            try:
+                extras = self.driver.execute_script(
+                    _DETAIL_EXTRAS_JS, list(YAHOO_LINK_SELECTORS), YAHOO_LINK_XPATH, list(IMAGE_SELECTORS)
+                )
+                if extras['yahooLinkFound']:
+                    item_details['yahoo_link'] = extras['yahooLink']
+                    logger.info("Found Yahoo Auction link")
+                if extras['mainImageUrl']:
+                    item_details['main_image_url'] = extras['mainImageUrl']
+                    logger.info("Found main image URL")
+            except WebDriverException as e:
+                logger.warning(f"Could not look up Yahoo link and image: {str(e)}")
             
             # Return the collected details
             if item_details:
@@ -1280,6 +1633,7 @@ class BuyeeScraper:
             
         except Exception as e:
             logger.error(f"Error scraping item details: {str(e)}")
+            self._driver_suspect = True
             return None
 
     def is_element_attached(self, element: WebElement) -> bool:
@@ -1344,7 +1698,11 @@ class BuyeeScraper:
             timeout = self.element_wait_time
             
         try:
-            wait = WebDriverWait(self.driver, timeout)
+            # Reuse one short-polling wait per timeout; the default 0.5s poll mostly sleeps
+            wait = self._waits.get(timeout)
+            if wait is None:
+                wait = WebDriverWait(self.driver, timeout, poll_frequency=ELEMENT_POLL_INTERVAL)
+                self._waits[timeout] = wait
             
             # Define the expected condition based on the condition parameter
             if condition == "presence":
@@ -1382,17 +1740,17 @@ class BuyeeScraper:
                     logger.warning("Parent element became stale while waiting for child element")
                     return None
                 except Exception as e:
-                    logger.debug(f"Error finding element within parent: {str(e)}")
+                    logger.debug("Error finding element within parent: %s", e)
                     return None
             else:
                 # Wait for element in the entire document
                 return wait.until(expected_condition)
                 
         except TimeoutException:
-            logger.debug(f"Timeout waiting for element {value} with condition {condition}")
+            logger.debug("Timeout waiting for element %s with condition %s", value, condition)
             return None
         except Exception as e:
-            logger.debug(f"Error waiting for element {value}: {str(e)}")
+            logger.debug("Error waiting for element %s: %s", value, e)
             return None
 
     def save_results(self, results: List[Dict[str, Any]], search_term: str) -> None:
@@ -1405,21 +1763,23 @@ class BuyeeScraper:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             base_filename = f"buyee_listings_{search_term}_{timestamp}"
             
-            # Save as CSV
-            df = pd.DataFrame(results)
+            # Save as CSV; columns are the union of keys in first-seen order, missing values left blank
+            fieldnames = list(dict.fromkeys(key for result in results for key in result))
             csv_path = os.path.join(self.output_dir, f"{base_filename}.csv")
-            df.to_csv(csv_path, index=False, encoding='utf-8')
+            with open(csv_path, 'w', newline='', encoding='utf-8', buffering=RESULTS_WRITE_BUFFER) as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames)
+                writer.writeheader()
+                writer.writerows(results)
             logger.info(f"Saved {len(results)} results to {csv_path}")
             
             # Save as JSON
             json_path = os.path.join(self.output_dir, f"{base_filename}.json")
-            with open(json_path, 'w', encoding='utf-8') as f:
+            with open(json_path, 'w', encoding='utf-8', buffering=RESULTS_WRITE_BUFFER) as f:
                 json.dump(results, f, ensure_ascii=False, indent=2)
             logger.info(f"Saved {len(results)} results to {json_path}")
             
         except Exception as e:
-            logger.error(f"Error saving results: {str(e)}")
-            logger.error(traceback.format_exc())
+            logger.error(f"Error saving results: {str(e)}", exc_info=True)
 
     def close(self):
         """Close the WebDriver with error handling."""
@@ -1448,73 +1808,30 @@ class BuyeeScraper:
         try:
             # Extract rank from description
             if description:
-                rank_match = re.search(r'【ランク】\s*([A-Z]+)', description)
+                rank_match = RANK_RE.search(description)
                 if rank_match:
                     details['rank'] = rank_match.group(1)
-                    logger.debug(f"Found rank: {details['rank']}")
+                    logger.debug("Found rank: %s", details['rank'])
             
             # Extract set code and card number
-            set_code_match = re.search(r'([A-Z]{2,4})-([A-Z]{2})(\d{3})', title)
+            set_code_match = SET_CODE_RE.search(title)
             if set_code_match:
                 details['set_code'] = set_code_match.group(1)
                 details['card_number'] = set_code_match.group(3)
-                logger.debug(f"Found set code: {details['set_code']}, card number: {details['card_number']}")
-            
-            # Extract rarity
-            rarity_keywords = {
-                'Secret Rare': ['secret rare', 'シークレットレア', 'sr'],
-                'Ultimate Rare': ['ultimate rare', 'アルティメットレア', 'ur'],
-                'Ghost Rare': ['ghost rare', 'ゴーストレア', 'gr'],
-                'Collector\'s Rare': ['collector\'s rare', 'コレクターズレア', 'cr'],
-                'Starlight Rare': ['starlight rare', 'スターライトレア', 'str'],
-                'Quarter Century Secret Rare': ['quarter century secret rare', 'クォーターセンチュリーシークレットレア', 'qcsr'],
-                'Prismatic Secret Rare': ['prismatic secret rare', 'プリズマティックシークレットレア', 'psr'],
-                'Platinum Secret Rare': ['platinum secret rare', 'プラチナシークレットレア', 'plsr'],
-                'Gold Secret Rare': ['gold secret rare', 'ゴールドシークレットレア', 'gsr'],
-                'Ultra Rare': ['ultra rare', 'ウルトラレア', 'ur'],
-                'Super Rare': ['super rare', 'スーパーレア', 'sr'],
-                'Rare': ['rare', 'レア', 'r'],
-                'Common': ['common', 'ノーマル', 'n']
-            }
-            
-            for rarity, keywords in rarity_keywords.items():
-                if any(keyword.lower() in title.lower() for keyword in keywords):
-                    details['rarity'] = rarity
-                    logger.debug(f"Found rarity: {rarity}")
-                    break
-            
-            # Extract edition
-            edition_keywords = {
-                '1st Edition': ['1st', 'first edition', '初版', '初刷'],
-                'Unlimited': ['unlimited', '無制限', '再版', '再刷']
-            }
-            
-            for edition, keywords in edition_keywords.items():
-                if any(keyword.lower() in title.lower() for keyword in keywords):
-                    details['edition'] = edition
-                    logger.debug(f"Found edition: {edition}")
-                    break
-            
-            # Extract language/region
-            region_keywords = {
-                'Asia': ['asia', 'asian', 'アジア', 'アジア版'],
-                'English': ['english', '英', '英語版'],
-                'Japanese': ['japanese', '日', '日本語版'],
-                'Korean': ['korean', '韓', '韓国版']
-            }
+                logger.debug("Found set code: %s, card number: %s", details['set_code'], details['card_number'])
             
-            for region, keywords in region_keywords.items():
-                if any(keyword.lower() in title.lower() for keyword in keywords):
-                    details['language'] = region
-                    logger.debug(f"Found language/region: {region}")
-                    break
+            # Extract rarity, edition and language/region in one pass over the title
+            # (keyword tables are lowercase already, so lowercase the title once)
+            for field, value in _match_title_keywords(title.lower()).items():
+                details[field] = value
+                logger.debug("Found %s: %s", field, value)
             
             # Extract condition text from description
             if description:
-                condition_section = re.search(r'【商品の状態】\s*(.*?)(?=\n|$)', description)
+                condition_section = CONDITION_TEXT_RE.search(description)
                 if condition_section:
                     details['condition_text'] = condition_section.group(1).strip()
-                    logger.debug(f"Found condition text: {details['condition_text']}")
+                    logger.debug("Found condition text: %s", details['condition_text'])
             
             # Try to extract card name (this is more complex and might need improvement)
             # For now, we'll just use the title as the name
@@ -1529,9 +1846,13 @@ class BuyeeScraper:
 
     def is_driver_valid(self) -> bool:
         """Check if the WebDriver is still valid and handle reconnection if needed."""
+        # Only spend a round-trip on the probe after a driver operation has failed
+        if self.driver is not None and not self._driver_suspect:
+            return True
         try:
             # Try a simple command to check if driver is responsive
             self.driver.current_url
+            self._driver_suspect = False
             return True
         except Exception as e:
             logger.error(f"WebDriver is not valid: {str(e)}")
@@ -1542,7 +1863,11 @@ class BuyeeScraper:
                 pass
             # Try to create a new driver
             try:
+                self._cookies_accepted = False
+                self._waits = {}
                 self.setup_driver()
+                self._block_heavy_resources()
+                self._driver_suspect = False
                 return True
             except Exception as setup_error:
                 logger.error(f"Failed to recreate WebDriver: {str(setup_error)}")
@@ -1555,6 +1880,8 @@ def main():
     parser.add_argument('--headless', action='store_true', help='Run in headless mode')
     args = parser.parse_args()
     
+    install_maintenance_wake_handler()
+    
     scraper = None
     try:
         scraper = BuyeeScraper(
@@ -1571,7 +1898,7 @@ def main():
         # Process each search term
         for search_term in SEARCH_TERMS:
             try:
-                # Check if driver is valid before each search
+                # Check if driver is valid before each search (probes only after a failed driver operation)
                 if not scraper.is_driver_valid():
                     logger.error("WebDriver is not valid before starting search. Attempting to recreate...")
                     if not scraper.is_driver_valid():  # Try one more time
@@ -1587,13 +1914,11 @@ def main():
                     logger.info(f"No valuable items found for {search_term}")
                     
             except Exception as e:
-                logger.error(f"Error processing search term {search_term}: {str(e)}")
-                logger.error(traceback.format_exc())
+                logger.error(f"Error processing search term {search_term}: {str(e)}", exc_info=True)
                 continue
                 
     except Exception as e:
-        logger.error(f"Fatal error in main: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.error(f"Fatal error in main: {str(e)}", exc_info=True)
     finally:
         if scraper:
             try:
@@ -4,12 +4,115 @@ import logging
 from dataclasses import dataclass
 from enum import Enum
 import os
-from openai import OpenAI
+import sys
+import hashlib
+import threading
 from dotenv import load_dotenv
 import json
 
 logger = logging.getLogger(__name__)
 
+class _PriceCharTable(dict):
+    """str.translate table that keeps decimal digits and '.' and deletes everything else.
+
+    Entries are filled in lazily, so any Unicode character (full-width digits, 円) is handled.
+    """
+
+    def __missing__(self, code: int) -> Optional[int]:
+        char = chr(code)
+        self[code] = value = code if char.isdecimal() or char == '.' else None
+        return value
+
+# Strips currency symbols, commas and other non-numeric characters from price text
+PRICE_CHAR_TABLE = _PriceCharTable()
+
+# Set code and card number, e.g. "LOB-EN001" / "TDGS-JP040"
+SET_CODE_RE = re.compile(r'([A-Z]{2,4})-([A-Z]{2})(\d{3})')
+
+# Lowercased title keywords that mark a card as valuable on their own, checked in order
+VALUE_KEYWORD_CHECKS = (
+    ("Card has high rarity", ("secret rare", "ultimate rare", "ghost rare", "collector's rare", "starlight rare")),
+    ("Card is 1st Edition", ("1st", "first edition", "初版", "初刷")),
+    ("Card is sealed/unopened", ("sealed", "未開封", "新品未開封")),
+    ("Card is from tournament/event", ("tournament", "event", "championship", "大会", "イベント")),
+    ("Card is special/limited edition", ("special", "limited", "promo", "限定", "特典")),
+)
+
+# Maximum number of AI analyses kept in memory per analyzer
+AI_CACHE_SIZE = 4096
+
+# Model and system prompt used for AI card analysis
+AI_MODEL = "gpt-4-turbo"
+AI_SYSTEM_PROMPT = "You are an expert Yu-Gi-Oh! card evaluator with deep knowledge of card values, conditions, and market trends."
+
+# JSON schema the model is asked to return for each listing
+AI_RESPONSE_SCHEMA = """{
+    "card_name": "string",
+    "set_code": "string",
+    "card_number": "string",
+    "condition": "string",
+    "authenticity": "string",
+    "value_assessment": {
+        "min_value": float,
+        "max_value": float,
+        "confidence": float
+    },
+    "profit_potential": {
+        "estimated_profit": float,
+        "risk_level": "string",
+        "confidence": float
+    },
+    "recommendation": {
+        "action": "string",
+        "reasoning": "string",
+        "confidence": float
+    }
+}"""
+
+# Single-listing analysis prompt, with the response schema baked in once
+AI_PROMPT_TEMPLATE = """
+        Analyze this Yu-Gi-Oh! card listing:
+        Title: {title}
+        Description: {description}
+        Current Price: ¥{price}
+        
+        Please provide a detailed analysis including:
+        1. Card identification (name, set, number if visible)
+        2. Condition assessment
+        3. Authenticity check
+        4. Value assessment based on recent eBay sales
+        5. Profit potential analysis
+        6. Recommendation (Buy/Pass)
+        
+        Format your response as JSON with these keys:
+        """ + AI_RESPONSE_SCHEMA.replace('{', '{{').replace('}', '}}') + """
+        """
+
+def _build_keyword_matcher(keyword_table: Dict[Any, Tuple[str, ...]]) -> Tuple[Any, Dict[str, Tuple[int, Any]]]:
+    """Compile a keyword table into one overlapping-match regex plus a keyword -> (priority, label) map.
+
+    Keywords are listed in table order, so at any position the alternation prefers the
+    highest-priority label; keywords shared by several labels keep the first one.
+    """
+    lookup = {}
+    for priority, (label, keywords) in enumerate(keyword_table.items()):
+        for keyword in keywords:
+            lookup.setdefault(keyword.lower(), (priority, label))
+    pattern = re.compile('(?=(' + '|'.join(re.escape(keyword) for keyword in lookup) + '))')
+    return pattern, lookup
+
+def _match_keywords(matcher: Tuple[Any, Dict[str, Tuple[int, Any]]], text: str) -> Optional[Any]:
+    """Return the highest-priority label whose keyword occurs in the lowercased text, or None."""
+    pattern, lookup = matcher
+    best = None
+    for match in pattern.finditer(text):
+        priority, label = lookup[match.group(1)]
+        if best is None or priority < best[0]:
+            best = (priority, label)
+            if priority == 0:
+                break
+    return best[1] if best else None
+
 class CardCondition(Enum):
     MINT = "Mint"
     NEAR_MINT = "Near Mint"
@@ -22,7 +125,11 @@ class CardCondition(Enum):
     DAMAGED = "Damaged"
     UNKNOWN = "Unknown"
 
-@dataclass
+# CardInfo uses __slots__ where dataclasses support it (3.10+): no per-instance
+# __dict__ for the many listings a scrape produces
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class CardInfo:
     title: str
     price: float
@@ -42,6 +149,146 @@ class CardInfo:
     profit_potential: Optional[float] = None
     recommendation: Optional[str] = None
 
+# Value indicators for card analysis
+VALUE_INDICATORS = {
+    'rarity': ('secret', 'ultimate', 'collector', 'gold', 'platinum', 'prismatic'),
+    'condition': ('mint', 'nm', 'ex', 'vg'),
+    'set': ('lob', 'sdj', 'sdy', 'sdk', 'mfc', 'crv', 'rymp')
+}
+
+# Condition keywords in Japanese and English
+CONDITION_KEYWORDS = {
+    CardCondition.MINT: (
+        "mint", "mint condition", "mint state",
+        "未使用", "新品", "美品", "完全美品",
+        "psa 10", "bgs 10", "psa 9.5", "bgs 9.5"
+    ),
+    CardCondition.NEAR_MINT: (
+        "near mint", "nm", "nm-mt", "near mint condition",
+        "ほぼ新品", "ほぼ未使用", "極美品", "極上美品"
+    ),
+    CardCondition.EXCELLENT: (
+        "excellent", "ex", "ex-mt", "excellent condition",
+        "美品", "上美品", "優良品"
+    ),
+    CardCondition.VERY_GOOD: (
+        "very good", "vg", "vg-ex", "very good condition",
+        "良品", "良好品"
+    ),
+    CardCondition.GOOD: (
+        "good", "g", "good condition",
+        "並品", "普通品"
+    ),
+    CardCondition.LIGHT_PLAYED: (
+        "light played", "lp", "lightly played",
+        "やや傷あり", "軽い傷あり"
+    ),
+    CardCondition.PLAYED: (
+        "played", "p", "played condition",
+        "傷あり", "使用感あり"
+    ),
+    CardCondition.HEAVILY_PLAYED: (
+        "heavily played", "hp", "heavily played condition",
+        "重度使用", "重度傷あり"
+    ),
+    CardCondition.DAMAGED: (
+        "damaged", "damaged condition",
+        "破損", "損傷", "状態悪い"
+    )
+}
+
+# Rarity keywords in Japanese and English
+RARITY_KEYWORDS = {
+    "Secret Rare": ("secret rare", "シークレットレア", "sr"),
+    "Ultimate Rare": ("ultimate rare", "アルティメットレア", "ur"),
+    "Ghost Rare": ("ghost rare", "ゴーストレア", "gr"),
+    "Collector's Rare": ("collector's rare", "コレクターズレア", "cr"),
+    "Starlight Rare": ("starlight rare", "スターライトレア", "str"),
+    "Quarter Century Secret Rare": ("quarter century secret rare", "クォーターセンチュリーシークレットレア", "qcsr"),
+    "Prismatic Secret Rare": ("prismatic secret rare", "プリズマティックシークレットレア", "psr"),
+    "Platinum Secret Rare": ("platinum secret rare", "プラチナシークレットレア", "plsr"),
+    "Gold Secret Rare": ("gold secret rare", "ゴールドシークレットレア", "gsr"),
+    "Ultra Rare": ("ultra rare", "ウルトラレア", "ur"),
+    "Super Rare": ("super rare", "スーパーレア", "sr"),
+    "Rare": ("rare", "レア", "r"),
+    "Common": ("common", "ノーマル", "n")
+}
+
+# Known valuable cards with their set codes
+VALUABLE_CARDS = {
+    "Blue-Eyes White Dragon": ("LOB", "SDK", "SKE", "YAP1"),
+    "Dark Magician": ("LOB", "SDY", "YAP1", "MVP1"),
+    "Dark Magician Girl": ("MFC", "MVP1", "YAP1"),
+    "Red-Eyes Black Dragon": ("LOB", "SDJ", "YAP1"),
+    "Exodia the Forbidden One": ("LOB",),
+    "Right Arm of the Forbidden One": ("LOB",),
+    "Left Arm of the Forbidden One": ("LOB",),
+    "Right Leg of the Forbidden One": ("LOB",),
+    "Left Leg of the Forbidden One": ("LOB",),
+    "Pot of Greed": ("LOB", "SRL", "DB1"),
+    "Mirror Force": ("MRD", "DCR", "DB1"),
+    "Monster Reborn": ("LOB", "SRL", "DB1"),
+    "Raigeki": ("LOB", "SRL", "DB1"),
+    "Harpie's Feather Duster": ("TP8", "SRL", "DB1"),
+    "Change of Heart": ("MRD", "SRL", "DB1"),
+    "Imperial Order": ("PSV", "SRL", "DB1"),
+    "Crush Card Virus": ("DR1", "DPKB"),
+    "Cyber Dragon": ("CRV", "RYMP"),
+    "Elemental HERO Stratos": ("DP03", "RYMP"),
+    "Judgment Dragon": ("LODT", "RYMP"),
+    "Black Luster Soldier - Envoy of the Beginning": ("IOC", "RYMP"),
+    "Chaos Emperor Dragon - Envoy of the End": ("IOC", "RYMP"),
+    "Cyber-Stein": ("CRV", "RYMP"),
+    "Dark Armed Dragon": ("PTDN", "RYMP"),
+    "Destiny HERO - Disk Commander": ("DP05", "RYMP"),
+    "Elemental HERO Air Neos": ("POTD", "RYMP"),
+    "Gladiator Beast Gyzarus": ("GLAS", "RYMP"),
+    "Goyo Guardian": ("TDGS", "RYMP"),
+    "Honest": ("LODT", "RYMP"),
+    "Mezuki": ("CSOC", "RYMP"),
+    "Plaguespreader Zombie": ("CSOC", "RYMP"),
+    "Stardust Dragon": ("TDGS", "RYMP"),
+    "Thought Ruler Archfiend": ("TDGS", "RYMP")
+}
+
+# Edition keywords
+EDITION_KEYWORDS = {
+    "1st Edition": ("1st", "first edition", "初版", "初刷"),
+    "Unlimited": ("unlimited", "無制限", "再版", "再刷")
+}
+
+# Region keywords
+REGION_KEYWORDS = {
+    "Asia": ("asia", "asian", "アジア", "アジア版"),
+    "English": ("english", "英", "英語版"),
+    "Japanese": ("japanese", "日", "日本語版"),
+    "Korean": ("korean", "韓", "韓国版")
+}
+
+# One precompiled matcher per keyword table: a single pass over the text finds the
+# best label instead of a substring scan per keyword
+_CONDITION_MATCHER = _build_keyword_matcher(CONDITION_KEYWORDS)
+_RARITY_MATCHER = _build_keyword_matcher(RARITY_KEYWORDS)
+_EDITION_MATCHER = _build_keyword_matcher(EDITION_KEYWORDS)
+_REGION_MATCHER = _build_keyword_matcher(REGION_KEYWORDS)
+
+# Valuable card name index for _is_valuable_card: one regex finds every name in a
+# title in a single pass. Longest names are tried first at each position, so each
+# name's accepted sets include those of any shorter name it contains (a title with
+# "Dark Magician Girl" also contains "Dark Magician").
+_VALUABLE_NAMES = {name.lower(): name for name in VALUABLE_CARDS}
+_VALUABLE_SETS = {
+    name_lower: frozenset(
+        set_code
+        for other_lower, other in _VALUABLE_NAMES.items() if other_lower in name_lower
+        for set_code in VALUABLE_CARDS[other]
+    )
+    for name_lower in _VALUABLE_NAMES
+}
+_VALUABLE_NAME_RE = re.compile(
+    '(?=(' + '|'.join(re.escape(name) for name in sorted(_VALUABLE_NAMES, key=len, reverse=True)) + '))'
+)
+
 class CardAnalyzer:
     def __init__(self):
         # Load environment variables
@@ -50,128 +297,24 @@ class CardAnalyzer:
         # Initialize OpenAI client if API key is available
         self.openai_client = None
         if os.getenv('OPENAI_API_KEY'):
+            # Imported here so runs without an API key don't load the openai/httpx/pydantic stack
+            from openai import OpenAI
             self.openai_client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
         
-        # Value indicators for card analysis
-        self.value_indicators = {
-            'rarity': ['secret', 'ultimate', 'collector', 'gold', 'platinum', 'prismatic'],
-            'condition': ['mint', 'nm', 'ex', 'vg'],
-            'set': ['lob', 'sdj', 'sdy', 'sdk', 'mfc', 'crv', 'rymp']
-        }
-        
-        # Condition keywords in Japanese and English
-        self.condition_keywords = {
-            CardCondition.MINT: [
-                "mint", "mint condition", "mint state",
-                "未使用", "新品", "美品", "完全美品",
-                "psa 10", "bgs 10", "psa 9.5", "bgs 9.5"
-            ],
-            CardCondition.NEAR_MINT: [
-                "near mint", "nm", "nm-mt", "near mint condition",
-                "ほぼ新品", "ほぼ未使用", "極美品", "極上美品"
-            ],
-            CardCondition.EXCELLENT: [
-                "excellent", "ex", "ex-mt", "excellent condition",
-                "美品", "上美品", "優良品"
-            ],
-            CardCondition.VERY_GOOD: [
-                "very good", "vg", "vg-ex", "very good condition",
-                "良品", "良好品"
-            ],
-            CardCondition.GOOD: [
-                "good", "g", "good condition",
-                "並品", "普通品"
-            ],
-            CardCondition.LIGHT_PLAYED: [
-                "light played", "lp", "lightly played",
-                "やや傷あり", "軽い傷あり"
-            ],
-            CardCondition.PLAYED: [
-                "played", "p", "played condition",
-                "傷あり", "使用感あり"
-            ],
-            CardCondition.HEAVILY_PLAYED: [
-                "heavily played", "hp", "heavily played condition",
-                "重度使用", "重度傷あり"
-            ],
-            CardCondition.DAMAGED: [
-                "damaged", "damaged condition",
-                "破損", "損傷", "状態悪い"
-            ]
-        }
+        # Cache of AI analyses keyed by a digest of (title, description, price), so
+        # listings seen again on later pages don't repeat the API call
+        self.ai_cache: Dict[bytes, Dict[str, Any]] = {}
+        # Guards ai_cache eviction; one analyzer is shared by the engine's analyze workers
+        self._ai_cache_lock = threading.Lock()
         
-        # Rarity keywords in Japanese and English
-        self.rarity_keywords = {
-            "Secret Rare": ["secret rare", "シークレットレア", "sr"],
-            "Ultimate Rare": ["ultimate rare", "アルティメットレア", "ur"],
-            "Ghost Rare": ["ghost rare", "ゴーストレア", "gr"],
-            "Collector's Rare": ["collector's rare", "コレクターズレア", "cr"],
-            "Starlight Rare": ["starlight rare", "スターライトレア", "str"],
-            "Quarter Century Secret Rare": ["quarter century secret rare", "クォーターセンチュリーシークレットレア", "qcsr"],
-            "Prismatic Secret Rare": ["prismatic secret rare", "プリズマティックシークレットレア", "psr"],
-            "Platinum Secret Rare": ["platinum secret rare", "プラチナシークレットレア", "plsr"],
-            "Gold Secret Rare": ["gold secret rare", "ゴールドシークレットレア", "gsr"],
-            "Ultra Rare": ["ultra rare", "ウルトラレア", "ur"],
-            "Super Rare": ["super rare", "スーパーレア", "sr"],
-            "Rare": ["rare", "レア", "r"],
-            "Common": ["common", "ノーマル", "n"]
-        }
-        
-        # Known valuable cards with their set codes
-        self.valuable_cards = {
-            "Blue-Eyes White Dragon": ["LOB", "SDK", "SKE", "YAP1"],
-            "Dark Magician": ["LOB", "SDY", "YAP1", "MVP1"],
-            "Dark Magician Girl": ["MFC", "MVP1", "YAP1"],
-            "Red-Eyes Black Dragon": ["LOB", "SDJ", "YAP1"],
-            "Exodia the Forbidden One": ["LOB"],
-            "Right Arm of the Forbidden One": ["LOB"],
-            "Left Arm of the Forbidden One": ["LOB"],
-            "Right Leg of the Forbidden One": ["LOB"],
-            "Left Leg of the Forbidden One": ["LOB"],
-            "Pot of Greed": ["LOB", "SRL", "DB1"],
-            "Mirror Force": ["MRD", "DCR", "DB1"],
-            "Monster Reborn": ["LOB", "SRL", "DB1"],
-            "Raigeki": ["LOB", "SRL", "DB1"],
-            "Harpie's Feather Duster": ["TP8", "SRL", "DB1"],
-            "Change of Heart": ["MRD", "SRL", "DB1"],
-            "Imperial Order": ["PSV", "SRL", "DB1"],
-            "Crush Card Virus": ["DR1", "DPKB"],
-            "Cyber Dragon": ["CRV", "RYMP"],
-            "Elemental HERO Stratos": ["DP03", "RYMP"],
-            "Judgment Dragon": ["LODT", "RYMP"],
-            "Black Luster Soldier - Envoy of the Beginning": ["IOC", "RYMP"],
-            "Chaos Emperor Dragon - Envoy of the End": ["IOC", "RYMP"],
-            "Cyber-Stein": ["CRV", "RYMP"],
-            "Dark Armed Dragon": ["PTDN", "RYMP"],
-            "Destiny HERO - Disk Commander": ["DP05", "RYMP"],
-            "Elemental HERO Air Neos": ["POTD", "RYMP"],
-            "Elemental HERO Stratos": ["DP03", "RYMP"],
-            "Gladiator Beast Gyzarus": ["GLAS", "RYMP"],
-            "Goyo Guardian": ["TDGS", "RYMP"],
-            "Honest": ["LODT", "RYMP"],
-            "Judgment Dragon": ["LODT", "RYMP"],
-            "Mezuki": ["CSOC", "RYMP"],
-            "Plaguespreader Zombie": ["CSOC", "RYMP"],
-            "Stardust Dragon": ["TDGS", "RYMP"],
-            "Thought Ruler Archfiend": ["TDGS", "RYMP"]
-        }
-        
-        # Set code patterns
-        self.set_code_pattern = re.compile(r'([A-Z]{2,4})-([A-Z]{2})(\d{3})')
-        
-        # Edition keywords
-        self.edition_keywords = {
-            "1st Edition": ["1st", "first edition", "初版", "初刷"],
-            "Unlimited": ["unlimited", "無制限", "再版", "再刷"]
-        }
-        
-        # Region keywords
-        self.region_keywords = {
-            "Asia": ["asia", "asian", "アジア", "アジア版"],
-            "English": ["english", "英", "英語版"],
-            "Japanese": ["japanese", "日", "日本語版"],
-            "Korean": ["korean", "韓", "韓国版"]
-        }
+        # Keyword tables are shared module constants
+        self.value_indicators = VALUE_INDICATORS
+        self.condition_keywords = CONDITION_KEYWORDS
+        self.rarity_keywords = RARITY_KEYWORDS
+        self.valuable_cards = VALUABLE_CARDS
+        self.edition_keywords = EDITION_KEYWORDS
+        self.region_keywords = REGION_KEYWORDS
+        self.set_code_pattern = SET_CODE_RE
 
     def analyze_card(self, item_data: Dict[str, Any], rank_analysis_results: Optional[Dict] = None, llm_analysis: Optional[Dict] = None) -> CardInfo:
         """
@@ -216,21 +359,22 @@ class CardAnalyzer:
             # 1. Basic Text Analysis
             title_lower = title.lower()
             description_lower = description.lower() if description else ""
+            text_lower = title_lower + " " + description_lower
             
             # Extract condition
-            card_info.condition = self._determine_condition(title_lower + " " + description_lower)
+            card_info.condition = self._determine_condition(text_lower)
             
             # Extract rarity
-            card_info.rarity = self._determine_rarity(title_lower + " " + description_lower)
+            card_info.rarity = self._determine_rarity(text_lower)
             
             # Extract set code and card number
-            card_info.set_code, card_info.card_number = self._extract_set_info(title_lower + " " + description_lower)
+            card_info.set_code, card_info.card_number = self._extract_set_info(text_lower)
             
             # Extract edition
-            card_info.edition = self._determine_edition(title_lower + " " + description_lower)
+            card_info.edition = self._determine_edition(text_lower)
             
             # Extract region
-            card_info.region = self._determine_region(title_lower + " " + description_lower)
+            card_info.region = self._determine_region(text_lower)
             
             # Check if card is valuable
             card_info.is_valuable = self._is_valuable_card(title_lower, card_info.set_code)
@@ -281,24 +425,17 @@ class CardAnalyzer:
         """Extract numeric price from text."""
         try:
             # Remove currency symbols and commas
-            cleaned = re.sub(r'[^\d.]', '', price_text)
-            return float(cleaned)
-        except (ValueError, TypeError):
+            return float(price_text.translate(PRICE_CHAR_TABLE))
+        except (ValueError, TypeError, AttributeError):
             return 0.0
 
     def _determine_condition(self, text: str) -> CardCondition:
-        """Determine card condition from text."""
-        for condition, keywords in self.condition_keywords.items():
-            if any(keyword.lower() in text.lower() for keyword in keywords):
-                return condition
-        return CardCondition.UNKNOWN
+        """Determine card condition from already-lowercased text."""
+        return _match_keywords(_CONDITION_MATCHER, text) or CardCondition.UNKNOWN
 
     def _determine_rarity(self, text: str) -> Optional[str]:
-        """Determine card rarity from text."""
-        for rarity, keywords in self.rarity_keywords.items():
-            if any(keyword.lower() in text.lower() for keyword in keywords):
-                return rarity
-        return None
+        """Determine card rarity from already-lowercased text."""
+        return _match_keywords(_RARITY_MATCHER, text)
 
     def _extract_set_info(self, text: str) -> Tuple[Optional[str], Optional[str]]:
         """Extract set code and card number from text."""
@@ -308,59 +445,30 @@ class CardAnalyzer:
         return None, None
 
     def _determine_edition(self, text: str) -> Optional[str]:
-        """Determine card edition from text."""
-        for edition, keywords in self.edition_keywords.items():
-            if any(keyword.lower() in text.lower() for keyword in keywords):
-                return edition
-        return None
+        """Determine card edition from already-lowercased text."""
+        return _match_keywords(_EDITION_MATCHER, text)
 
     def _determine_region(self, text: str) -> Optional[str]:
-        """Determine card region from text."""
-        for region, keywords in self.region_keywords.items():
-            if any(keyword.lower() in text.lower() for keyword in keywords):
-                return region
-        return None
-
-    def _is_valuable_card(self, title: str, set_code: Optional[str]) -> bool:
-        """Check if the card is valuable based on name and set code."""
-        title_lower = title.lower()
-        
+        """Determine card region from already-lowercased text."""
+        return _match_keywords(_REGION_MATCHER, text)
+
+    def _is_valuable_card(self, title_lower: str, set_code: Optional[str]) -> bool:
+        """Check if the card is valuable based on its lowercased title and set code."""
         # Log the analysis process
-        logger.debug(f"Analyzing card value for: {title}")
+        logger.debug("Analyzing card value for: %s", title_lower)
         
         # Check against known valuable cards
-        for card_name, valid_sets in self.valuable_cards.items():
-            if card_name.lower() in title_lower:
-                if not set_code or set_code in valid_sets:
-                    logger.debug(f"Card matched valuable card list: {card_name}")
-                    return True
-        
-        # Check for high rarity
-        high_rarities = ["Secret Rare", "Ultimate Rare", "Ghost Rare", "Collector's Rare", "Starlight Rare"]
-        for rarity in high_rarities:
-            if rarity.lower() in title_lower:
-                logger.debug(f"Card has high rarity: {rarity}")
+        for match in _VALUABLE_NAME_RE.finditer(title_lower):
+            card_name_lower = match.group(1)
+            if not set_code or set_code in _VALUABLE_SETS[card_name_lower]:
+                logger.debug(f"Card matched valuable card list: {_VALUABLE_NAMES[card_name_lower]}")
                 return True
         
-        # Check for 1st Edition
-        if any(keyword in title_lower for keyword in ["1st", "first edition", "初版", "初刷"]):
-            logger.debug("Card is 1st Edition")
-            return True
-            
-        # Check for sealed/unopened products
-        if any(keyword in title_lower for keyword in ["sealed", "未開封", "新品未開封"]):
-            logger.debug("Card is sealed/unopened")
-            return True
-            
-        # Check for tournament/event items
-        if any(keyword in title_lower for keyword in ["tournament", "event", "championship", "大会", "イベント"]):
-            logger.debug("Card is from tournament/event")
-            return True
-            
-        # Check for special editions
-        if any(keyword in title_lower for keyword in ["special", "limited", "promo", "限定", "特典"]):
-            logger.debug("Card is special/limited edition")
-            return True
+        # Check for high rarity, 1st Edition, sealed, tournament/event and special editions
+        for reason, keywords in VALUE_KEYWORD_CHECKS:
+            if any(keyword in title_lower for keyword in keywords):
+                logger.debug(reason)
+                return True
         
         logger.debug("Card did not meet any value criteria")
         return False
@@ -368,107 +476,70 @@ class CardAnalyzer:
     def _calculate_confidence_score(self, condition: CardCondition, rarity: Optional[str],
                                   set_code: Optional[str], card_number: Optional[str],
                                   edition: Optional[str], region: Optional[str]) -> float:
-        """Calculate confidence score based on available information."""
-        score = 0.0
-        total_factors = 0
-        
-        # Condition confidence
-        if condition != CardCondition.UNKNOWN:
-            score += 1.0
-        total_factors += 1
-        
-        # Rarity confidence
-        if rarity:
-            score += 1.0
-        total_factors += 1
-        
-        # Set code confidence
-        if set_code:
-            score += 1.0
-        total_factors += 1
-        
-        # Card number confidence
-        if card_number:
-            score += 1.0
-        total_factors += 1
-        
-        # Edition confidence
-        if edition:
-            score += 1.0
-        total_factors += 1
-        
-        # Region confidence
-        if region:
-            score += 1.0
-        total_factors += 1
+        """Calculate confidence score as the fraction of the six fields that were identified."""
+        known = (
+            (condition != CardCondition.UNKNOWN)
+            + bool(rarity)
+            + bool(set_code)
+            + bool(card_number)
+            + bool(edition)
+            + bool(region)
+        )
+        return known / 6.0
+
+    @staticmethod
+    def _ai_cache_key(title: str, description: str, price: float) -> bytes:
+        """Short, stable cache key for a listing's AI analysis."""
+        raw = f"{title}\0{description or ''}\0{price:.2f}".encode('utf-8')
+        return hashlib.blake2b(raw, digest_size=16).digest()
+
+    def _build_ai_messages(self, title: str, description: str, price: float) -> List[Dict[str, str]]:
+        """Build the chat messages for a listing's AI analysis."""
+        # Prepare analysis prompt
+        analysis_prompt = AI_PROMPT_TEMPLATE.format(title=title, description=description, price=price)
         
-        return score / total_factors if total_factors > 0 else 0.0
+        return [
+            {
+                "role": "system",
+                "content": AI_SYSTEM_PROMPT
+            },
+            {
+                "role": "user",
+                "content": analysis_prompt
+            }
+        ]
+
+    def _store_ai_analysis(self, cache_key: bytes, analysis: Dict[str, Any]) -> None:
+        """Cache an AI analysis, evicting the oldest entry when full."""
+        with self._ai_cache_lock:
+            if len(self.ai_cache) >= AI_CACHE_SIZE:
+                self.ai_cache.pop(next(iter(self.ai_cache)), None)
+            self.ai_cache[cache_key] = analysis
 
     def _perform_ai_analysis(self, title: str, description: str, price: float) -> Dict[str, Any]:
         """Perform AI analysis using OpenAI API."""
         if not self.openai_client:
             return {}
         
+        cache_key = self._ai_cache_key(title, description, price)
+        cached = self.ai_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Using cached AI analysis for %s", title)
+            return cached
+        
         try:
-            # Prepare analysis prompt
-            analysis_prompt = f"""
-            Analyze this Yu-Gi-Oh! card listing:
-            Title: {title}
-            Description: {description}
-            Current Price: ¥{price}
-            
-            Please provide a detailed analysis including:
-            1. Card identification (name, set, number if visible)
-            2. Condition assessment
-            3. Authenticity check
-            4. Value assessment based on recent eBay sales
-            5. Profit potential analysis
-            6. Recommendation (Buy/Pass)
-            
-            Format your response as JSON with these keys:
-            {{
-                "card_name": "string",
-                "set_code": "string",
-                "card_number": "string",
-                "condition": "string",
-                "authenticity": "string",
-                "value_assessment": {{
-                    "min_value": float,
-                    "max_value": float,
-                    "confidence": float
-                }},
-                "profit_potential": {{
-                    "estimated_profit": float,
-                    "risk_level": "string",
-                    "confidence": float
-                }},
-                "recommendation": {{
-                    "action": "string",
-                    "reasoning": "string",
-                    "confidence": float
-                }}
-            }}
-            """
-            
             # Call OpenAI API
             response = self.openai_client.chat.completions.create(
-                model="gpt-4-turbo",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert Yu-Gi-Oh! card evaluator with deep knowledge of card values, conditions, and market trends."
-                    },
-                    {
-                        "role": "user",
-                        "content": analysis_prompt
-                    }
-                ],
+                model=AI_MODEL,
+                messages=self._build_ai_messages(title, description, price),
                 response_format={"type": "json_object"}
             )
             
-            # Parse AI response
-            return json.loads(response.choices[0].message.content)
+            # Parse AI response and cache it
+            analysis = json.loads(response.choices[0].message.content)
+            self._store_ai_analysis(cache_key, analysis)
+            return analysis
             
         except Exception as e:
             logger.error(f"Error in AI analysis: {str(e)}")
-            return {} 
\ No newline at end of file
+            return {}
@@ -12,19 +12,11 @@ import json
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
-# Import custom modules
-from core_engine import CoreEngine
-from bookmark_manager import BookmarkManager
+from logging_setup import setup_logging
+
+# core_engine and bookmark_manager are imported inside the commands that use them,
+# so config/watchlist/--help don't pay for Selenium and the scraper stack
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
-    handlers=[
-        logging.FileHandler('arbitrage_bot.log'),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
 def parse_args():
@@ -32,7 +24,7 @@ def parse_args():
     parser = argparse.ArgumentParser(description='Yu-Gi-Oh Card Arbitrage Bot')
     
     # Main commands
-    parser.add_argument('command', choices=['search', 'analyze', 'watchlist', 'export', 'config'],
+    parser.add_argument('command', choices=list(COMMANDS),
                         help='Command to execute')
     
     # Search options
@@ -88,8 +80,39 @@ def save_config(config: Dict[str, Any]) -> None:
     except Exception as e:
         logger.error(f"Error saving config: {str(e)}")
 
+def _format_listing(index: int, listing: Dict[str, Any]) -> str:
+    """Format one profitable listing for the search report."""
+    profit_analysis = listing.get('profit_analysis', {})
+    return (
+        f"{index + 1}. {listing.get('title', 'Unknown')}\n"
+        f"   Buyee Price: ¥{listing.get('price', 0):,.0f}\n"
+        f"   eBay Price: ${profit_analysis.get('ebay_price', 0):,.2f}\n"
+        f"   Profit: ${profit_analysis.get('profit', 0):,.2f}\n"
+        f"   ROI: {profit_analysis.get('roi', 0):.2f}x\n"
+        f"   URL: {listing.get('url', '')}\n"
+        "\n"
+    )
+
+def _format_watchlist_item(index: int, item: Dict[str, Any]) -> str:
+    """Format one watchlist entry for the watchlist report."""
+    profit_analysis = item.get('profit_analysis', {})
+    return (
+        f"{index + 1}. {item.get('title', 'Unknown')}\n"
+        f"   ID: {item.get('auction_id', 'Unknown')}\n"
+        f"   Price: ¥{item.get('price', 0):,.0f}\n"
+        f"   ROI: {profit_analysis.get('roi', 0):.2f}x\n"
+        f"   URL: {item.get('url', '')}\n"
+        "\n"
+    )
+
 def command_search(args, config: Dict[str, Any]) -> None:
     """Execute search command."""
+    from core_engine import CoreEngine
+    from buyee_scraper import install_maintenance_wake_handler
+    
+    # Let SIGUSR1 cut maintenance waits short during the search
+    install_maintenance_wake_handler()
+    
     # Update config with command line arguments
     config.update({
         'output_dir': args.output_dir,
@@ -107,19 +130,14 @@ def command_search(args, config: Dict[str, Any]) -> None:
     profitable_listings = engine.run_workflow(search_terms)
     
     # Print results
-    print(f"\nFound {len(profitable_listings)} profitable listings:")
-    for i, listing in enumerate(profitable_listings):
-        profit_analysis = listing.get('profit_analysis', {})
-        print(f"{i+1}. {listing.get('title', 'Unknown')}")
-        print(f"   Buyee Price: ¥{listing.get('price', 0):,.0f}")
-        print(f"   eBay Price: ${profit_analysis.get('ebay_price', 0):,.2f}")
-        print(f"   Profit: ${profit_analysis.get('profit', 0):,.2f}")
-        print(f"   ROI: {profit_analysis.get('roi', 0):.2f}x")
-        print(f"   URL: {listing.get('url', '')}")
-        print()
+    # Build the whole report and write it once rather than printing line by line
+    sys.stdout.write(f"\nFound {len(profitable_listings)} profitable listings:\n"
+                     + "".join(_format_listing(i, listing) for i, listing in enumerate(profitable_listings)))
 
 def command_analyze(args, config: Dict[str, Any]) -> None:
     """Execute analyze command."""
+    from core_engine import CoreEngine
+    
     if not args.terms:
         print("Please provide at least one URL to analyze using --terms")
         return
@@ -164,36 +182,42 @@ def command_analyze(args, config: Dict[str, Any]) -> None:
                 args.include_grading
             )
             
-            # Print analysis
-            print(f"\nTitle: {listing.get('title', 'Unknown')}")
-            print(f"Price: ¥{listing.get('price', 0):,.0f}")
-            print(f"Condition: {listing.get('condition', 'Unknown')}")
+            # Print analysis as one write
+            lines = [
+                f"\nTitle: {listing.get('title', 'Unknown')}\n"
+                f"Price: ¥{listing.get('price', 0):,.0f}\n"
+                f"Condition: {listing.get('condition', 'Unknown')}\n"
+            ]
             
             if card_info:
-                print(f"\nCard Information:")
-                print(f"Name: {card_info.name}")
-                print(f"Set: {card_info.set_name}")
-                print(f"Set Code: {card_info.set_code}")
-                print(f"Rarity: {card_info.rarity}")
-            
-            print(f"\nPrice Analysis:")
-            print(f"Raw Card Median: ${price_data.get('raw_median', 0):,.2f}")
-            print(f"PSA 9 Median: ${price_data.get('psa_9_median', 0):,.2f}")
-            print(f"PSA 10 Median: ${price_data.get('psa_10_median', 0):,.2f}")
-            print(f"Total Sales: {price_data.get('total_sales', 0)}")
+                lines.append(
+                    "\nCard Information:\n"
+                    f"Name: {card_info.name}\n"
+                    f"Set: {card_info.set_name}\n"
+                    f"Set Code: {card_info.set_code}\n"
+                    f"Rarity: {card_info.rarity}\n"
+                )
             
-            print(f"\nProfit Analysis:")
-            print(f"Total Cost: ${profit_analysis.get('total_cost_usd', 0):,.2f}")
-            print(f"Net Revenue: ${profit_analysis.get('net_revenue_usd', 0):,.2f}")
-            print(f"Profit: ${profit_analysis.get('profit', 0):,.2f}")
-            print(f"ROI: {profit_analysis.get('roi', 0):.2f}x")
-            print(f"Profit Margin: {profit_analysis.get('profit_margin', 0):.1f}%")
+            lines.append(
+                "\nPrice Analysis:\n"
+                f"Raw Card Median: ${price_data.get('raw_median', 0):,.2f}\n"
+                f"PSA 9 Median: ${price_data.get('psa_9_median', 0):,.2f}\n"
+                f"PSA 10 Median: ${price_data.get('psa_10_median', 0):,.2f}\n"
+                f"Total Sales: {price_data.get('total_sales', 0)}\n"
+                "\nProfit Analysis:\n"
+                f"Total Cost: ${profit_analysis.get('total_cost_usd', 0):,.2f}\n"
+                f"Net Revenue: ${profit_analysis.get('net_revenue_usd', 0):,.2f}\n"
+                f"Profit: ${profit_analysis.get('profit', 0):,.2f}\n"
+                f"ROI: {profit_analysis.get('roi', 0):.2f}x\n"
+                f"Profit Margin: {profit_analysis.get('profit_margin', 0):.1f}%\n"
+            )
             
             # Check if it meets profit threshold
             if profit_analysis.get('meets_threshold', False):
-                print("\n✅ This listing meets the profit threshold!")
+                lines.append("\n✅ This listing meets the profit threshold!\n")
             else:
-                print("\n❌ This listing does not meet the profit threshold")
+                lines.append("\n❌ This listing does not meet the profit threshold\n")
+            sys.stdout.write("".join(lines))
             
         except Exception as e:
             logger.error(f"Error analyzing {url}: {str(e)}", exc_info=True)
@@ -201,6 +225,8 @@ def command_analyze(args, config: Dict[str, Any]) -> None:
 
 def command_watchlist(args, config: Dict[str, Any]) -> None:
     """Execute watchlist command."""
+    from bookmark_manager import BookmarkManager
+    
     # Initialize BookmarkManager
     bookmark_manager = BookmarkManager(output_dir=args.output_dir)
     
@@ -227,18 +253,13 @@ def command_watchlist(args, config: Dict[str, Any]) -> None:
         print(f"Auction {args.list_id} not found in watchlist")
     else:
         # Show all watchlist items
-        print(f"\nWatchlist ({len(watchlist)} items):")
-        for i, item in enumerate(watchlist):
-            profit_analysis = item.get('profit_analysis', {})
-            print(f"{i+1}. {item.get('title', 'Unknown')}")
-            print(f"   ID: {item.get('auction_id', 'Unknown')}")
-            print(f"   Price: ¥{item.get('price', 0):,.0f}")
-            print(f"   ROI: {profit_analysis.get('roi', 0):.2f}x")
-            print(f"   URL: {item.get('url', '')}")
-            print()
+        sys.stdout.write(f"\nWatchlist ({len(watchlist)} items):\n"
+                         + "".join(_format_watchlist_item(i, item) for i, item in enumerate(watchlist)))
 
 def command_export(args, config: Dict[str, Any]) -> None:
     """Execute export command."""
+    from bookmark_manager import BookmarkManager
+    
     # Check if ZenMarket credentials are set
     if not config.get('zenmarket_credentials', {}).get('email') or not config.get('zenmarket_credentials', {}).get('password'):
         print("ZenMarket credentials not set. Use 'config --set-zenmarket --email EMAIL --password PASSWORD' to set them.")
@@ -305,37 +326,40 @@ def command_config(args, config: Dict[str, Any]) -> None:
     
     else:
         # Show current config
-        print("\nCurrent Configuration:")
+        lines = ["\nCurrent Configuration:"]
         for key, value in config.items():
             if key == 'zenmarket_credentials':
-                print(f"ZenMarket Email: {value.get('email', 'Not set')}")
-                print(f"ZenMarket Password: {'*****' if value.get('password') else 'Not set'}")
+                lines.append(f"ZenMarket Email: {value.get('email', 'Not set')}")
+                lines.append(f"ZenMarket Password: {'*****' if value.get('password') else 'Not set'}")
             elif key == 'currency_conversion':
-                print(f"Currency Conversion:")
-                for rate_key, rate_value in value.items():
-                    print(f"  {rate_key}: {rate_value}")
+                lines.append("Currency Conversion:")
+                lines.extend(f"  {rate_key}: {rate_value}" for rate_key, rate_value in value.items())
             else:
-                print(f"{key}: {value}")
+                lines.append(f"{key}: {value}")
+        print("\n".join(lines))
+
+# Handlers for each CLI command; the keys are the choices accepted by parse_args
+COMMANDS = {
+    'search': command_search,
+    'analyze': command_analyze,
+    'watchlist': command_watchlist,
+    'export': command_export,
+    'config': command_config,
+}
 
 def main():
     """Main entry point."""
     # Parse command line arguments
     args = parse_args()
     
+    # Set up logging (after parsing, so --help and usage errors skip it)
+    setup_logging()
+    
     # Load configuration
     config = load_config()
     
     # Execute command
-    if args.command == 'search':
-        command_search(args, config)
-    elif args.command == 'analyze':
-        command_analyze(args, config)
-    elif args.command == 'watchlist':
-        command_watchlist(args, config)
-    elif args.command == 'export':
-        command_export(args, config)
-    elif args.command == 'config':
-        command_config(args, config)
+    COMMANDS[args.command](args, config)
 
 if __name__ == "__main__":
     main()
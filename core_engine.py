@@ -6,12 +6,19 @@ on Buyee.jp, comparing with eBay sold prices, and facilitating the purchase proc
 """
 
 import os
+import csv
 import logging
-import time
 import json
+import queue
+import shelve
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import fields
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
-import pandas as pd
+from enum import Enum
+from typing import Callable, Dict, List, Optional, Any, Tuple
 
 # Import custom modules
 from buyee_scraper import BuyeeScraper
@@ -21,19 +28,98 @@ from rank_analyzer import RankAnalyzer, CardCondition
 from price_comparator import PriceComparator
 from profit_calculator import ProfitCalculator
 from bookmark_manager import BookmarkManager
+from scraper_utils import RateLimiter
 from search_terms import SEARCH_TERMS
+from logging_setup import setup_logging
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
-    handlers=[
-        logging.FileHandler('arbitrage_bot.log'),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
+# Columns of the profitable listings CSV
+PROFITABLE_CSV_FIELDS = ['Title', 'Buyee Price (JPY)', 'eBay Price (USD)', 'Profit (USD)', 'ROI', 'Condition', 'URL']
+
+# eBay price multipliers by (condition, is_damaged): (PSA 9 multiplier, raw multiplier).
+# The PSA 9 price is used only when the multiplier is set and there are enough PSA 9 sales.
+EBAY_PRICE_RULES = {
+    # Could potentially grade PSA 9: 70% of PSA 9 price (accounting for grading costs/risk),
+    # otherwise a 20% premium for excellent condition
+    (CardCondition.MINT, False): (0.7, 1.2),
+    (CardCondition.NEAR_MINT, False): (0.7, 1.2),
+    # Standard raw price
+    (CardCondition.EXCELLENT, False): (None, 1.0),
+    (CardCondition.VERY_GOOD, False): (None, 1.0),
+}
+
+# Damaged or poor condition: 30% discount
+DEFAULT_EBAY_PRICE_RULE = (None, 0.7)
+
+# CSV text for each condition, so rows skip Enum.__str__
+_CONDITION_CSV_TEXT = {condition: str(condition) for condition in CardCondition}
+
+# CardInfo is flat, so a field read avoids the recursive copy done by dataclasses.asdict
+_CARD_INFO_FIELDS = tuple(f.name for f in fields(CardInfo))
+
+def _card_info_to_dict(card_info: CardInfo) -> Dict[str, Any]:
+    """
+    Convert a CardInfo into a JSON-serializable dictionary.
+    
+    Args:
+        card_info (CardInfo): Card analysis result.
+    
+    Returns:
+        Dict[str, Any]: Card fields, with the condition enum replaced by its value.
+    """
+    data = {name: getattr(card_info, name) for name in _CARD_INFO_FIELDS}
+    if isinstance(data['condition'], Enum):
+        data['condition'] = data['condition'].value
+    return data
+
+def _write_json_file(path: str, data: Any) -> None:
+    """
+    Write data to a JSON file.
+    
+    Args:
+        path (str): Output file path.
+        data (Any): JSON-serializable data.
+    """
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+def _write_profitable_csv(path: str, listings: List[Dict[str, Any]]) -> None:
+    """
+    Write the profitable listings CSV.
+    
+    Args:
+        path (str): Output file path.
+        listings (List[Dict[str, Any]]): Listings with their profit analysis.
+    """
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=PROFITABLE_CSV_FIELDS)
+        writer.writeheader()
+        writer.writerows(_profitable_csv_row(listing) for listing in listings)
+
+def _profitable_csv_row(listing: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the profitable listings CSV row for a listing.
+    
+    Args:
+        listing (Dict[str, Any]): Listing with its profit analysis.
+    
+    Returns:
+        Dict[str, Any]: Row keyed by PROFITABLE_CSV_FIELDS.
+    """
+    profit_analysis = listing.get('profit_analysis', {})
+    condition = listing.get('condition_analysis', {}).get('condition', '')
+    condition_text = _CONDITION_CSV_TEXT.get(condition)
+    return {
+        'Title': listing.get('title', ''),
+        'Buyee Price (JPY)': listing.get('price', 0),
+        'eBay Price (USD)': profit_analysis.get('ebay_price', 0),
+        'Profit (USD)': profit_analysis.get('profit', 0),
+        'ROI': profit_analysis.get('roi', 0),
+        'Condition': condition_text if condition_text is not None else str(condition),
+        'URL': listing.get('url', '')
+    }
+
 class CoreEngine:
     """
     Core Engine class that orchestrates the entire workflow for the Yu-Gi-Oh Card Arbitrage Bot.
@@ -53,7 +139,17 @@ class CoreEngine:
             'headless': True,
             'min_profit_ratio': 2.0,  # 2x profit threshold
             'max_listings_per_search': 20,
+            'search_workers': 1,  # Browsers searching in parallel; each extra worker starts its own
+            'search_interval': 2.0,  # Minimum seconds between search starts, across all workers
+            'analyze_workers': 1,  # Listings analyzed in parallel; detail pages use the same scraper pool
+            'analyze_interval': 1.0,  # Minimum seconds between detail page fetches, across all workers
+            'buyee_burst': 1,  # Buyee requests allowed back to back before the intervals above apply
             'save_debug_info': True,
+            'price_cache_ttl': 24 * 3600,  # Seconds sold prices are reused, across runs
+            'price_workers': 4,  # Cards whose sold prices are fetched in parallel
+            'price_interval': 2.0,  # Minimum seconds between 130point requests, across all workers
+            'skip_seen_listings': False,  # Skip listings already analyzed by an earlier run
+            'analysis_cache_ttl': 7 * 24 * 3600,  # Seconds an unchanged listing's analysis is reused
             'currency_conversion': {
                 'JPY_to_USD': 0.0067  # Example rate, should be updated dynamically
             }
@@ -75,7 +171,12 @@ class CoreEngine:
         self.card_analyzer = CardAnalyzer()
         self.image_analyzer = ImageAnalyzer()
         self.rank_analyzer = RankAnalyzer()
-        self.price_comparator = PriceComparator()
+        self.price_comparator = PriceComparator(
+            cache_file=os.path.join(self.config['output_dir'], 'price_cache.json'),
+            cache_ttl=self.config['price_cache_ttl'],
+            max_workers=self.config['price_workers'],
+            request_interval=self.config['price_interval']
+        )
         self.profit_calculator = ProfitCalculator(
             currency_conversion=self.config['currency_conversion']
         )
@@ -83,7 +184,27 @@ class CoreEngine:
             output_dir=self.config['output_dir']
         )
         
-        # Results storage
+        # Paces searches across however many workers are running them
+        self._search_rate = RateLimiter(min_interval=self.config['search_interval'], burst=self.config['buyee_burst'])
+        self._analyze_rate = RateLimiter(min_interval=self.config['analyze_interval'], burst=self.config['buyee_burst'])
+        
+        # URLs analyzed by earlier runs, one per line; only used with skip_seen_listings
+        self.seen_urls_file = os.path.join(self.config['output_dir'], 'seen_urls.txt')
+        self.seen_urls = self._load_seen_urls() if self.config['skip_seen_listings'] else set()
+        
+        # Analyses of earlier runs keyed by a hash of the listing's URL and content, so
+        # unchanged listings skip the card/image/condition analysis; shelve keeps enum
+        # values intact. Closed at the end of run_workflow.
+        self._analysis_cache_lock = threading.Lock()
+        try:
+            self._analysis_cache = shelve.open(os.path.join(self.config['output_dir'], 'analysis_cache'))
+        except Exception as e:
+            logger.warning("Analysis cache unavailable: %s", str(e))
+            self._analysis_cache = None
+        
+        # Results storage; profitable listings are also streamed to files stamped with
+        # results_timestamp as they are found
+        self.results_timestamp = None
         self.search_results = []
         self.analyzed_listings = []
         self.profitable_listings = []
@@ -139,6 +260,9 @@ class CoreEngine:
             logger.error("Error in workflow execution: %s", str(e), exc_info=True)
             print(f"\n❌ Error in workflow execution: {str(e)}")
             return []
+        
+        finally:
+            self._close_analysis_cache()
     
     def search_listings(self, search_terms: List[str]) -> List[Dict[str, Any]]:
         """
@@ -153,38 +277,30 @@ class CoreEngine:
         all_listings = []
         
         try:
-            for i, term in enumerate(search_terms, 1):
-                print(f"\nSearching term {i}/{len(search_terms)}: {term}")
-                
-                # Use BuyeeScraper to search
-                listings = self.buyee_scraper.search(term)
-                
-                # Filter by popularity
-                popular_listings = self.buyee_scraper.filter_by_popularity(listings)
-                
-                # Limit results per search term
-                limited_listings = popular_listings[:self.config['max_listings_per_search']]
-                
-                print(f"Found {len(listings)} listings, filtered to {len(limited_listings)} popular listings")
-                
-                all_listings.extend(limited_listings)
-                
-                # Add a delay between searches
-                if i < len(search_terms):
-                    print("Waiting before next search...")
-                    time.sleep(2)
+            total = len(search_terms)
+            
+            def search_one(scraper: BuyeeScraper, index: int, term: str) -> List[Dict[str, Any]]:
+                self._search_rate.wait()
+                print(f"\nSearching term {index}/{total}: {term}")
+                return self._search_term(scraper, term)
             
-            # Remove duplicates based on URL
-            unique_listings = []
-            seen_urls = set()
+            results = self._map_with_scrapers(search_one, list(enumerate(search_terms, 1)), self.config['search_workers'])
+            for term_listings in results:
+                all_listings.extend(term_listings)
             
+            # Remove duplicates based on URL, keeping the first listing for each URL
+            listings_by_url = {}
             for listing in all_listings:
-                if listing['url'] not in seen_urls:
-                    seen_urls.add(listing['url'])
-                    unique_listings.append(listing)
+                listings_by_url.setdefault(listing['url'], listing)
+            unique_listings = list(listings_by_url.values())
             
             print(f"\nRemoved {len(all_listings) - len(unique_listings)} duplicate listings")
             
+            if self.seen_urls:
+                new_listings = [listing for listing in unique_listings if listing['url'] not in self.seen_urls]
+                print(f"Skipped {len(unique_listings) - len(new_listings)} listings analyzed in earlier runs")
+                unique_listings = new_listings
+            
             return unique_listings
             
         except Exception as e:
@@ -192,6 +308,198 @@ class CoreEngine:
             print(f"\n❌ Error searching listings: {str(e)}")
             return []
     
+    def _load_seen_urls(self) -> set:
+        """
+        Load the URLs analyzed by earlier runs.
+        
+        Returns:
+            set: Seen listing URLs; empty if none have been recorded yet.
+        """
+        try:
+            with open(self.seen_urls_file, 'r', encoding='utf-8') as f:
+                return {line.rstrip('\n') for line in f if line.strip()}
+        except FileNotFoundError:
+            return set()
+        except Exception as e:
+            logger.warning("Could not load seen URLs from %s: %s", self.seen_urls_file, str(e))
+            return set()
+    
+    def _record_seen_urls(self, urls: List[str]) -> None:
+        """
+        Append newly analyzed listing URLs to the seen-URLs file.
+        
+        Args:
+            urls (List[str]): URLs of listings analyzed in this run.
+        """
+        new_urls = [url for url in urls if url not in self.seen_urls]
+        if not new_urls:
+            return
+        
+        try:
+            with open(self.seen_urls_file, 'a', encoding='utf-8') as f:
+                f.writelines(url + '\n' for url in new_urls)
+            self.seen_urls.update(new_urls)
+        except Exception as e:
+            logger.warning("Could not record seen URLs in %s: %s", self.seen_urls_file, str(e))
+    
+    @staticmethod
+    def _listing_content_key(detailed_listing: Dict[str, Any]) -> str:
+        """
+        Hash the listing's URL and the parts of it the analyses depend on.
+        
+        Args:
+            detailed_listing (Dict[str, Any]): Listing details from the scraper.
+        
+        Returns:
+            str: Hex digest that changes whenever the URL, title, price, description,
+                condition or images change.
+        """
+        content = "\0".join((
+            str(detailed_listing.get('url', '')),
+            str(detailed_listing.get('title', '')),
+            str(detailed_listing.get('price', '')),
+            str(detailed_listing.get('description', '')),
+            str(detailed_listing.get('condition', '')),
+            str(detailed_listing.get('image_url', '')),
+            "\0".join(sorted(detailed_listing.get('image_urls') or []))
+        ))
+        return hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _get_cached_analysis(self, content_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Return stored analyses for unchanged listing content, if still fresh.
+        
+        Args:
+            content_key (str): Key from _listing_content_key.
+        
+        Returns:
+            Optional[Dict[str, Any]]: The card_info, image_analysis and condition_analysis
+                entries, or None on a miss.
+        """
+        if self._analysis_cache is None:
+            return None
+        
+        try:
+            with self._analysis_cache_lock:
+                entry = self._analysis_cache.get(content_key)
+        except Exception as e:
+            logger.warning("Could not read analysis cache: %s", str(e))
+            return None
+        
+        if entry and time.time() - entry['analyzed_at'] < self.config['analysis_cache_ttl']:
+            return entry['analysis']
+        return None
+    
+    def _store_cached_analysis(self, content_key: str, analysis: Dict[str, Any]) -> None:
+        """
+        Store a listing's analyses for reuse by later runs.
+        
+        Args:
+            content_key (str): Key from _listing_content_key.
+            analysis (Dict[str, Any]): The card_info, image_analysis and condition_analysis entries.
+        """
+        if self._analysis_cache is None:
+            return
+        
+        try:
+            with self._analysis_cache_lock:
+                self._analysis_cache[content_key] = {'analyzed_at': time.time(), 'analysis': analysis}
+                self._analysis_cache.sync()
+        except Exception as e:
+            logger.warning("Could not write analysis cache: %s", str(e))
+    
+    def _close_analysis_cache(self) -> None:
+        """Close the analysis cache; later lookups miss and nothing more is stored."""
+        with self._analysis_cache_lock:
+            cache, self._analysis_cache = self._analysis_cache, None
+        
+        if cache is None:
+            return
+        
+        try:
+            cache.close()
+        except Exception as e:
+            logger.warning("Could not close analysis cache: %s", str(e))
+    
+    def _search_term(self, scraper: BuyeeScraper, term: str) -> List[Dict[str, Any]]:
+        """
+        Search one term and keep its most popular listings.
+        
+        Args:
+            scraper (BuyeeScraper): Scraper to run the search with.
+            term (str): Search term.
+        
+        Returns:
+            List[Dict[str, Any]]: Up to max_listings_per_search popular listings.
+        """
+        try:
+            # Use BuyeeScraper to search
+            listings = scraper.search(term)
+            
+            # Filter by popularity
+            popular_listings = scraper.filter_by_popularity(listings)
+            
+            # Limit results per search term
+            limited_listings = popular_listings[:self.config['max_listings_per_search']]
+            
+            print(f"Found {len(listings)} listings for {term}, filtered to {len(limited_listings)} popular listings")
+            return limited_listings
+            
+        except Exception as e:
+            logger.error("Error searching term %s: %s", term, str(e), exc_info=True)
+            print(f"❌ Error searching {term}: {str(e)}")
+            return []
+    
+    def _map_with_scrapers(self, func: Callable[..., Any], tasks: List[Tuple], workers: int) -> List[Any]:
+        """
+        Run func(scraper, *task) for every task, on up to `workers` threads.
+        
+        A Selenium driver can't be shared between threads, so each running task
+        borrows a scraper from a pool: the engine's own scraper first, then extra
+        ones started on demand and closed when all tasks are done.
+        
+        Args:
+            func (Callable[..., Any]): Function taking a scraper followed by the task's arguments.
+            tasks (List[Tuple]): Argument tuples, one per call.
+            workers (int): Maximum number of concurrent calls.
+        
+        Returns:
+            List[Any]: Results in task order.
+        """
+        if workers <= 1 or len(tasks) <= 1:
+            return [func(self.buyee_scraper, *task) for task in tasks]
+        
+        pool = queue.Queue()
+        pool.put(self.buyee_scraper)
+        extra_scrapers = []
+        
+        def run(task: Tuple) -> Any:
+            try:
+                scraper = pool.get_nowait()
+            except queue.Empty:
+                try:
+                    scraper = BuyeeScraper(
+                        output_dir=self.config['output_dir'],
+                        max_pages=self.config['max_pages'],
+                        headless=self.config['headless']
+                    )
+                    extra_scrapers.append(scraper)
+                except Exception as e:
+                    # Couldn't start another browser; wait for a running one instead
+                    logger.warning("Could not start an extra scraper: %s", str(e))
+                    scraper = pool.get()
+            try:
+                return func(scraper, *task)
+            finally:
+                pool.put(scraper)
+        
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(run, tasks))
+        finally:
+            for scraper in extra_scrapers:
+                scraper.close()
+    
     def analyze_listings(self, listings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Analyze listings to extract detailed information.
@@ -202,55 +510,14 @@ class CoreEngine:
         Returns:
             List[Dict[str, Any]]: List of analyzed listings.
         """
-        analyzed_listings = []
-        
         try:
             total = len(listings)
-            for i, listing in enumerate(listings, 1):
-                print(f"\nAnalyzing listing {i}/{total}: {listing.get('title', 'Unknown')}")
-                
-                try:
-                    # Get detailed listing information
-                    detailed_listing = self.buyee_scraper.get_listing_details(listing['url'])
-                    
-                    if not detailed_listing:
-                        print(f"❌ Could not get details for listing: {listing['url']}")
-                        continue
-                    
-                    # Analyze card information
-                    card_info = self.card_analyzer.analyze_card(detailed_listing)
-                    
-                    # Analyze images if available
-                    image_analysis = None
-                    if detailed_listing.get('image_urls'):
-                        image_analysis = self.image_analyzer.analyze_image(detailed_listing['image_urls'])
-                    
-                    # Analyze condition from description
-                    condition_analysis = self.rank_analyzer.analyze_condition(
-                        detailed_listing.get('description', ''),
-                        detailed_listing.get('condition', '')
-                    )
-                    
-                    # Combine all analyses
-                    analyzed_listing = {
-                        **detailed_listing,
-                        'card_info': card_info.__dict__ if card_info else None,
-                        'image_analysis': image_analysis,
-                        'condition_analysis': condition_analysis
-                    }
-                    
-                    analyzed_listings.append(analyzed_listing)
-                    print("✅ Analysis complete")
-                    
-                    # Add a delay between analyses
-                    if i < total:
-                        print("Waiting before next analysis...")
-                        time.sleep(1)
-                    
-                except Exception as e:
-                    logger.error("Error analyzing listing %s: %s", listing.get('url', 'Unknown'), str(e))
-                    print(f"❌ Error analyzing listing: {str(e)}")
-                    continue
+            tasks = [(i, total, listing) for i, listing in enumerate(listings, 1)]
+            results = self._map_with_scrapers(self._analyze_listing, tasks, self.config['analyze_workers'])
+            analyzed_listings = [analyzed_listing for analyzed_listing in results if analyzed_listing]
+            
+            if self.config['skip_seen_listings']:
+                self._record_seen_urls([listing['url'] for listing, result in zip(listings, results) if result])
             
             return analyzed_listings
             
@@ -259,6 +526,70 @@ class CoreEngine:
             print(f"\n❌ Error in analyze_listings: {str(e)}")
             return []
     
+    def _analyze_listing(self, scraper: BuyeeScraper, index: int, total: int,
+                         listing: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Fetch one listing's details and run the card, image and condition analyses.
+        
+        Args:
+            scraper (BuyeeScraper): Scraper to fetch the detail page with.
+            index (int): 1-based position of the listing, for progress output.
+            total (int): Number of listings being analyzed.
+            listing (Dict[str, Any]): Listing from the search results.
+        
+        Returns:
+            Optional[Dict[str, Any]]: Analyzed listing, or None if it could not be analyzed.
+        """
+        try:
+            # Space out detail page fetches across all workers
+            self._analyze_rate.wait()
+            print(f"\nAnalyzing listing {index}/{total}: {listing.get('title', 'Unknown')}")
+            
+            # Get detailed listing information
+            detailed_listing = scraper.get_listing_details(listing['url'])
+            
+            if not detailed_listing:
+                print(f"❌ Could not get details for listing: {listing['url']}")
+                return None
+            
+            # Reuse the previous analysis if the listing hasn't changed
+            content_key = self._listing_content_key(detailed_listing)
+            cached_analysis = self._get_cached_analysis(content_key)
+            if cached_analysis is not None:
+                print(f"✅ Listing unchanged, reusing analysis: {listing.get('title', 'Unknown')}")
+                return {**detailed_listing, **cached_analysis}
+            
+            # Analyze card information
+            card_info = self.card_analyzer.analyze_card(detailed_listing)
+            
+            # Analyze images if available
+            image_analysis = None
+            if detailed_listing.get('image_urls'):
+                image_analysis = self.image_analyzer.analyze_image(detailed_listing['image_urls'])
+            
+            # Analyze condition from description
+            condition_analysis = self.rank_analyzer.analyze_condition(
+                detailed_listing.get('description', ''),
+                detailed_listing.get('condition', '')
+            )
+            
+            print(f"✅ Analysis complete: {listing.get('title', 'Unknown')}")
+            
+            # Combine all analyses; only the analyses are cached, the listing itself is
+            # always the freshly fetched one
+            analysis = {
+                'card_info': _card_info_to_dict(card_info) if card_info else None,
+                'image_analysis': image_analysis,
+                'condition_analysis': condition_analysis
+            }
+            self._store_cached_analysis(content_key, analysis)
+            return {**detailed_listing, **analysis}
+            
+        except Exception as e:
+            logger.error("Error analyzing listing %s: %s", listing.get('url', 'Unknown'), str(e))
+            print(f"❌ Error analyzing listing: {str(e)}")
+            return None
+    
     def find_profitable_listings(self, analyzed_listings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Find profitable listings by comparing prices and calculating profit.
@@ -271,29 +602,40 @@ class CoreEngine:
         """
         profitable_listings = []
         
+        # Profitable listings are appended to a JSONL file and the CSV as soon as they are
+        # found, so a long run that dies part-way still leaves its results on disk
+        self.results_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        stream_base = os.path.join(self.config['output_dir'], f"profitable_listings_{self.results_timestamp}")
+        jsonl_file = csv_file = csv_writer = None
+        
+        # Loop invariants
+        calculate_profit = self.profit_calculator.calculate_profit
+        include_grading = self.config.get('include_grading', False)
+        
         try:
+            # Fetch price data per (card name, set code) up front and in parallel, so listings of
+            # the same card share one lookup in this run, including lookups that found nothing
+            price_keys = [self._price_key(listing) for listing in analyzed_listings]
+            print(f"\nFetching sold prices for {len(set(price_keys))} cards")
+            price_lookups = self.price_comparator.get_sold_prices_batch(price_keys)
+            
             total = len(analyzed_listings)
-            for i, listing in enumerate(analyzed_listings, 1):
+            for i, (listing, price_key) in enumerate(zip(analyzed_listings, price_keys), 1):
                 print(f"\nChecking profitability {i}/{total}: {listing.get('title', 'Unknown')}")
                 
                 try:
-                    # Get card info
-                    card_info = listing.get('card_info', {})
-                    card_name = card_info.get('name') if card_info else listing.get('title', '')
-                    set_code = card_info.get('set_code') if card_info else None
-                    
                     # Get price data
-                    price_data = self.price_comparator.get_sold_prices(card_name, set_code)
+                    price_data = price_lookups.get(price_key)
                     
                     if not price_data:
                         print("❌ Could not fetch price data")
                         continue
                     
                     # Calculate profit
-                    profit_analysis = self.profit_calculator.calculate_profit(
+                    profit_analysis = calculate_profit(
                         listing.get('price', 0),
                         price_data.get('raw_median', 0),
-                        self.config.get('include_grading', False)
+                        include_grading
                     )
                     
                     # Add profit analysis to listing
@@ -302,15 +644,20 @@ class CoreEngine:
                     # Check if it meets profit threshold
                     if profit_analysis.get('meets_threshold', False):
                         profitable_listings.append(listing)
+                        
+                        if jsonl_file is None:
+                            jsonl_file = open(stream_base + '.jsonl', 'w', encoding='utf-8')
+                            csv_file = open(stream_base + '.csv', 'w', newline='', encoding='utf-8')
+                            csv_writer = csv.DictWriter(csv_file, fieldnames=PROFITABLE_CSV_FIELDS)
+                            csv_writer.writeheader()
+                        jsonl_file.write(json.dumps(listing, ensure_ascii=False, default=str) + '\n')
+                        jsonl_file.flush()
+                        csv_writer.writerow(_profitable_csv_row(listing))
+                        csv_file.flush()
                         print(f"✅ Profitable! ROI: {profit_analysis.get('roi', 0):.2f}x")
                     else:
                         print(f"❌ Not profitable. ROI: {profit_analysis.get('roi', 0):.2f}x")
                     
-                    # Add a delay between checks
-                    if i < total:
-                        print("Waiting before next check...")
-                        time.sleep(1)
-                    
                 except Exception as e:
                     logger.error("Error checking profitability for listing %s: %s", 
                                listing.get('url', 'Unknown'), str(e))
@@ -323,6 +670,27 @@ class CoreEngine:
             logger.error("Error in find_profitable_listings: %s", str(e), exc_info=True)
             print(f"\n❌ Error in find_profitable_listings: {str(e)}")
             return []
+        
+        finally:
+            if jsonl_file is not None:
+                jsonl_file.close()
+                csv_file.close()
+    
+    @staticmethod
+    def _price_key(listing: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+        """
+        Get the card a listing's sold prices are looked up by.
+        
+        Args:
+            listing (Dict[str, Any]): Analyzed listing.
+        
+        Returns:
+            Tuple[str, Optional[str]]: Card name and set code.
+        """
+        card_info = listing.get('card_info', {})
+        card_name = card_info.get('name') if card_info else listing.get('title', '')
+        set_code = card_info.get('set_code') if card_info else None
+        return card_name, set_code
     
     def _determine_ebay_price(self, listing: Dict[str, Any], price_data: Dict[str, Any]) -> float:
         """
@@ -350,20 +718,12 @@ class CoreEngine:
             is_damaged = listing['image_analysis']['is_damaged']
         
         # Determine price based on condition
-        if condition in [CardCondition.MINT, CardCondition.NEAR_MINT] and not is_damaged:
-            # If in excellent condition, could potentially grade PSA 9
-            if price_data.get('psa_9_avg') and price_data.get('psa_9_count', 0) > 2:
-                ebay_price = price_data['psa_9_avg'] * 0.7  # 70% of PSA 9 price (accounting for grading costs/risk)
-            elif price_data.get('raw_avg'):
-                ebay_price = price_data['raw_avg'] * 1.2  # 20% premium for excellent condition
-        elif condition in [CardCondition.EXCELLENT, CardCondition.VERY_GOOD] and not is_damaged:
-            # Standard raw price
-            if price_data.get('raw_avg'):
-                ebay_price = price_data['raw_avg']
-        else:
-            # Damaged or poor condition
-            if price_data.get('raw_avg'):
-                ebay_price = price_data['raw_avg'] * 0.7  # 30% discount for poor condition
+        psa_9_multiplier, raw_multiplier = EBAY_PRICE_RULES.get((condition, bool(is_damaged)), DEFAULT_EBAY_PRICE_RULE)
+        
+        if psa_9_multiplier and price_data.get('psa_9_avg') and price_data.get('psa_9_count', 0) > 2:
+            ebay_price = price_data['psa_9_avg'] * psa_9_multiplier
+        elif ebay_price:
+            ebay_price = ebay_price * raw_multiplier
         
         return ebay_price
     
@@ -371,57 +731,51 @@ class CoreEngine:
         """
         Save results to files.
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Match the files streamed by find_profitable_listings
+        timestamp = self.results_timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+        
+        output_dir = self.config['output_dir']
         
         try:
+            # (description, path, writer, data) for each results file
+            writes = []
+            
             # Save all listings
             if self.search_results:
-                all_listings_file = os.path.join(self.config['output_dir'], f"all_listings_{timestamp}.json")
-                with open(all_listings_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.search_results, f, ensure_ascii=False, indent=2)
-                logger.info("Saved all listings to %s", all_listings_file)
+                writes.append(("all listings", os.path.join(output_dir, f"all_listings_{timestamp}.json"),
+                               _write_json_file, self.search_results))
             
             # Save analyzed listings
             if self.analyzed_listings:
-                analyzed_file = os.path.join(self.config['output_dir'], f"analyzed_listings_{timestamp}.json")
-                with open(analyzed_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.analyzed_listings, f, ensure_ascii=False, indent=2)
-                logger.info("Saved analyzed listings to %s", analyzed_file)
+                writes.append(("analyzed listings", os.path.join(output_dir, f"analyzed_listings_{timestamp}.json"),
+                               _write_json_file, self.analyzed_listings))
             
             # Save profitable listings
             if self.profitable_listings:
-                profitable_file = os.path.join(self.config['output_dir'], f"profitable_listings_{timestamp}.json")
-                with open(profitable_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.profitable_listings, f, ensure_ascii=False, indent=2)
-                logger.info("Saved profitable listings to %s", profitable_file)
-                
-                # Create CSV for easy viewing
-                profitable_csv = os.path.join(self.config['output_dir'], f"profitable_listings_{timestamp}.csv")
-                
-                # Extract key information for CSV
-                csv_data = []
-                for listing in self.profitable_listings:
-                    row = {
-                        'Title': listing.get('title', ''),
-                        'Buyee Price (JPY)': listing.get('price', 0),
-                        'eBay Price (USD)': listing.get('profit_analysis', {}).get('ebay_price', 0),
-                        'Profit (USD)': listing.get('profit_analysis', {}).get('profit', 0),
-                        'ROI': listing.get('profit_analysis', {}).get('roi', 0),
-                        'Condition': str(listing.get('condition_analysis', {}).get('condition', '')),
-                        'URL': listing.get('url', '')
-                    }
-                    csv_data.append(row)
-                
-                # Save as CSV
-                df = pd.DataFrame(csv_data)
-                df.to_csv(profitable_csv, index=False)
-                logger.info("Saved profitable listings CSV to %s", profitable_csv)
+                writes.append(("profitable listings", os.path.join(output_dir, f"profitable_listings_{timestamp}.json"),
+                               _write_json_file, self.profitable_listings))
                 
+                # Create CSV for easy viewing, unless find_profitable_listings already streamed it
+                profitable_csv = os.path.join(output_dir, f"profitable_listings_{timestamp}.csv")
+                if not os.path.exists(profitable_csv):
+                    writes.append(("profitable listings CSV", profitable_csv,
+                                   _write_profitable_csv, self.profitable_listings))
+                else:
+                    logger.info("Saved profitable listings CSV to %s", profitable_csv)
+            
+            # Write the files concurrently so their disk waits overlap
+            if writes:
+                with ThreadPoolExecutor(max_workers=len(writes)) as executor:
+                    futures = [executor.submit(writer, path, data) for _, path, writer, data in writes]
+                    for (description, path, _, _), future in zip(writes, futures):
+                        future.result()
+                        logger.info("Saved %s to %s", description, path)
+            
+            if self.profitable_listings:
                 # Bookmark profitable listings
-                for listing in self.profitable_listings:
-                    self.bookmark_manager.save_auction(listing)
+                bookmarked = self.bookmark_manager.save_auctions(self.profitable_listings)
                 
-                logger.info("Bookmarked %d profitable listings", len(self.profitable_listings))
+                logger.info("Bookmarked %d profitable listings", bookmarked)
             
         except Exception as e:
             logger.error("Error saving results: %s", str(e), exc_info=True)
@@ -461,6 +815,8 @@ class CoreEngine:
 
 # Example usage
 if __name__ == "__main__":
+    setup_logging()
+    
     # Initialize Core Engine
     engine = CoreEngine()
     
@@ -0,0 +1,37 @@
+"""
+Logging Setup for Yu-Gi-Oh Card Arbitrage Bot
+
+This module configures logging once for the entry points (CLI and module examples);
+library modules only create their own loggers.
+"""
+
+import logging
+
+# Log file shared by the arbitrage bot modules
+LOG_FILE = 'arbitrage_bot.log'
+
+# Format of every log record
+LOG_FORMAT = '%(asctime)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s'
+
+def setup_logging(log_file: str = LOG_FILE, level: int = logging.INFO) -> None:
+    """
+    Configure the root logger to write to the log file and the console.
+
+    Does nothing if logging is already configured, without creating any handlers; the log
+    file is only created once something is logged.
+
+    Args:
+        log_file (str, optional): Log file path. Defaults to LOG_FILE.
+        level (int, optional): Logging level. Defaults to logging.INFO.
+    """
+    if logging.getLogger().handlers:
+        return
+
+    logging.basicConfig(
+        level=level,
+        format=LOG_FORMAT,
+        handlers=[
+            logging.FileHandler(log_file, delay=True),
+            logging.StreamHandler()
+        ]
+    )
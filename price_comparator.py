@@ -5,35 +5,116 @@ This module handles fetching and analyzing eBay/130point.com sold prices
 for Yu-Gi-Oh cards to determine market value.
 """
 
+import os
+import json
 import logging
 import time
 import random
 import re
+import math
 import statistics
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Any, Tuple
 import requests
-from bs4 import BeautifulSoup
-from urllib.parse import quote
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+from urllib.parse import quote_plus
+
+from scraper_utils import RateLimiter
+from logging_setup import setup_logging
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
-    handlers=[
-        logging.FileHandler('arbitrage_bot.log'),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
+# 130point sold listings search, formatted with the URL-encoded search term
+SALES_URL_TEMPLATE = "https://130point.com/sales/?item={}"
+
+# Only the sale entries of a 130point results page are read, so the rest of the page is never built into a tree
+SALE_ITEM_STRAINER = SoupStrainer('div', class_='sale-item')
+
+# Everything in a price except digits and the decimal point
+PRICE_STRIP_RE = re.compile(r'[^\d.]')
+
+# Condition keywords per sale category, in priority order ('mint' also matches 'near mint');
+# any other grading mention marks the sale as graded, and no match as raw
+SALE_CATEGORY_KEYWORDS = {
+    'psa_10': ('psa 10', 'gem mint'),
+    'psa_9': ('psa 9', 'mint'),
+    'bgs_95': ('bgs 9.5',),
+    'bgs_9': ('bgs 9',),
+    'graded': ('psa', 'bgs', 'cgc', 'graded'),
+}
+
+# All categories in one lookahead alternation, one named group per category, so the text is
+# scanned once; at a shared start position the higher-priority category (listed first) wins
+SALE_CATEGORY_RE = re.compile('(?=' + '|'.join(
+    f"(?P<{category}>" + '|'.join(re.escape(keyword) for keyword in keywords) + ")"
+    for category, keywords in SALE_CATEGORY_KEYWORDS.items()
+) + ')')
+
+def _sale_category(text: str) -> Optional[str]:
+    """Return the highest-priority sale category found in the lowercased text, or None if raw."""
+    highest = next(iter(SALE_CATEGORY_KEYWORDS))
+    found = set()
+    for match in SALE_CATEGORY_RE.finditer(text):
+        if match.lastgroup == highest:
+            return highest
+        found.add(match.lastgroup)
+    # SALE_CATEGORY_KEYWORDS is ordered by priority
+    return next((category for category in SALE_CATEGORY_KEYWORDS if category in found), None)
+
+# Rate-limited or blocked responses; retried through the shared rate limiter instead of the
+# session adapter, so one worker's retries cannot bypass the spacing the other workers keep
+RATE_LIMIT_STATUSES = (403, 429)
+
+# Backoff before each retry of a rate-limited request, unless Retry-After asks for longer
+RATE_LIMIT_BACKOFF = (2.0, 5.0)
+
+# Longest Retry-After honored, in seconds
+MAX_RETRY_AFTER = 60.0
+
+def _retry_after_seconds(response: requests.Response) -> float:
+    """
+    Get the wait a response's Retry-After header asks for.
+    
+    Args:
+        response (requests.Response): Rate-limited response.
+    
+    Returns:
+        float: Seconds to wait, capped at MAX_RETRY_AFTER; 0 if the header is absent or invalid.
+    """
+    value = response.headers.get('Retry-After')
+    if not value:
+        return 0.0
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return 0.0
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
 class PriceComparator:
     """
     Handles fetching and analyzing eBay/130point.com sold prices for Yu-Gi-Oh cards.
     """
     
-    def __init__(self):
+    def __init__(self, cache_file: Optional[str] = None, cache_ttl: float = 24 * 3600,
+                 max_workers: int = 4, request_interval: float = 2.0):
         """
         Initialize the PriceComparator.
+        
+        Args:
+            cache_file (Optional[str], optional): JSON file that keeps fetched prices across
+                runs. Defaults to None (memory-only cache).
+            cache_ttl (float, optional): Seconds a cached price stays valid. Defaults to 24 hours.
+            max_workers (int, optional): Cards looked up in parallel by get_sold_prices_batch. Defaults to 4.
+            request_interval (float, optional): Minimum seconds between 130point requests, across
+                all workers. Defaults to 2.0.
         """
         self.session = requests.Session()
         self.session.headers.update({
@@ -41,12 +122,29 @@ class PriceComparator:
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9',
         })
-        self.retry_delays = [1, 2, 5, 10]  # Exponential backoff delays
         self.max_retries = 3
         self.timeout = 10
         
-        # Cache for price data to avoid redundant requests
+        # One pooled connection per worker, so parallel lookups reuse keep-alive connections;
+        # urllib3 retries failed connections and server errors with exponential backoff
+        self.max_workers = max(1, max_workers)
+        retry = Retry(
+            total=self.max_retries - 1,
+            backoff_factor=1.0,
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=['GET'],
+            raise_on_status=False
+        )
+        self.session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers, max_retries=retry))
+        self.rate_limiter = RateLimiter(min_interval=request_interval)
+        
+        # Cache for price data to avoid redundant requests, with when each entry was fetched
         self.price_cache = {}
+        self.price_cache_times = {}
+        self.cache_file = cache_file
+        self.cache_ttl = cache_ttl
+        self._cache_lock = threading.Lock()
+        self._load_price_cache()
         
         logger.info("PriceComparator initialized")
     
@@ -65,20 +163,24 @@ class PriceComparator:
         cache_key = f"{card_name}_{set_code}" if set_code else card_name
         
         # Check cache first
-        if cache_key in self.price_cache:
-            logger.info("Using cached price data for %s", cache_key)
-            return self.price_cache[cache_key]
+        with self._cache_lock:
+            if cache_key in self.price_cache:
+                if time.time() - self.price_cache_times.get(cache_key, 0) < self.cache_ttl:
+                    logger.info("Using cached price data for %s", cache_key)
+                    return self.price_cache[cache_key]
+                del self.price_cache[cache_key]
         
         try:
             # Prepare search term
             search_term = f"{card_name} {set_code}" if set_code else card_name
-            search_term = quote(search_term)
-            url = f"https://130point.com/sales/?item={search_term}"
+            search_term = quote_plus(search_term)
+            url = SALES_URL_TEMPLATE.format(search_term)
             
             logger.info("Fetching sold prices for %s from 130point.com", search_term)
             
-            # Add random delay to avoid rate limiting
-            time.sleep(random.uniform(2, 4))
+            # Space requests across workers, plus a random delay to avoid rate limiting
+            self.rate_limiter.wait()
+            time.sleep(random.uniform(0, 2))
             
             # Fetch the page
             html_content = self._get_page(url)
@@ -87,7 +189,7 @@ class PriceComparator:
                 return None
             
             # Parse the page
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, 'lxml', parse_only=SALE_ITEM_STRAINER)
             
             # Initialize price lists
             raw_prices = []
@@ -96,6 +198,14 @@ class PriceComparator:
             bgs_9_prices = []
             bgs_95_prices = []
             
+            # Price list per sale category; graded sales outside these categories are dropped
+            category_prices = {
+                'psa_10': psa_10_prices,
+                'psa_9': psa_9_prices,
+                'bgs_95': bgs_95_prices,
+                'bgs_9': bgs_9_prices,
+            }
+            
             # Find all sale items
             sales = soup.find_all('div', class_='sale-item')
             logger.info("Found %d sales for %s", len(sales), search_term)
@@ -116,22 +226,16 @@ class PriceComparator:
                     title = title_elem.text.strip().lower() if title_elem else ""
                     condition = condition_elem.text.strip().lower() if condition_elem else ""
                     
-                    # Combine title and condition for analysis
-                    full_text = f"{title} {condition}".lower()
+                    # Combine title and condition for analysis (both already lowercased)
+                    full_text = f"{title} {condition}"
                     
                     # Categorize based on condition
-                    if 'psa 10' in full_text or 'gem mint' in full_text:
-                        psa_10_prices.append(price)
-                    elif 'psa 9' in full_text or 'mint' in full_text:
-                        psa_9_prices.append(price)
-                    elif 'bgs 9.5' in full_text:
-                        bgs_95_prices.append(price)
-                    elif 'bgs 9' in full_text:
-                        bgs_9_prices.append(price)
-                    else:
-                        # Check if it's a raw card (ungraded)
-                        if not any(term in full_text for term in ['psa', 'bgs', 'cgc', 'graded']):
-                            raw_prices.append(price)
+                    category = _sale_category(full_text)
+                    if category is None:
+                        # Raw card (ungraded)
+                        raw_prices.append(price)
+                    elif category in category_prices:
+                        category_prices[category].append(price)
                     
                 except (ValueError, AttributeError) as e:
                     logger.warning("Error parsing sale entry: %s", str(e))
@@ -171,7 +275,10 @@ class PriceComparator:
                 price_data['sell_through_rate'] = 'Low'
             
             # Cache the results
-            self.price_cache[cache_key] = price_data
+            with self._cache_lock:
+                self.price_cache[cache_key] = price_data
+                self.price_cache_times[cache_key] = time.time()
+                self._save_price_cache()
             
             logger.info("Successfully fetched price data for %s: %d total sales", 
                        search_term, price_data['total_sales'])
@@ -182,6 +289,74 @@ class PriceComparator:
             logger.error("Error getting sold prices for %s: %s", card_name, str(e), exc_info=True)
             return None
     
+    def get_sold_prices_batch(self, cards: List[Tuple[str, Optional[str]]]) -> Dict[Tuple[str, Optional[str]], Optional[Dict[str, Any]]]:
+        """
+        Get sold prices for several cards, looking them up in parallel.
+        
+        Args:
+            cards (List[Tuple[str, Optional[str]]]): (card name, set code) pairs; duplicates are
+                looked up once.
+        
+        Returns:
+            Dict[Tuple[str, Optional[str]], Optional[Dict[str, Any]]]: Price data (or None if not
+                found) for each (card name, set code) pair.
+        """
+        unique_cards = list(dict.fromkeys(cards))
+        results = {}
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(unique_cards)) or 1) as executor:
+            futures = {
+                executor.submit(self.get_sold_prices, card_name, set_code): (card_name, set_code)
+                for card_name, set_code in unique_cards
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        
+        return results
+    
+    def _load_price_cache(self) -> None:
+        """
+        Load unexpired prices saved by earlier runs from the cache file.
+        """
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return
+        
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+            
+            now = time.time()
+            for cache_key, entry in entries.items():
+                if now - entry['fetched_at'] < self.cache_ttl:
+                    self.price_cache[cache_key] = entry['data']
+                    self.price_cache_times[cache_key] = entry['fetched_at']
+            
+            logger.info("Loaded %d cached prices from %s", len(self.price_cache), self.cache_file)
+            
+        except Exception as e:
+            logger.warning("Could not load price cache %s: %s", self.cache_file, str(e))
+    
+    def _save_price_cache(self) -> None:
+        """
+        Write the cached prices to the cache file, replacing it atomically.
+        """
+        if not self.cache_file:
+            return
+        
+        try:
+            entries = {
+                cache_key: {'fetched_at': self.price_cache_times[cache_key], 'data': data}
+                for cache_key, data in self.price_cache.items()
+                if cache_key in self.price_cache_times
+            }
+            tmp_file = self.cache_file + '.tmp'
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(entries, f, ensure_ascii=False)
+            os.replace(tmp_file, self.cache_file)
+            
+        except Exception as e:
+            logger.warning("Could not save price cache %s: %s", self.cache_file, str(e))
+    
     def get_ebay_sold_prices(self, card_name: str, set_code: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Get sold prices directly from eBay (alternative to 130point.com).
@@ -198,87 +373,68 @@ class PriceComparator:
         logger.warning("Direct eBay scraping not implemented, using 130point.com instead")
         return self.get_sold_prices(card_name, set_code)
     
-    def _get_page(self, url: str) -> Optional[str]:
+    def _get_page(self, url: str) -> Optional[bytes]:
         """
-        Get page content with retry logic.
+        Get page content; the session's adapter retries connection errors, timeouts and 5xx
+        responses, and 403/429 responses are retried here through the shared rate limiter.
         
         Args:
             url (str): URL to fetch.
         
         Returns:
-            Optional[str]: Page content or None if failed.
+            Optional[bytes]: Raw page content, left for the parser to decode, or None if failed.
         """
-        last_error = None
-        
-        for retry in range(self.max_retries):
-            try:
-                # Add random delay between retries
-                if retry > 0:
-                    delay = self.retry_delays[min(retry - 1, len(self.retry_delays) - 1)]
-                    delay += random.uniform(0, 2)  # Add jitter
-                    logger.info("Retry %d/%d: Waiting %.2f seconds...", retry + 1, self.max_retries, delay)
-                    time.sleep(delay)
-                
+        try:
+            for attempt in range(self.max_retries):
                 # Make request with timeout
-                response = self.session.get(url, timeout=self.timeout)
-                
-                # Handle common error cases
-                if response.status_code == 404:
-                    logger.warning("Page not found (404): %s", url)
-                    return None
-                
-                if response.status_code in [403, 429]:
-                    logger.warning("Rate limiting or access denied (HTTP %d)", response.status_code)
-                    if retry < self.max_retries - 1:
-                        continue
-                    return None
-                
-                if response.status_code >= 500:
-                    logger.warning("Server error (HTTP %d)", response.status_code)
-                    if retry < self.max_retries - 1:
-                        continue
-                    return None
-                
-                # Raise for any other HTTP errors
-                response.raise_for_status()
+                try:
+                    response = self.session.get(url, timeout=self.timeout)
+                except requests.ProxyError:
+                    logger.error("Proxy error, trying direct connection")
+                    self.session.proxies = {}  # Clear proxies
+                    response = self.session.get(url, timeout=self.timeout)
                 
-                # Verify content type
-                content_type = response.headers.get('content-type', '').lower()
-                if 'text/html' not in content_type and 'application/json' not in content_type:
-                    logger.warning("Unexpected content type: %s", content_type)
-                    if retry < self.max_retries - 1:
-                        continue
-                    return None
+                if response.status_code not in RATE_LIMIT_STATUSES:
+                    break
                 
-                # Verify content length
-                content_length = len(response.content)
-                if content_length < 100:  # Arbitrary minimum length
-                    logger.warning("Response too short (%d bytes)", content_length)
-                    if retry < self.max_retries - 1:
-                        continue
+                logger.warning("Rate limiting or access denied (HTTP %d)", response.status_code)
+                if attempt == self.max_retries - 1:
                     return None
                 
-                return response.text
-                
-            except requests.RequestException as e:
-                last_error = e
-                logger.error("Error fetching %s (attempt %d/%d): %s", 
-                           url, retry + 1, self.max_retries, str(e))
-                
-                # Check if it's a connection error
-                if isinstance(e, (requests.ConnectionError, requests.Timeout)):
-                    if retry < self.max_retries - 1:
-                        continue
-                
-                # Check if it's a proxy error
-                if isinstance(e, requests.ProxyError):
-                    logger.error("Proxy error, trying direct connection")
-                    self.session.proxies = {}  # Clear proxies
-                    if retry < self.max_retries - 1:
-                        continue
-        
-        logger.error("Max retries reached for %s. Last error: %s", url, str(last_error))
-        return None
+                # Hold back every worker for the Retry-After (or backoff), then retry in turn
+                backoff = RATE_LIMIT_BACKOFF[min(attempt, len(RATE_LIMIT_BACKOFF) - 1)]
+                self.rate_limiter.pause(max(_retry_after_seconds(response), backoff))
+                self.rate_limiter.wait()
+            
+            # Handle common error cases
+            if response.status_code == 404:
+                logger.warning("Page not found (404): %s", url)
+                return None
+            
+            if response.status_code >= 500:
+                logger.warning("Server error (HTTP %d)", response.status_code)
+                return None
+            
+            # Raise for any other HTTP errors
+            response.raise_for_status()
+            
+            # Verify content type
+            content_type = response.headers.get('content-type', '').lower()
+            if 'text/html' not in content_type and 'application/json' not in content_type:
+                logger.warning("Unexpected content type: %s", content_type)
+                return None
+            
+            # Verify content length
+            content_length = len(response.content)
+            if content_length < 100:  # Arbitrary minimum length
+                logger.warning("Response too short (%d bytes)", content_length)
+                return None
+            
+            return response.content
+            
+        except requests.RequestException as e:
+            logger.error("Error fetching %s after %d attempts: %s", url, self.max_retries, str(e))
+            return None
     
     def _clean_price(self, price_text: str) -> float:
         """
@@ -292,7 +448,7 @@ class PriceComparator:
         """
         try:
             # Remove currency symbols, commas, and convert to float
-            cleaned = re.sub(r'[^\d.]', '', price_text)
+            cleaned = PRICE_STRIP_RE.sub('', price_text)
             return float(cleaned)
         except (ValueError, TypeError):
             logger.warning("Could not parse price: %s", price_text)
@@ -312,16 +468,18 @@ class PriceComparator:
             return None
         
         # Remove outliers (values more than 2 standard deviations from the mean)
+        # fmean/fsum work in floats; statistics.mean/stdev use exact fractions and are far slower
         if len(prices) >= 5:
-            mean = statistics.mean(prices)
-            stdev = statistics.stdev(prices) if len(prices) > 1 else 0
-            filtered_prices = [p for p in prices if abs(p - mean) <= 2 * stdev]
+            mean = statistics.fmean(prices)
+            stdev = math.sqrt(math.fsum((p - mean) ** 2 for p in prices) / (len(prices) - 1))
+            limit = 2 * stdev
+            filtered_prices = [p for p in prices if abs(p - mean) <= limit]
             
             # Only use filtered prices if we didn't filter too many
             if len(filtered_prices) >= len(prices) * 0.7:
                 prices = filtered_prices
         
-        return statistics.mean(prices)
+        return statistics.fmean(prices)
     
     def _calculate_median(self, prices: List[float]) -> Optional[float]:
         """
@@ -339,6 +497,8 @@ class PriceComparator:
 
 # Example usage
 if __name__ == "__main__":
+    setup_logging()
+    
     # Example card to test
     card_name = "Blue-Eyes White Dragon"
     set_code = "SDK"
@@ -8,17 +8,13 @@ by comparing Buyee prices with eBay sold prices and accounting for all fees.
 import logging
 from typing import Dict, Any, Optional
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
-    handlers=[
-        logging.FileHandler('arbitrage_bot.log'),
-        logging.StreamHandler()
-    ]
-)
+from logging_setup import setup_logging
+
 logger = logging.getLogger(__name__)
 
+# Maximum number of profit analyses remembered per calculator
+PROFIT_CACHE_SIZE = 8192
+
 class ProfitCalculator:
     """
     Handles calculating potential profit margins for Yu-Gi-Oh cards.
@@ -67,6 +63,12 @@ class ProfitCalculator:
             }
         }
         
+        # Profit analyses by (buyee_price, ebay_price, include_grading, grading_service);
+        # cleared whenever the currency rates change
+        self._profit_cache = {}
+        
+        self._update_fee_constants()
+        
         logger.info("ProfitCalculator initialized with currency conversion rates: %s", self.currency_conversion)
     
     def calculate_profit(self, buyee_price: float, ebay_price: float, 
@@ -84,92 +86,137 @@ class ProfitCalculator:
             Dict[str, Any]: Profit analysis.
         """
         try:
-            # Convert Buyee price to USD
-            buyee_price_usd = buyee_price * self.currency_conversion['JPY_to_USD']
-            
-            # Calculate Buyee fees
-            buyee_service_fee = buyee_price * self.fees['buyee']['service_fee_percent']
-            buyee_payment_fee = buyee_price * self.fees['buyee']['payment_fee_percent']
-            
-            # Calculate shipping and handling fees (in JPY)
-            shipping_fees_jpy = (
-                self.fees['buyee']['shipping_domestic'] + 
-                self.fees['buyee']['consolidation'] + 
-                self.fees['buyee']['international_shipping']
-            )
-            
-            # Convert shipping fees to USD
-            shipping_fees_usd = shipping_fees_jpy * self.currency_conversion['JPY_to_USD']
-            
-            # Calculate total cost in USD
-            total_cost_usd = buyee_price_usd + (buyee_service_fee + buyee_payment_fee) * self.currency_conversion['JPY_to_USD'] + shipping_fees_usd
-            
-            # Add grading costs if applicable
-            grading_cost = 0
-            if include_grading:
-                if grading_service == 'psa_standard':
-                    grading_cost = self.fees['grading']['psa_standard']
-                elif grading_service == 'psa_express':
-                    grading_cost = self.fees['grading']['psa_express']
-                elif grading_service == 'bgs_standard':
-                    grading_cost = self.fees['grading']['bgs_standard']
-                elif grading_service == 'bgs_express':
-                    grading_cost = self.fees['grading']['bgs_express']
-                else:
-                    # Default to PSA standard
-                    grading_cost = self.fees['grading']['psa_standard']
-                
-                total_cost_usd += grading_cost
-            
-            # Calculate eBay selling fees
-            ebay_selling_fee = ebay_price * self.fees['ebay']['selling_fee_percent']
-            ebay_payment_fee = ebay_price * self.fees['ebay']['payment_fee_percent'] + self.fees['ebay']['payment_fee_fixed']
-            
-            # Calculate net revenue from eBay sale
-            net_revenue_usd = ebay_price - ebay_selling_fee - ebay_payment_fee
-            
-            # Calculate profit
-            profit_usd = net_revenue_usd - total_cost_usd
-            
-            # Calculate ROI (Return on Investment)
-            roi = net_revenue_usd / total_cost_usd if total_cost_usd > 0 else 0
-            
-            # Calculate profit margin percentage
-            profit_margin = (profit_usd / ebay_price) * 100 if ebay_price > 0 else 0
-            
-            # Prepare detailed analysis
-            analysis = {
-                'buyee_price_jpy': buyee_price,
-                'buyee_price_usd': buyee_price_usd,
-                'buyee_fees_jpy': buyee_service_fee + buyee_payment_fee,
-                'buyee_fees_usd': (buyee_service_fee + buyee_payment_fee) * self.currency_conversion['JPY_to_USD'],
-                'shipping_fees_jpy': shipping_fees_jpy,
-                'shipping_fees_usd': shipping_fees_usd,
-                'grading_cost_usd': grading_cost,
-                'total_cost_usd': total_cost_usd,
-                'ebay_price': ebay_price,
-                'ebay_fees': ebay_selling_fee + ebay_payment_fee,
-                'net_revenue_usd': net_revenue_usd,
-                'profit': profit_usd,
-                'roi': roi,
-                'profit_margin': profit_margin,
-                'is_profitable': profit_usd > 0,
-                'meets_threshold': roi >= 2.0  # 2x ROI threshold
-            }
+            cache_key = (buyee_price, ebay_price, include_grading, grading_service)
+            analysis = self._profit_cache.get(cache_key)
+            if analysis is None:
+                analysis = self._compute_profit(buyee_price, ebay_price, include_grading, grading_service)
+                if len(self._profit_cache) >= PROFIT_CACHE_SIZE:
+                    self._profit_cache.pop(next(iter(self._profit_cache)), None)
+                self._profit_cache[cache_key] = analysis
             
             logger.info("Profit analysis: Buyee ¥%.2f (%.2f USD) → eBay $%.2f, Profit: $%.2f, ROI: %.2fx", 
-                       buyee_price, buyee_price_usd, ebay_price, profit_usd, roi)
+                       buyee_price, analysis['buyee_price_usd'], ebay_price, analysis['profit'], analysis['roi'])
             
-            return analysis
+            # Callers may add to the analysis, so they get their own copy
+            return dict(analysis)
             
         except Exception as e:
-            logger.error("Error calculating profit: %s", str(e), exc_info=True)
+            # Tracebacks only at DEBUG: formatting one per failed call stalls batch scans
+            logger.error("Error calculating profit: %s", str(e))
+            logger.debug("Profit calculation traceback", exc_info=True)
             return {
                 'error': str(e),
                 'is_profitable': False,
                 'meets_threshold': False
             }
     
+    def _update_fee_constants(self) -> None:
+        """
+        Flatten the currency rate and fees used by every profit calculation into attributes.
+        
+        Call again after changing self.fees or self.currency_conversion directly.
+        """
+        buyee_fees = self.fees['buyee']
+        ebay_fees = self.fees['ebay']
+        
+        self._jpy_to_usd = self.currency_conversion['JPY_to_USD']
+        self._buyee_service_fee_percent = buyee_fees['service_fee_percent']
+        self._buyee_payment_fee_percent = buyee_fees['payment_fee_percent']
+        self._shipping_fees_jpy = (
+            buyee_fees['shipping_domestic'] + 
+            buyee_fees['consolidation'] + 
+            buyee_fees['international_shipping']
+        )
+        self._shipping_fees_usd = self._shipping_fees_jpy * self._jpy_to_usd
+        self._ebay_selling_fee_percent = ebay_fees['selling_fee_percent']
+        self._ebay_payment_fee_percent = ebay_fees['payment_fee_percent']
+        self._ebay_payment_fee_fixed = ebay_fees['payment_fee_fixed']
+        
+        self._profit_cache.clear()
+    
+    def _grading_cost(self, grading_service: Optional[str]) -> float:
+        """
+        Get the cost of a grading service, defaulting to PSA standard.
+        
+        Args:
+            grading_service (Optional[str]): Grading service to use.
+        
+        Returns:
+            float: Grading cost in USD.
+        """
+        grading_fees = self.fees['grading']
+        return grading_fees.get(grading_service, grading_fees['psa_standard'])
+    
+    def _compute_profit(self, buyee_price: float, ebay_price: float,
+                        include_grading: bool, grading_service: Optional[str]) -> Dict[str, Any]:
+        """
+        Compute the profit analysis behind calculate_profit.
+        
+        Args:
+            buyee_price (float): Price on Buyee in JPY.
+            ebay_price (float): Sold price on eBay in USD.
+            include_grading (bool): Whether to include grading costs.
+            grading_service (Optional[str]): Grading service to use.
+        
+        Returns:
+            Dict[str, Any]: Profit analysis.
+        """
+        jpy_to_usd = self._jpy_to_usd
+        
+        # Convert Buyee price to USD
+        buyee_price_usd = buyee_price * jpy_to_usd
+        
+        # Calculate Buyee fees
+        buyee_fees_jpy = buyee_price * self._buyee_service_fee_percent + buyee_price * self._buyee_payment_fee_percent
+        buyee_fees_usd = buyee_fees_jpy * jpy_to_usd
+        
+        # Calculate total cost in USD, with shipping and handling fees
+        total_cost_usd = buyee_price_usd + buyee_fees_usd + self._shipping_fees_usd
+        
+        # Add grading costs if applicable
+        grading_cost = 0
+        if include_grading:
+            grading_cost = self._grading_cost(grading_service)
+            total_cost_usd += grading_cost
+        
+        # Calculate eBay selling fees
+        ebay_selling_fee = ebay_price * self._ebay_selling_fee_percent
+        ebay_payment_fee = ebay_price * self._ebay_payment_fee_percent + self._ebay_payment_fee_fixed
+        
+        # Calculate net revenue from eBay sale
+        net_revenue_usd = ebay_price - ebay_selling_fee - ebay_payment_fee
+        
+        # Calculate profit
+        profit_usd = net_revenue_usd - total_cost_usd
+        
+        # Calculate ROI (Return on Investment)
+        roi = net_revenue_usd / total_cost_usd if total_cost_usd > 0 else 0
+        
+        # Calculate profit margin percentage
+        profit_margin = (profit_usd / ebay_price) * 100 if ebay_price > 0 else 0
+        
+        # Prepare detailed analysis
+        analysis = {
+            'buyee_price_jpy': buyee_price,
+            'buyee_price_usd': buyee_price_usd,
+            'buyee_fees_jpy': buyee_fees_jpy,
+            'buyee_fees_usd': buyee_fees_usd,
+            'shipping_fees_jpy': self._shipping_fees_jpy,
+            'shipping_fees_usd': self._shipping_fees_usd,
+            'grading_cost_usd': grading_cost,
+            'total_cost_usd': total_cost_usd,
+            'ebay_price': ebay_price,
+            'ebay_fees': ebay_selling_fee + ebay_payment_fee,
+            'net_revenue_usd': net_revenue_usd,
+            'profit': profit_usd,
+            'roi': roi,
+            'profit_margin': profit_margin,
+            'is_profitable': profit_usd > 0,
+            'meets_threshold': roi >= 2.0  # 2x ROI threshold
+        }
+        
+        return analysis
+    
     def update_currency_rates(self, rates: Dict[str, float]) -> None:
         """
         Update currency conversion rates.
@@ -178,6 +225,7 @@ class ProfitCalculator:
             rates (Dict[str, float]): New currency conversion rates.
         """
         self.currency_conversion.update(rates)
+        self._update_fee_constants()
         logger.info("Updated currency conversion rates: %s", self.currency_conversion)
     
     def estimate_grading_roi(self, raw_price: float, graded_price: float, 
@@ -195,22 +243,11 @@ class ProfitCalculator:
         """
         try:
             # Get grading cost
-            grading_cost = 0
-            if grading_service == 'psa_standard':
-                grading_cost = self.fees['grading']['psa_standard']
-            elif grading_service == 'psa_express':
-                grading_cost = self.fees['grading']['psa_express']
-            elif grading_service == 'bgs_standard':
-                grading_cost = self.fees['grading']['bgs_standard']
-            elif grading_service == 'bgs_express':
-                grading_cost = self.fees['grading']['bgs_express']
-            else:
-                # Default to PSA standard
-                grading_cost = self.fees['grading']['psa_standard']
+            grading_cost = self._grading_cost(grading_service)
             
             # Calculate eBay selling fees for graded card
-            ebay_selling_fee = graded_price * self.fees['ebay']['selling_fee_percent']
-            ebay_payment_fee = graded_price * self.fees['ebay']['payment_fee_percent'] + self.fees['ebay']['payment_fee_fixed']
+            ebay_selling_fee = graded_price * self._ebay_selling_fee_percent
+            ebay_payment_fee = graded_price * self._ebay_payment_fee_percent + self._ebay_payment_fee_fixed
             
             # Calculate net revenue from graded card sale
             net_revenue_usd = graded_price - ebay_selling_fee - ebay_payment_fee
@@ -245,7 +282,8 @@ class ProfitCalculator:
             return analysis
             
         except Exception as e:
-            logger.error("Error calculating grading ROI: %s", str(e), exc_info=True)
+            logger.error("Error calculating grading ROI: %s", str(e))
+            logger.debug("Grading ROI calculation traceback", exc_info=True)
             return {
                 'error': str(e),
                 'is_profitable': False,
@@ -254,6 +292,8 @@ class ProfitCalculator:
 
 # Example usage
 if __name__ == "__main__":
+    setup_logging()
+    
     # Initialize ProfitCalculator
     calculator = ProfitCalculator()
     
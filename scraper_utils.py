@@ -2,6 +2,7 @@ import requests
 from bs4 import BeautifulSoup
 import logging
 import time
+import threading
 import random
 from typing import Dict, List, Optional, Tuple, Any
 from urllib.parse import quote
@@ -102,6 +103,35 @@ class RequestHandler:
                     return None
         return None
 
+class RateLimiter:
+    """Token-bucket rate limiter, shared safely across threads.
+
+    Allows one call per min_interval on average, with up to `burst` calls back to back
+    after an idle period. With the default burst of 1 it simply spaces calls apart.
+    """
+
+    def __init__(self, min_interval: float, burst: int = 1):
+        self.min_interval = min_interval
+        self.burst = max(1, burst)
+        self._lock = threading.Lock()
+        self._next_allowed = 0.0
+
+    def wait(self) -> None:
+        """Sleep only if the call budget is used up."""
+        with self._lock:
+            now = time.monotonic()
+            scheduled = max(now, self._next_allowed)
+            delay = scheduled - (self.burst - 1) * self.min_interval - now
+            self._next_allowed = scheduled + self.min_interval
+        if delay > 0:
+            time.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """Hold every caller of wait() back for at least `seconds`, e.g. after a rate-limit response."""
+        with self._lock:
+            resume = time.monotonic() + seconds + (self.burst - 1) * self.min_interval
+            self._next_allowed = max(self._next_allowed, resume)
+
 class CardInfoExtractor:
     """Extracts and normalizes card information from titles."""
     
@@ -4,21 +4,27 @@ This script tests the robustness of the scraper with various error scenarios
 """
 
 import sys
-import time
+import atexit
 import logging
 import os
+import queue
 import random
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
 from buyee_scraper import BuyeeScraper
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
-    handlers=[
-        logging.FileHandler('test_scraper.log'),
-        logging.StreamHandler()
-    ]
-)
+# Set up logging: records are queued and written to the file and console by a background
+# thread, so logging never blocks the scraper on disk or terminal I/O. force replaces the
+# handlers buyee_scraper installed on import, which used to swallow this configuration.
+log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s')
+log_handlers = [logging.FileHandler('test_scraper.log'), logging.StreamHandler()]
+for log_handler in log_handlers:
+    log_handler.setFormatter(log_formatter)
+log_queue = queue.Queue(-1)
+log_listener = QueueListener(log_queue, *log_handlers)
+log_listener.start()
+atexit.register(log_listener.stop)  # Flushes queued records before exit
+logging.basicConfig(level=logging.INFO, format='%(message)s', handlers=[QueueHandler(log_queue)], force=True)
 logger = logging.getLogger(__name__)
 
 def test_basic_functionality():
@@ -41,30 +47,30 @@ def test_basic_functionality():
         
         # Test search
         search_term = "遊戯王 アジア"
-        logger.info(f"Testing search with term: {search_term}")
+        logger.info("Testing search with term: %s", search_term)
         results = scraper.search(search_term)
         
         if not results:
-            logger.warning(f"No results found for {search_term}")
+            logger.warning("No results found for %s", search_term)
             # This might be expected, so don't fail the test
         else:
-            logger.info(f"Found {len(results)} results for {search_term}")
+            logger.info("Found %d results for %s", len(results), search_term)
             
             # Test getting details for the first item
             if len(results) > 0:
                 first_item = results[0]
-                logger.info(f"Testing get_listing_details for: {first_item['title']}")
+                logger.info("Testing get_listing_details for: %s", first_item['title'])
                 details = scraper.get_listing_details(first_item['url'])
                 
                 if details:
-                    logger.info(f"Successfully retrieved details: {details.get('title')}")
+                    logger.info("Successfully retrieved details: %s", details.get('title'))
                 else:
                     logger.error("Failed to retrieve item details")
                     return False
         
         return True
     except Exception as e:
-        logger.error(f"Error in basic functionality test: {str(e)}", exc_info=True)
+        logger.error("Error in basic functionality test: %s", e, exc_info=True)
         return False
     finally:
         scraper.cleanup()
@@ -89,23 +95,23 @@ def test_error_recovery():
         
         # Test search with multiple pages to test pagination
         search_term = "遊戯王 dm1"
-        logger.info(f"Testing search with term: {search_term}")
+        logger.info("Testing search with term: %s", search_term)
         
         # Start the search
         results = scraper.search(search_term)
         
         if not results:
-            logger.warning(f"No results found for {search_term}")
+            logger.warning("No results found for %s", search_term)
             # Try another search term
             search_term = "遊戯王 カード"
-            logger.info(f"Trying another search term: {search_term}")
+            logger.info("Trying another search term: %s", search_term)
             results = scraper.search(search_term)
             
             if not results:
-                logger.warning(f"No results found for {search_term} either")
+                logger.warning("No results found for %s either", search_term)
                 # This might be expected, so don't fail the test
         
-        logger.info(f"Found {len(results)} results across multiple pages")
+        logger.info("Found %d results across multiple pages", len(results))
         
         # Test driver restart
         logger.info("Testing driver restart...")
@@ -119,18 +125,18 @@ def test_error_recovery():
         
         # Test search after restart
         search_term = "遊戯王 東映"
-        logger.info(f"Testing search after restart with term: {search_term}")
+        logger.info("Testing search after restart with term: %s", search_term)
         results = scraper.search(search_term)
         
         if results is not None:  # Even empty list is OK, just not None
-            logger.info(f"Search after restart returned {len(results)} results")
+            logger.info("Search after restart returned %d results", len(results))
         else:
             logger.error("Search after restart failed")
             return False
         
         return True
     except Exception as e:
-        logger.error(f"Error in error recovery test: {str(e)}", exc_info=True)
+        logger.error("Error in error recovery test: %s", e, exc_info=True)
         return False
     finally:
         scraper.cleanup()
@@ -156,7 +162,7 @@ def test_no_results_handling():
         # Test search with a term likely to have no results
         # Using a very specific and unlikely term
         search_term = "遊戯王 xyzあいうえお123456789"
-        logger.info(f"Testing search with unlikely term: {search_term}")
+        logger.info("Testing search with unlikely term: %s", search_term)
         results = scraper.search(search_term)
         
         # We expect no results
@@ -164,43 +170,44 @@ def test_no_results_handling():
             logger.info("Correctly handled no results case")
             return True
         else:
-            logger.warning(f"Unexpectedly found {len(results)} results for unlikely term")
+            logger.warning("Unexpectedly found %d results for unlikely term", len(results))
             # This is not necessarily a failure
             return True
     except Exception as e:
-        logger.error(f"Error in no results handling test: {str(e)}", exc_info=True)
+        logger.error("Error in no results handling test: %s", e, exc_info=True)
         return False
     finally:
         scraper.cleanup()
 
+# Test cases run by run_all_tests, by result name
+TESTS = {
+    "basic_functionality": test_basic_functionality,
+    "error_recovery": test_error_recovery,
+    "no_results_handling": test_no_results_handling
+}
+
 def run_all_tests():
     """Run all test cases and report results"""
     logger.info("Starting all tests...")
     
-    test_results = {
-        "basic_functionality": False,
-        "error_recovery": False,
-        "no_results_handling": False
-    }
+    test_results = {test_name: False for test_name in TESTS}
     
-    # Run tests
-    try:
-        test_results["basic_functionality"] = test_basic_functionality()
-        time.sleep(2)  # Brief pause between tests
-        
-        test_results["error_recovery"] = test_error_recovery()
-        time.sleep(2)  # Brief pause between tests
-        
-        test_results["no_results_handling"] = test_no_results_handling()
-    except Exception as e:
-        logger.error(f"Unexpected error during test execution: {str(e)}", exc_info=True)
+    # Run tests concurrently; each owns its scraper, browser and output directory, so the
+    # browser start-ups and page loads overlap instead of adding up
+    with ThreadPoolExecutor(max_workers=len(TESTS)) as executor:
+        futures = {test_name: executor.submit(test) for test_name, test in TESTS.items()}
+        for test_name, future in futures.items():
+            try:
+                test_results[test_name] = future.result()
+            except Exception as e:
+                logger.error("Unexpected error during %s test: %s", test_name, e, exc_info=True)
     
     # Report results
     logger.info("=== Test Results ===")
     all_passed = True
     for test_name, result in test_results.items():
         status = "PASSED" if result else "FAILED"
-        logger.info(f"{test_name}: {status}")
+        logger.info("%s: %s", test_name, status)
         if not result:
             all_passed = False
     
@@ -1,8 +1,9 @@
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, FrozenSet, Optional, List, Set, Tuple
 import re
 import logging
 import os
 import json
+import hashlib
 import openai
 from dotenv import load_dotenv
 
@@ -10,79 +11,195 @@ from dotenv import load_dotenv
 load_dotenv()
 openai_api_key = os.getenv('OPENAI_API_KEY')
 
+logger = logging.getLogger(__name__)
+
+# Model used for LLM text analysis; field extraction doesn't need a large model
+LLM_MODEL = "gpt-4o-mini"
+
+# Bump whenever the LLM prompt or response format changes, so cached results of the old one are not reused
+LLM_PROMPT_VERSION = 2
+
+# Maximum number of LLM results remembered per analyzer
+LLM_CACHE_SIZE = 4096
+
+# System prompt and the keys the model is asked to extract
+LLM_SYSTEM_PROMPT = "You are a specialized parser for Japanese trading card listings. Extract structured information from the given text and return it as a JSON object."
+LLM_RESULT_FIELDS = ('card_name_jp', 'card_name_en', 'set_name_jp', 'set_code', 'card_number', 'rarity_jp', 'rarity_en',
+                     'edition_jp', 'edition_en', 'language', 'condition_notes_from_description', 'seller_rank_from_description')
+LLM_RESULT_KEYS = ', '.join(f'"{field}"' for field in LLM_RESULT_FIELDS)
+LLM_KEY_INSTRUCTIONS = 'If information for a key is not present, use null or an empty string for its value. Focus on information explicitly stated or strongly implied. For "condition_notes_from_description", list all phrases related to condition. For "seller_rank_from_description", extract only the rank (e.g., "A", "S", "B+").'
+
+# Strict JSON schema for the LLM result, so the API always returns every key with the right
+# type instead of output that has to be discarded
+LLM_RESULT_PROPERTIES = {
+    field: {"type": "array", "items": {"type": "string"}} if field == 'condition_notes_from_description'
+    else {"type": ["string", "null"]}
+    for field in LLM_RESULT_FIELDS
+}
+LLM_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "card_listing",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": LLM_RESULT_PROPERTIES,
+            "required": list(LLM_RESULT_FIELDS),
+            "additionalProperties": False
+        }
+    }
+}
+
+# Result keys returned by _analyze_with_rules; each one still empty after the LLM pass is
+# filled from the rules (and raises the confidence), so when none are empty the rules are skipped
+RULE_FILLABLE_KEYS = ('card_name_jp', 'card_name_en', 'set_name_jp', 'set_code', 'card_number', 'rarity_jp',
+                      'rarity_en', 'edition_jp', 'edition_en', 'language', 'condition_notes_from_description',
+                      'seller_rank_from_description', 'confidence_score')
+
+# Confidence added by _calculate_confidence_score per rarity, edition and region; other
+# rarities and editions add nothing, other regions add DEFAULT_REGION_SCORE
+RARITY_SCORES = {
+    'ghost rare': 0.15, 'ultimate rare': 0.15, 'starlight rare': 0.15, 'quarter century': 0.15,
+    'secret rare': 0.1, 'collector\'s rare': 0.1, 'prismatic secret rare': 0.1,
+    'ultra rare': 0.08, 'gold rare': 0.08, 'platinum rare': 0.08,
+    'super rare': 0.05, 'parallel rare': 0.05,
+    'rare': 0.03
+}
+EDITION_SCORES = {'1st edition': 0.1}
+REGION_SCORES = {'japanese': 0.08, 'asia': 0.08}
+DEFAULT_REGION_SCORE = 0.05
+
+def _build_keyword_matcher(keyword_table: Dict[str, List[str]]) -> Tuple[re.Pattern, Dict[str, FrozenSet[str]]]:
+    """Compile a label -> keywords table into one overlapping-match regex plus a keyword -> labels map.
+
+    Keywords are tried longest first, so the keyword captured at a position is the longest one
+    there; any other keyword matching at that position is a prefix of it, so each keyword maps
+    to the labels of all its prefixes as well as its own.
+    """
+    keyword_labels = {}
+    for label, keywords in keyword_table.items():
+        for keyword in keywords:
+            keyword_labels.setdefault(keyword.lower(), set()).add(label)
+    labels_by_keyword = {
+        keyword: frozenset().union(*(labels for prefix, labels in keyword_labels.items() if keyword.startswith(prefix)))
+        for keyword in keyword_labels
+    }
+    pattern = re.compile('(?=(' + '|'.join(re.escape(keyword) for keyword in sorted(keyword_labels, key=len, reverse=True)) + '))')
+    return pattern, labels_by_keyword
+
+def _find_keyword_labels(matcher: Tuple[re.Pattern, Dict[str, FrozenSet[str]]], text: str) -> Set[str]:
+    """Return the labels of every keyword that occurs in the lowercased text, in one scan."""
+    pattern, labels_by_keyword = matcher
+    found = set()
+    for match in pattern.finditer(text):
+        found |= labels_by_keyword[match.group(1)]
+    return found
+
+# Card name patterns (both English and Japanese), compiled once
+CARD_NAME_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'Blue-Eyes White Dragon|青眼の白龍',
+    r'Dark Magician|ブラック・マジシャン',
+    r'Red-Eyes Black Dragon|レッドアイズ・ブラックドラゴン',
+    r'Exodia|エクゾディア',
+    r'Black Luster Soldier|カオス・ソルジャー',
+    r'Chaos Emperor Dragon|カオス・エンペラー・ドラゴン',
+    r'Cyber Dragon|サイバー・ドラゴン',
+    r'Elemental Hero|エレメンタル・ヒーロー',
+    r'Destiny Hero|デステニー・ヒーロー',
+    r'Neos|ネオス',
+    r'Stardust Dragon|スターダスト・ドラゴン',
+    r'Black Rose Dragon|ブラックローズ・ドラゴン',
+    r'Arcanite Magician|アーカナイト・マジシャン'
+]]
+
+# All card name patterns in one overlapping scan; group c<i> is pattern i, so the lowest
+# group found is the pattern the ordered per-pattern search would have returned
+CARD_NAME_RE = re.compile(
+    '(?=' + '|'.join(f'(?P<c{i}>{pattern.pattern})' for i, pattern in enumerate(CARD_NAME_PATTERNS)) + ')',
+    re.IGNORECASE
+)
+
+# Set code pattern (e.g., LOB-001, MRD-060)
+SET_CODE_RE = re.compile(r'([A-Z]{2,4})-(\d{3})')
+
+# Rarity keywords (both English and Japanese)
+RARITY_KEYWORDS = {
+    'common': ['common', 'コモン'],
+    'rare': ['rare', 'レア'],
+    'super rare': ['super rare', 'sr', 'スーパーレア'],
+    'ultra rare': ['ultra rare', 'ur', 'ウルトラレア'],
+    'secret rare': ['secret rare', 'scr', 'シークレットレア'],
+    'ultimate rare': ['ultimate rare', 'utr', 'アルティメットレア'],
+    'ghost rare': ['ghost rare', 'gr', 'ゴーストレア'],
+    'platinum rare': ['platinum rare', 'plr', 'プラチナレア'],
+    'gold rare': ['gold rare', 'gld', 'ゴールドレア'],
+    'parallel rare': ['parallel rare', 'pr', 'パラレルレア'],
+    'collector\'s rare': ['collector\'s rare', 'cr', 'コレクターズレア'],
+    'quarter century': ['quarter century', 'qc', 'クォーターセンチュリー']
+}
+
+# Edition keywords (both English and Japanese)
+EDITION_KEYWORDS = {
+    '1st edition': ['1st', 'first edition', '初版'],
+    'unlimited': ['unlimited', '無制限', '再版']
+}
+
+# Region keywords (both English and Japanese)
+REGION_KEYWORDS = {
+    'asia': ['asia', 'asian', 'アジア', 'アジア版'],
+    'english': ['english', '英', '英語版'],
+    'japanese': ['japanese', '日', '日本語版'],
+    'korean': ['korean', '韓', '韓国版']
+}
+
+# Condition keywords (both English and Japanese)
+CONDITION_KEYWORDS = {
+    'mint': ['mint', 'ミント', '未使用'],
+    'near mint': ['near mint', 'nm', 'ニアミント', '新品同様'],
+    'excellent': ['excellent', 'ex', 'エクセレント', '美品'],
+    'good': ['good', 'gd', 'グッド', '良品'],
+    'light played': ['light played', 'lp', 'ライトプレイ', '軽度使用'],
+    'played': ['played', 'pl', 'プレイ', '使用済み'],
+    'poor': ['poor', 'pr', 'プア', '傷あり']
+}
+
+# Special keywords that might indicate value
+VALUE_INDICATORS = [
+    'limited', '限定', 'promo', '特典', 'tournament', '大会',
+    'championship', 'チャンピオンシップ', 'event', 'イベント',
+    'sealed', '未開封', 'unopened', '初期', 'shoki', '旧アジア',
+    'kyuu-ajia', 'PSA', 'BGS', 'エラーカード', 'error card'
+]
+
+# Each keyword table scanned in one pass instead of one substring test per keyword
+_RARITY_MATCHER = _build_keyword_matcher(RARITY_KEYWORDS)
+_EDITION_MATCHER = _build_keyword_matcher(EDITION_KEYWORDS)
+_REGION_MATCHER = _build_keyword_matcher(REGION_KEYWORDS)
+_CONDITION_MATCHER = _build_keyword_matcher(CONDITION_KEYWORDS)
+_VALUE_INDICATOR_MATCHER = _build_keyword_matcher({indicator: [indicator] for indicator in VALUE_INDICATORS})
+
 class TextAnalyzer:
     def __init__(self):
         # Initialize OpenAI client
         self.client = openai.OpenAI(api_key=openai_api_key)
         
-        # Card name patterns (both English and Japanese)
-        self.card_name_patterns = [
-            r'Blue-Eyes White Dragon|青眼の白龍',
-            r'Dark Magician|ブラック・マジシャン',
-            r'Red-Eyes Black Dragon|レッドアイズ・ブラックドラゴン',
-            r'Exodia|エクゾディア',
-            r'Black Luster Soldier|カオス・ソルジャー',
-            r'Chaos Emperor Dragon|カオス・エンペラー・ドラゴン',
-            r'Cyber Dragon|サイバー・ドラゴン',
-            r'Elemental Hero|エレメンタル・ヒーロー',
-            r'Destiny Hero|デステニー・ヒーロー',
-            r'Neos|ネオス',
-            r'Stardust Dragon|スターダスト・ドラゴン',
-            r'Black Rose Dragon|ブラックローズ・ドラゴン',
-            r'Arcanite Magician|アーカナイト・マジシャン'
-        ]
-        
-        # Set code pattern (e.g., LOB-001, MRD-060)
-        self.set_code_pattern = r'([A-Z]{2,4})-(\d{3})'
-        
-        # Rarity keywords (both English and Japanese)
-        self.rarity_keywords = {
-            'common': ['common', 'コモン'],
-            'rare': ['rare', 'レア'],
-            'super rare': ['super rare', 'sr', 'スーパーレア'],
-            'ultra rare': ['ultra rare', 'ur', 'ウルトラレア'],
-            'secret rare': ['secret rare', 'scr', 'シークレットレア'],
-            'ultimate rare': ['ultimate rare', 'utr', 'アルティメットレア'],
-            'ghost rare': ['ghost rare', 'gr', 'ゴーストレア'],
-            'platinum rare': ['platinum rare', 'plr', 'プラチナレア'],
-            'gold rare': ['gold rare', 'gld', 'ゴールドレア'],
-            'parallel rare': ['parallel rare', 'pr', 'パラレルレア'],
-            'collector\'s rare': ['collector\'s rare', 'cr', 'コレクターズレア'],
-            'quarter century': ['quarter century', 'qc', 'クォーターセンチュリー']
-        }
-        
-        # Edition keywords (both English and Japanese)
-        self.edition_keywords = {
-            '1st edition': ['1st', 'first edition', '初版'],
-            'unlimited': ['unlimited', '無制限', '再版']
-        }
-        
-        # Region keywords (both English and Japanese)
-        self.region_keywords = {
-            'asia': ['asia', 'asian', 'アジア', 'アジア版'],
-            'english': ['english', '英', '英語版'],
-            'japanese': ['japanese', '日', '日本語版'],
-            'korean': ['korean', '韓', '韓国版']
-        }
-        
-        # Condition keywords (both English and Japanese)
-        self.condition_keywords = {
-            'mint': ['mint', 'ミント', '未使用'],
-            'near mint': ['near mint', 'nm', 'ニアミント', '新品同様'],
-            'excellent': ['excellent', 'ex', 'エクセレント', '美品'],
-            'good': ['good', 'gd', 'グッド', '良品'],
-            'light played': ['light played', 'lp', 'ライトプレイ', '軽度使用'],
-            'played': ['played', 'pl', 'プレイ', '使用済み'],
-            'poor': ['poor', 'pr', 'プア', '傷あり']
-        }
+        # Parsed LLM results by listing text, so repeated titles/descriptions skip the API call
+        self.llm_cache = {}
         
-        # Special keywords that might indicate value
-        self.value_indicators = [
-            'limited', '限定', 'promo', '特典', 'tournament', '大会',
-            'championship', 'チャンピオンシップ', 'event', 'イベント',
-            'sealed', '未開封', 'unopened', '初期', 'shoki', '旧アジア',
-            'kyuu-ajia', 'PSA', 'BGS', 'エラーカード', 'error card'
-        ]
+        # Keyword tables and patterns are shared module constants
+        self.card_name_patterns = CARD_NAME_PATTERNS
+        self.card_name_pattern = CARD_NAME_RE
+        self.set_code_pattern = SET_CODE_RE
+        self.rarity_keywords = RARITY_KEYWORDS
+        self.edition_keywords = EDITION_KEYWORDS
+        self.region_keywords = REGION_KEYWORDS
+        self.condition_keywords = CONDITION_KEYWORDS
+        self.value_indicators = VALUE_INDICATORS
+        self.rarity_matcher = _RARITY_MATCHER
+        self.edition_matcher = _EDITION_MATCHER
+        self.region_matcher = _REGION_MATCHER
+        self.condition_matcher = _CONDITION_MATCHER
+        self.value_indicator_matcher = _VALUE_INDICATOR_MATCHER
 
     def analyze_text(self, title: str, description: Optional[str] = None) -> Dict[str, Any]:
         """Analyze text to extract card information using both rule-based and LLM analysis."""
@@ -112,68 +229,122 @@ class TextAnalyzer:
                     results.update(llm_results)
                     results['confidence_score'] += 0.6  # LLM analysis provides strong confidence
             except Exception as e:
-                logging.error(f"LLM analysis failed: {str(e)}")
+                logger.error("LLM analysis failed: %s", e)
         
         # Fall back to rule-based analysis for any missing fields
-        rule_based_results = self._analyze_with_rules(title, description or '')
-        
-        # Update results with rule-based findings for any missing fields
-        for key, value in rule_based_results.items():
-            if not results.get(key):
-                results[key] = value
-                results['confidence_score'] += 0.2  # Rule-based analysis provides moderate confidence
+        if not all(results.get(key) for key in RULE_FILLABLE_KEYS):
+            rule_based_results = self._analyze_with_rules(title, description or '')
+            
+            # Update results with rule-based findings for any missing fields
+            for key, value in rule_based_results.items():
+                if not results.get(key):
+                    results[key] = value
+                    results['confidence_score'] += 0.2  # Rule-based analysis provides moderate confidence
         
         # Normalize confidence score
         results['confidence_score'] = min(results['confidence_score'], 1.0)
         
-        # Log the analysis results
-        logging.info("\nText Analysis Results:")
-        for key, value in results.items():
-            logging.info(f"{key}: {value}")
+        # Log the analysis results as one record, serialized only when DEBUG is enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Text analysis results: %s", json.dumps(results, ensure_ascii=False, default=str))
         
         return results
 
-    def _analyze_with_llm(self, title: str, description: str) -> Optional[Dict[str, Any]]:
-        """Analyze text using OpenAI's GPT model."""
-        try:
-            # Construct the prompt
-            prompt = f"""Given the following Japanese item title and description for a trading card:
+    @staticmethod
+    def _llm_cache_key(title: str, description: str) -> bytes:
+        """Cache key for a listing's LLM analysis under the current model and prompt."""
+        raw = f"{LLM_MODEL}\0{LLM_PROMPT_VERSION}\0{title}\0{description}".encode('utf-8')
+        return hashlib.sha256(raw).digest()
+
+    def _build_llm_messages(self, title: str, description: str) -> List[Dict[str, str]]:
+        """Build the chat messages for a listing's LLM analysis."""
+        # Construct the prompt
+        prompt = f"""Given the following Japanese item title and description for a trading card:
 Title: "{title}"
 Description: "{description}"
 
-Extract the following information into a structured JSON object with these exact keys: "card_name_jp", "card_name_en", "set_name_jp", "set_code", "card_number", "rarity_jp", "rarity_en", "edition_jp", "edition_en", "language", "condition_notes_from_description", "seller_rank_from_description".
-If information for a key is not present, use null or an empty string for its value. Focus on information explicitly stated or strongly implied. For "condition_notes_from_description", list all phrases related to condition. For "seller_rank_from_description", extract only the rank (e.g., "A", "S", "B+").
+Extract the following information into a structured JSON object with these exact keys: {LLM_RESULT_KEYS}.
+{LLM_KEY_INSTRUCTIONS}
 
 Return ONLY the JSON object, no other text."""
 
-            # Make the API call
-            response = self.client.chat.completions.create(
-                model="gpt-4-turbo-preview",  # Using the latest GPT-4 model
-                messages=[
-                    {"role": "system", "content": "You are a specialized parser for Japanese trading card listings. Extract structured information from the given text and return it as a JSON object."},
-                    {"role": "user", "content": prompt}
-                ],
+        return [
+            {"role": "system", "content": LLM_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ]
+
+    @staticmethod
+    def _add_llm_chunk(parts: List[str], chunk: Any) -> Optional[Dict[str, Any]]:
+        """Append a streamed chunk's text to parts, returning the JSON object once it is complete."""
+        if not chunk.choices:
+            return None
+        delta = chunk.choices[0].delta.content
+        if not delta:
+            return None
+        parts.append(delta)
+        # The object can only be complete once a closing brace arrives
+        if '}' in delta:
+            try:
+                return json.loads(''.join(parts))
+            except json.JSONDecodeError:
+                pass  # A nested or quoted brace; keep reading
+        return None
+
+    def _parse_llm_stream(self, parts: List[str]) -> Optional[Dict[str, Any]]:
+        """Parse the text of a stream that ended without a complete JSON object."""
+        try:
+            return json.loads(''.join(parts))
+        except json.JSONDecodeError as e:
+            logger.error("Failed to parse LLM response as JSON: %s", e)
+            return None
+
+    def _analyze_with_llm(self, title: str, description: str) -> Optional[Dict[str, Any]]:
+        """Analyze text using OpenAI's GPT model."""
+        cache_key = self._llm_cache_key(title, description)
+        cached = self.llm_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        try:
+            # Make the API call, streaming the response so it is parsed as soon as the object is complete
+            stream = self.client.chat.completions.create(
+                model=LLM_MODEL,
+                messages=self._build_llm_messages(title, description),
                 temperature=0.1,  # Low temperature for more consistent results
-                max_tokens=500
+                max_tokens=500,
+                response_format=LLM_RESPONSE_FORMAT,
+                stream=True
             )
             
-            # Extract and parse the JSON response
+            # Extract and parse the JSON response, closing the stream early once it is complete
+            parts: List[str] = []
+            parsed = None
             try:
-                json_str = response.choices[0].message.content.strip()
-                # Remove any markdown code block markers
-                json_str = re.sub(r'^```json\s*|\s*```$', '', json_str)
-                return json.loads(json_str)
-            except json.JSONDecodeError as e:
-                logging.error(f"Failed to parse LLM response as JSON: {str(e)}")
-                return None
+                for chunk in stream:
+                    parsed = self._add_llm_chunk(parts, chunk)
+                    if parsed is not None:
+                        break
+                else:
+                    parsed = self._parse_llm_stream(parts)
+            finally:
+                stream.close()
+            if parsed is not None:
+                self._store_llm_result(cache_key, parsed)
+            return parsed
             
         except Exception as e:
-            logging.error(f"Error in LLM analysis: {str(e)}")
+            logger.error("Error in LLM analysis: %s", e)
             return None
 
+    def _store_llm_result(self, cache_key: bytes, parsed: Dict[str, Any]) -> None:
+        """Cache an LLM result, evicting the oldest entry when full."""
+        if len(self.llm_cache) >= LLM_CACHE_SIZE:
+            self.llm_cache.pop(next(iter(self.llm_cache)), None)
+        self.llm_cache[cache_key] = parsed
+
     def _analyze_with_rules(self, title: str, description: str) -> Dict[str, Any]:
         """Analyze text using rule-based methods."""
-        # Combine title and description for analysis
+        # Combine title and description for analysis, lowercased once for every extractor
         full_text = f"{title} {description}".lower()
         
         # Extract card name
@@ -227,52 +398,46 @@ Return ONLY the JSON object, no other text."""
 
     def _extract_card_name(self, text: str) -> Optional[str]:
         """Extract card name from text."""
-        for pattern in self.card_name_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(0)
-        return None
+        best = None
+        for match in self.card_name_pattern.finditer(text):
+            index = int(match.lastgroup[1:])
+            if best is None or index < best[0]:
+                best = (index, match.group(match.lastgroup))
+                if index == 0:
+                    break
+        return best[1] if best else None
 
     def _extract_set_info(self, text: str) -> Tuple[Optional[str], Optional[str]]:
         """Extract set code and card number from text."""
-        match = re.search(self.set_code_pattern, text)
+        match = self.set_code_pattern.search(text)
         if match:
             return match.group(1), match.group(2)
         return None, None
 
     def _extract_rarity(self, text: str) -> Optional[str]:
-        """Extract rarity from text."""
-        for rarity, keywords in self.rarity_keywords.items():
-            if any(keyword.lower() in text.lower() for keyword in keywords):
-                return rarity
-        return None
+        """Extract rarity from lowercased text."""
+        found = _find_keyword_labels(self.rarity_matcher, text)
+        return next((rarity for rarity in self.rarity_keywords if rarity in found), None)
 
     def _extract_edition(self, text: str) -> Optional[str]:
-        """Extract edition from text."""
-        for edition, keywords in self.edition_keywords.items():
-            if any(keyword.lower() in text.lower() for keyword in keywords):
-                return edition
-        return None
+        """Extract edition from lowercased text."""
+        found = _find_keyword_labels(self.edition_matcher, text)
+        return next((edition for edition in self.edition_keywords if edition in found), None)
 
     def _extract_region(self, text: str) -> Optional[str]:
-        """Extract region from text."""
-        for region, keywords in self.region_keywords.items():
-            if any(keyword.lower() in text.lower() for keyword in keywords):
-                return region
-        return None
+        """Extract region from lowercased text."""
+        found = _find_keyword_labels(self.region_matcher, text)
+        return next((region for region in self.region_keywords if region in found), None)
 
     def _extract_condition_keywords(self, text: str) -> List[str]:
-        """Extract condition keywords from text."""
-        found_keywords = []
-        for condition, keywords in self.condition_keywords.items():
-            if any(keyword.lower() in text.lower() for keyword in keywords):
-                found_keywords.append(condition)
-        return found_keywords
+        """Extract condition keywords from lowercased text."""
+        found = _find_keyword_labels(self.condition_matcher, text)
+        return [condition for condition in self.condition_keywords if condition in found]
 
     def _extract_value_indicators(self, text: str) -> List[str]:
-        """Extract value indicators from text."""
-        return [indicator for indicator in self.value_indicators 
-                if indicator.lower() in text.lower()]
+        """Extract value indicators from lowercased text."""
+        found = _find_keyword_labels(self.value_indicator_matcher, text)
+        return [indicator for indicator in self.value_indicators if indicator in found]
 
     def _calculate_confidence_score(self,
                                   card_name: Optional[str],
@@ -296,27 +461,14 @@ Return ONLY the JSON object, no other text."""
         
         # Rarity score
         if rarity:
-            if rarity.lower() in ['ghost rare', 'ultimate rare', 'starlight rare', 'quarter century']:
-                score += 0.15
-            elif rarity.lower() in ['secret rare', 'collector\'s rare', 'prismatic secret rare']:
-                score += 0.1
-            elif rarity.lower() in ['ultra rare', 'gold rare', 'platinum rare']:
-                score += 0.08
-            elif rarity.lower() in ['super rare', 'parallel rare']:
-                score += 0.05
-            elif rarity.lower() == 'rare':
-                score += 0.03
+            score += RARITY_SCORES.get(rarity.lower(), 0.0)
         
         # Edition score
-        if edition == '1st edition':
-            score += 0.1
+        score += EDITION_SCORES.get(edition, 0.0)
         
         # Region score
         if region:
-            if region.lower() in ['japanese', 'asia']:
-                score += 0.08
-            else:
-                score += 0.05
+            score += REGION_SCORES.get(region.lower(), DEFAULT_REGION_SCORE)
         
         # Condition keywords score
         if len(condition_keywords) >= 2: